@@ -1,39 +1,24 @@
 # script/init_db.py
 
+import os
+import shutil
 import sys
 import sqlite3
 from pathlib import Path
 import csv
+import hashlib
 from datetime import datetime
+from typing import Optional
 
-# ---- Cvoca 설계 상수 (불변) ----
-MAX_SENSES_PER_WORD    = 10  # 기존 MAX_MEAN_BY_WORD
-MAX_EXAMPLES_PER_SENSE = 10  # 기존 MAX_USE_BY_DEF
+# Cvoca 설계 상수와 ID 계산식은 script/id_codec.py 하나에만 둔다
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from id_codec import MAX_SENSES_PER_WORD, MAX_EXAMPLES_PER_SENSE, register_sqlite_functions
 
-
-# ---- ID 계산 함수 ----
-def calc_word_id(day_no: int, word_no: int, max_word_num: int) -> int:
-    """
-    전역 word_id 계산:
-    word_id = (day_no - 1) * MAX_WORDS_PER_DAY + word_no
-    """
-    return (day_no - 1) * max_word_num + word_no
-
-
-def calc_definition_id(word_id: int, sense_no: int) -> int:
-    """
-    전역 definition_id 계산:
-    definition_id = word_id * MAX_SENSES_PER_WORD + sense_no
-    """
-    return word_id * MAX_SENSES_PER_WORD + sense_no
-
-
-def calc_example_id(definition_id: int, example_no: int) -> int:
-    """
-    전역 example_id 계산:
-    example_id = definition_id * MAX_EXAMPLES_PER_SENSE + example_no
-    """
-    return definition_id * MAX_EXAMPLES_PER_SENSE + example_no
+# ---- 스켈레톤 DB 캐시 ----
+# 캐시 디렉토리 (환경 변수 INIT_DB_CACHE_DIR로 변경 가능)
+DEFAULT_SKELETON_CACHE_DIR = Path("data") / ".skeleton_cache"
+# 캐시 키에 내용 해시를 넣는 소스 파일 (스키마나 Temp* 초기 데이터 규칙이 바뀌면 기존 캐시를 쓰지 않음)
+SKELETON_SOURCES = [Path(__file__).resolve(), Path(__file__).resolve().parent.parent / "id_codec.py"]
 
 
 # ---- DB 초기 스키마 + books 메타 정보 ----
@@ -86,7 +71,15 @@ def init_db(db_path: Path, basebook: str, max_days: int, max_words: int) -> sqli
     );
     """)
 
-    # books 테이블 1행 upsert (재실행 시에도 갱신되도록)
+    upsert_book_meta(conn, basebook, max_days, max_words)
+    return conn
+
+
+def upsert_book_meta(conn: sqlite3.Connection, basebook: str, max_days: int, max_words: int) -> None:
+    """
+    books 테이블 1행 upsert (재실행 시에도 갱신되도록)
+    """
+    cur = conn.cursor()
     created_at = datetime.utcnow().isoformat(timespec="seconds")
     cur.execute("""
         INSERT INTO books (
@@ -116,7 +109,6 @@ def init_db(db_path: Path, basebook: str, max_days: int, max_words: int) -> sqli
     ))
 
     conn.commit()
-    return conn
 
 
 # ---- 초기 데이터 생성 ----
@@ -128,6 +120,7 @@ def populate_initial_data(conn: sqlite3.Connection, max_days: int, max_words: in
     - 이미 words에 데이터가 있으면 RuntimeError 발생시켜 재초기화를 막는다.
     """
     cur = conn.cursor()
+    register_sqlite_functions(conn)
 
     # 이미 초기화된 DB인지 검사
     row = cur.execute("SELECT COUNT(*) FROM words").fetchone()
@@ -141,46 +134,53 @@ def populate_initial_data(conn: sqlite3.Connection, max_days: int, max_words: in
     # 트랜잭션 명시적으로 시작
     cur.execute("BEGIN")
 
+    # 행마다 INSERT를 실행하지 않고 테이블마다 INSERT ... SELECT 한 번으로 생성한다
+    # (ID는 id_codec의 encode_* 함수를 SQL 함수로 등록하여 계산).
+    # 키 순서대로 넣으므로 B-트리에 항상 끝에 추가되어 슬롯 수에 비례하는 시간에 끝난다.
     try:
-        # 1) words 테이블 초기화
-        for day_no in range(1, max_days + 1):
-            for word_no in range(1, max_words + 1):
-                word_id = calc_word_id(day_no, word_no, max_words)
-                temp_word = f"TempWord_{word_id}"
-                cur.execute(
-                    "INSERT INTO words (word_id, day_no, word_no, word) "
-                    "VALUES (?, ?, ?, ?)",
-                    (word_id, day_no, word_no, temp_word)
+        # 1) words 테이블 초기화: day_no x word_no 격자를 재귀 CTE로 생성
+        #    (CROSS JOIN은 조인 순서를 고정하여 day_no, word_no 순서로 삽입)
+        cur.execute(
+            """
+            WITH RECURSIVE
+                days(day_no) AS (
+                    SELECT 1 UNION ALL SELECT day_no + 1 FROM days WHERE day_no < :max_days
+                ),
+                word_nos(word_no) AS (
+                    SELECT 1 UNION ALL SELECT word_no + 1 FROM word_nos WHERE word_no < :max_words
+                ),
+                slots(word_id, day_no, word_no) AS (
+                    SELECT encode_word_id(day_no, word_no, :max_words), day_no, word_no
+                    FROM days CROSS JOIN word_nos
                 )
+            INSERT INTO words (word_id, day_no, word_no, word)
+            SELECT word_id, day_no, word_no, 'TempWord_' || word_id
+            FROM slots
+            """,
+            {"max_days": max_days, "max_words": max_words}
+        )
 
         # 2) definitions 테이블 초기 기본 행: sense_no=0만 생성
         #    (총 개수 = max_days * max_words)
-        for day_no in range(1, max_days + 1):
-            for word_no in range(1, max_words + 1):
-                word_id = calc_word_id(day_no, word_no, max_words)
-                sense_no = 0
-                definition_id = calc_definition_id(word_id, sense_no)
-                temp_def = f"TempDefinition_{definition_id}"
-                cur.execute(
-                    "INSERT INTO definitions (definition_id, word_id, sense_no, definition, part_of_speech) "
-                    "VALUES (?, ?, ?, ?, ?)",
-                    (definition_id, word_id, sense_no, temp_def, None)
-                )
+        cur.execute(
+            """
+            INSERT INTO definitions (definition_id, word_id, sense_no, definition, part_of_speech)
+            SELECT encode_definition_id(word_id, 0), word_id, 0, 'TempDefinition_' || encode_definition_id(word_id, 0), NULL
+            FROM words
+            ORDER BY word_id
+            """
+        )
 
         # 3) examples 테이블 초기 기본 행: example_no=0만 생성
-        for day_no in range(1, max_days + 1):
-            for word_no in range(1, max_words + 1):
-                word_id = calc_word_id(day_no, word_no, max_words)
-                sense_no = 0
-                definition_id = calc_definition_id(word_id, sense_no)
-                example_no = 0
-                example_id = calc_example_id(definition_id, example_no)
-                temp_ex = f"TempExample_{example_id}"
-                cur.execute(
-                    "INSERT INTO examples (example_id, definition_id, example_no, example_sentence) "
-                    "VALUES (?, ?, ?, ?)",
-                    (example_id, definition_id, example_no, temp_ex)
-                )
+        cur.execute(
+            """
+            INSERT INTO examples (example_id, definition_id, example_no, example_sentence)
+            SELECT encode_example_id(definition_id, 0), definition_id, 0, 'TempExample_' || encode_example_id(definition_id, 0)
+            FROM definitions
+            WHERE sense_no = 0
+            ORDER BY definition_id
+            """
+        )
 
     except Exception:
         conn.rollback()
@@ -190,10 +190,16 @@ def populate_initial_data(conn: sqlite3.Connection, max_days: int, max_words: in
 
 
 # ---- CSV export ----
-def export_to_csv(conn: sqlite3.Connection, base_dir: Path) -> None:
+# 책과 무관한 테이블 CSV (book_meta.csv를 제외한 나머지는 같은 (max_days, max_words)면 내용이 같음)
+TABLE_CSV_FILES = ["words.csv", "definitions.csv", "examples.csv"]
+
+
+def export_to_csv(conn: sqlite3.Connection, base_dir: Path, skeleton_dir: Optional[Path] = None) -> None:
     """
     words / definitions / examples 테이블과 books 메타를
     CSV 형태로 내보내고, user/ 하위에 작업용 복사본을 생성한다.
+
+    - skeleton_dir가 있으면 테이블 CSV는 스켈레톤 캐시에 내보내 둔 파일을 복사한다.
     """
     base_dir.mkdir(parents=True, exist_ok=True)
     user_dir = base_dir / "user"
@@ -221,6 +227,24 @@ def export_to_csv(conn: sqlite3.Connection, base_dir: Path) -> None:
         ])
         writer.writerows(rows)
 
+    if skeleton_dir is not None:
+        for name in TABLE_CSV_FILES:
+            shutil.copyfile(skeleton_dir / name, base_dir / name)
+            shutil.copyfile(skeleton_dir / "user" / name, user_dir / name)
+        return
+
+    export_table_csvs(conn, base_dir)
+
+
+def export_table_csvs(conn: sqlite3.Connection, base_dir: Path) -> None:
+    """
+    words / definitions / examples 테이블을 CSV로 내보내고 user/ 하위에 작업용 복사본을 생성한다.
+    """
+    user_dir = base_dir / "user"
+    user_dir.mkdir(parents=True, exist_ok=True)
+
+    cur = conn.cursor()
+
     # 1) words
     rows = cur.execute(
         "SELECT word_id, day_no, word_no, word FROM words"
@@ -258,15 +282,122 @@ def export_to_csv(conn: sqlite3.Connection, base_dir: Path) -> None:
     (user_dir / "examples.csv").write_text(ex_csv.read_text(encoding="utf-8"), encoding="utf-8")
 
 
+# ---- 스켈레톤 DB 캐시 ----
+def get_skeleton_cache_dir() -> Path:
+    """
+    스켈레톤 캐시 디렉토리 (환경 변수 INIT_DB_CACHE_DIR이 있으면 그 경로)
+    """
+    return Path(os.environ.get("INIT_DB_CACHE_DIR", DEFAULT_SKELETON_CACHE_DIR))
+
+
+def get_skeleton_source_hash() -> str:
+    """
+    스켈레톤을 만드는 소스 파일(SKELETON_SOURCES) 내용의 해시 (앞 16자리)
+    """
+    digest = hashlib.sha256()
+    for path in SKELETON_SOURCES:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def get_skeleton_dir(cache_dir: Path, max_days: int, max_words: int) -> Path:
+    """
+    캐시 키 (소스 해시, max_days, max_words, MAX_SENSES_PER_WORD, MAX_EXAMPLES_PER_SENSE)에 해당하는 스켈레톤 디렉토리
+    (skeleton.db와 테이블 CSV, user/ 복사본이 들어 있음)
+    """
+    return cache_dir / (
+        f"skeleton_{get_skeleton_source_hash()}_{max_days}_{max_words}_"
+        f"{MAX_SENSES_PER_WORD}_{MAX_EXAMPLES_PER_SENSE}"
+    )
+
+
+def build_skeleton(skeleton_dir: Path, max_days: int, max_words: int) -> None:
+    """
+    스키마와 Temp* 초기 데이터만 있는 스켈레톤 DB와 그 테이블 CSV를 만들어 캐시에 넣는다.
+    임시 디렉토리에 만든 뒤 이름을 바꾸므로 동시에 실행되어도 반쯤 만들어진 스켈레톤을 읽지 않는다.
+    """
+    skeleton_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = skeleton_dir.with_name(f".{skeleton_dir.name}.tmp-{os.getpid()}")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir()
+
+    try:
+        # books 행은 책마다 덮어쓰므로 이름은 비워 둔다
+        conn = init_db(tmp_dir / "skeleton.db", "", max_days, max_words)
+        try:
+            populate_initial_data(conn, max_days, max_words)
+            export_table_csvs(conn, tmp_dir)
+        finally:
+            conn.close()
+        try:
+            os.rename(tmp_dir, skeleton_dir)
+        except OSError:
+            # 다른 프로세스가 먼저 같은 스켈레톤을 넣은 경우 그것을 사용
+            if not skeleton_dir.exists():
+                raise
+            shutil.rmtree(tmp_dir)
+    except BaseException:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        raise
+
+
+def init_db_from_skeleton(db_path: Path, basebook: str, max_days: int, max_words: int,
+                          skeleton_dir: Path) -> sqlite3.Connection:
+    """
+    캐시된 스켈레톤 DB를 SQLite 온라인 백업 API로 db_path에 복사하고 books 행만 갱신한다.
+    (스켈레톤이 없으면 먼저 만들어 캐시에 넣음)
+    init_db + populate_initial_data와 같은 내용의 DB를 반환한다.
+
+    - db_path는 아직 없는 파일이어야 한다 (백업은 대상 DB를 통째로 덮어씀).
+    """
+    if not skeleton_dir.exists():
+        build_skeleton(skeleton_dir, max_days, max_words)
+
+    source = sqlite3.connect(skeleton_dir / "skeleton.db")
+    conn = sqlite3.connect(db_path)
+    try:
+        source.backup(conn)
+    except BaseException:
+        conn.close()
+        db_path.unlink()
+        raise
+    finally:
+        source.close()
+
+    # SQLite에서 FK 제약 활성화
+    conn.execute("PRAGMA foreign_keys = ON;")
+    upsert_book_meta(conn, basebook, max_days, max_words)
+    return conn
+
+
 # ---- main ----
 def main() -> None:
-    if len(sys.argv) != 4:
-        print("Usage: python script/init_db.py <BASEBOOK_NAME> <MAX_DAYS_NUM> <MAX_WORD_NUM>")
+    # 옵션 파싱
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    if not use_cache:
+        args.remove("--no-cache")
+    cache_dir = get_skeleton_cache_dir()
+    if "--cache-dir" in args:
+        index = args.index("--cache-dir")
+        if index + 1 >= len(args):
+            print("Error: --cache-dir requires a directory")
+            sys.exit(1)
+        cache_dir = Path(args[index + 1])
+        del args[index:index + 2]
+
+    if len(args) != 3:
+        print("Usage: python script/init_db.py <BASEBOOK_NAME> <MAX_DAYS_NUM> <MAX_WORD_NUM> [--no-cache] [--cache-dir DIR]")
+        print("  --no-cache: 스켈레톤 DB 캐시를 쓰지 않고 스키마와 Temp* 초기 데이터를 새로 생성")
+        print(f"  --cache-dir: 스켈레톤 DB 캐시 디렉토리 (기본값: {DEFAULT_SKELETON_CACHE_DIR}, 환경 변수 INIT_DB_CACHE_DIR)")
         sys.exit(1)
 
-    basebook = sys.argv[1]
-    max_days = int(sys.argv[2])
-    max_words = int(sys.argv[3])
+    basebook = args[0]
+    max_days = int(args[1])
+    max_words = int(args[2])
 
     book_id = f"{basebook}_{max_days}_{max_words}"
     data_dir = Path("data")
@@ -275,9 +406,16 @@ def main() -> None:
 
     data_dir.mkdir(exist_ok=True)
 
-    conn = init_db(db_path, basebook, max_days, max_words)
-    populate_initial_data(conn, max_days, max_words)
-    export_to_csv(conn, book_dir)
+    if use_cache and not db_path.exists():
+        # 같은 (max_days, max_words) 스켈레톤의 DB와 테이블 CSV를 복사하고 books 행만 갱신
+        skeleton_dir = get_skeleton_dir(cache_dir, max_days, max_words)
+        conn = init_db_from_skeleton(db_path, basebook, max_days, max_words, skeleton_dir)
+        export_to_csv(conn, book_dir, skeleton_dir)
+    else:
+        # 기존 DB가 있으면 populate_initial_data가 재초기화를 막는다
+        conn = init_db(db_path, basebook, max_days, max_words)
+        populate_initial_data(conn, max_days, max_words)
+        export_to_csv(conn, book_dir)
     conn.close()
 
 
@@ -240,8 +240,9 @@ def add_constraints_to_database(db_file, add_foreign_keys=False):
     print(f"제약 조건 추가: {db_file}")
     print("=" * 80)
     
-    # 테이블 목록
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+    # 테이블 목록 (SQLite 내부 테이블과 도구가 만든 '_' 테이블(_import_row_hashes 등) 제외)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' "
+                   "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '\\_%' ESCAPE '\\' ORDER BY name")
     tables = [row[0] for row in cursor.fetchall()]
     
     if not tables:
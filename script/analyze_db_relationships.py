@@ -24,8 +24,9 @@ def analyze_relationships(db_file):
     print(f"데이터베이스 관계 분석: {db_file}")
     print("=" * 80)
     
-    # 테이블 목록
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+    # 테이블 목록 (SQLite 내부 테이블과 도구가 만든 '_' 테이블(_import_row_hashes 등) 제외)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' "
+                   "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '\\_%' ESCAPE '\\' ORDER BY name")
     tables = [row[0] for row in cursor.fetchall()]
     
     print(f"\n테이블: {', '.join(tables)}\n")
@@ -4,15 +4,25 @@
 CSV 파일들로부터 새로운 SQLite 데이터베이스를 생성하는 스크립트
 각 CSV 파일은 하나의 테이블이 됩니다.
 CSV 파일명이 테이블명이 됩니다 (확장자 제외).
+컬럼 타입은 모든 값을 보고 정합니다 (INTEGER -> REAL -> TEXT로 넓힘).
 
-사용법: python script/create_db_from_csv.py <output_db> <csv_file1> [csv_file2] [csv_file3] ...
+사용법: python script/create_db_from_csv.py <output_db> <csv_file1> [csv_file2] [csv_file3] ... [--overwrite] [--bulk] [--workers N]
 예시: python script/create_db_from_csv.py vocabulary.db Vocabulary.csv Meaning.csv Example.csv
 """
 
 import csv
+import itertools
+import multiprocessing
+import queue
 import sqlite3
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+from db_publish import discard_build, publish_build, start_build
+
+# 한 번에 executemany로 삽입하는 행 수
+BATCH_SIZE = 10000
 
 
 def get_table_name_from_csv(csv_file):
@@ -30,59 +40,305 @@ def get_table_name_from_csv(csv_file):
     return table_name
 
 
-def infer_column_type(column_name, sample_values):
+def get_initial_column_type(column_name):
     """
-    컬럼명과 샘플 값들을 기반으로 데이터 타입 추론
+    값을 읽기 전의 컬럼 타입
+    Id로 끝나는 컬럼은 INTEGER에서 시작하고, 나머지는 첫 값을 보고 정함 (None)
     
     Args:
         column_name: 컬럼명
-        sample_values: 샘플 값 리스트
         
     Returns:
-        SQLite 데이터 타입 (INTEGER, TEXT, REAL 등)
+        'INTEGER' 또는 None
     """
     # Id로 끝나는 컬럼은 INTEGER로 추정
     if column_name.lower().endswith('id'):
         return 'INTEGER'
+    return None
+
+
+def widen_column_type(col_type, value):
+    """
+    값을 담을 수 있는 가장 좁은 타입으로 컬럼 타입을 넓힘 (None -> INTEGER -> REAL -> TEXT)
     
-    # 샘플 값들 확인
-    integer_count = 0
-    real_count = 0
-    
-    for value in sample_values:
-        if value is None or value.strip() == '':
-            continue
+    Args:
+        col_type: 현재 컬럼 타입 (None이면 아직 값이 없음)
+        value: 앞뒤 공백을 제거한 비어있지 않은 값
+        
+    Returns:
+        SQLite 데이터 타입 (INTEGER, REAL, TEXT)
+    """
+    if col_type in [None, 'INTEGER']:
         try:
-            int(value.strip())
-            integer_count += 1
+            int(value)
+            return 'INTEGER'
         except ValueError:
-            try:
-                float(value.strip())
-                real_count += 1
-            except ValueError:
-                pass
+            pass
+    if col_type in [None, 'INTEGER', 'REAL']:
+        try:
+            float(value)
+            return 'REAL'
+        except ValueError:
+            pass
+    return 'TEXT'
+
+
+def make_row_converter(column_types):
+    """
+    CSV 행(리스트)을 컬럼 타입에 맞는 삽입 값 튜플로 바꾸는 함수 생성
+    빈 문자열은 None, 행의 컬럼 수가 모자라면 None으로 채움
+    현재 타입으로 변환할 수 없는 값이 나오면 그 컬럼의 타입을 넓힌 뒤 변환한다.
     
-    # 모든 값이 정수면 INTEGER
-    if integer_count > 0 and integer_count == len([v for v in sample_values if v and v.strip()]):
-        return 'INTEGER'
+    Args:
+        column_types: 컬럼 순서대로의 타입 리스트 (타입을 넓히면 이 리스트를 바로 수정)
+    
+    Returns:
+        변환 함수 (row -> tuple)
+    """
+    converters = {'INTEGER': int, 'REAL': float, 'TEXT': str}
+    width = len(column_types)
     
-    # 일부가 실수면 REAL
-    if real_count > 0:
-        return 'REAL'
+    def convert_row(row):
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+        values = []
+        for i in range(width):
+            value = row[i].strip()
+            if not value:
+                values.append(None)
+                continue
+            col_type = column_types[i]
+            if col_type is not None:
+                try:
+                    values.append(converters[col_type](value))
+                    continue
+                except ValueError:
+                    pass
+            col_type = widen_column_type(col_type, value)
+            column_types[i] = col_type
+            values.append(converters[col_type](value))
+        return tuple(values)
     
-    # 기본값은 TEXT
-    return 'TEXT'
+    return convert_row
+
+
+def iter_typed_batches(csv_file):
+    """
+    CSV 파일을 한 번 읽으며 컬럼 타입을 추론하고 값을 변환
+    처음에 컬럼명 리스트(컬럼이 없으면 None)를 생성하고, 그 뒤로 (컬럼 타입 리스트, 변환된 행 리스트)를
+    BATCH_SIZE 행씩 생성한다. 컬럼 타입은 그 묶음까지 읽은 값으로 넓힌 타입이며,
+    마지막 묶음은 행이 없을 수도 있다 (행이 없는 파일도 테이블을 만들 수 있도록).
+    
+    Args:
+        csv_file: CSV 파일 경로
+    """
+    with open(csv_file, 'r', encoding='utf-8') as infile:
+        reader = csv.reader(infile)
+        csv_columns = next(reader, None)
+        yield csv_columns or None
+        if not csv_columns:
+            return
+        
+        column_types = [get_initial_column_type(col) for col in csv_columns]
+        convert_row = make_row_converter(column_types)
+        batch_types = list(column_types)
+        raw_rows = []
+        batch = []
+        for row in reader:
+            if not row:
+                continue
+            raw_rows.append(row)
+            batch.append(convert_row(row))
+            if len(batch) >= BATCH_SIZE:
+                yield list(column_types), finalize_batch(raw_rows, batch, batch_types, column_types)
+                batch_types = list(column_types)
+                raw_rows = []
+                batch = []
+        yield list(column_types), finalize_batch(raw_rows, batch, batch_types, column_types)
+
+
+def finalize_batch(raw_rows, batch, batch_types, column_types):
+    """
+    묶음을 읽는 동안 컬럼 타입이 넓어졌으면, 넓어지기 전에 변환한 행도 원래 문자열에서 최종 타입으로 다시 변환
+    (예: 앞 행의 '007'이 7로 변환된 뒤 컬럼이 TEXT가 되면 '007'로 되돌림)
+    
+    Args:
+        raw_rows: 묶음의 CSV 행 리스트
+        batch: 변환된 행 리스트
+        batch_types: 묶음을 읽기 시작할 때의 컬럼 타입 리스트
+        column_types: 묶음을 다 읽은 뒤의 컬럼 타입 리스트
+    
+    Returns:
+        최종 타입으로 변환된 행 리스트
+    """
+    # 값이 없던 컬럼(None)에 타입이 정해진 것은 앞 행에 영향이 없음
+    if all(old is None or old == new for old, new in zip(batch_types, column_types)):
+        return batch
+    convert_row = make_row_converter(list(column_types))
+    return [convert_row(row) for row in raw_rows]
+
+
+def iter_converted_rows(csv_file, column_types, row_count):
+    """
+    CSV 파일의 처음 row_count개 데이터 행을 주어진 컬럼 타입으로 다시 변환 (빈 줄은 iter_typed_batches와 같이 건너뜀)
+    """
+    with open(csv_file, 'r', encoding='utf-8') as infile:
+        reader = csv.reader(infile)
+        next(reader, None)
+        convert_row = make_row_converter(list(column_types))
+        for row in itertools.islice((row for row in reader if row), row_count):
+            yield convert_row(row)
+
+
+def get_primary_key(table_name, csv_columns):
+    """
+    Primary Key 자동 감지
+    규칙: 파일명(테이블명)에서 끝의 's'를 제거하고 'Id'를 추가
+    예: Words -> word_id, Examples -> example_id, Definitions -> definition_id
+    
+    Returns:
+        Primary Key 컬럼명 (없으면 None)
+    """
+    # 테이블명에서 끝의 's' 제거 후 'Id' 추가
+    if table_name.endswith('s'):
+        singular_name = table_name[:-1]  # 끝의 's' 제거
+        expected_pk = f"{singular_name}Id"
+    else:
+        expected_pk = f"{table_name}Id"
+    
+    # 예상된 Primary Key 컬럼이 존재하는지 확인
+    if expected_pk in csv_columns:
+        return expected_pk
+    # 없으면 Id로 끝나는 컬럼 중 가장 짧은 것 선택
+    id_columns = [col for col in csv_columns if col.endswith('Id')]
+    if id_columns:
+        return min(id_columns, key=len)
+    return None
+
+
+def get_create_table_sql(table_name, csv_columns, column_types, primary_key):
+    """
+    CREATE TABLE SQL 생성 (값이 하나도 없는 컬럼은 TEXT)
+    """
+    column_defs = []
+    for col, col_type in zip(csv_columns, column_types):
+        col_def = f'"{col}" {col_type or "TEXT"}'
+        if col == primary_key:
+            col_def += " PRIMARY KEY"
+        column_defs.append(col_def)
+    return f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(column_defs)})"
+
+
+def rebuild_table_with_types(cursor, state, column_types):
+    """
+    이미 행이 들어간 테이블의 컬럼 타입을 바꿈 (SQLite는 컬럼 타입 변경을 지원하지 않으므로 새 타입으로 테이블을 다시 만듦)
+    이미 넣은 값은 CAST하지 않고 CSV 파일의 그 행들을 다시 읽어 새 타입으로 변환하므로,
+    TEXT로 넓어진 컬럼도 원래 문자열이 그대로 들어간다 (예: '007'이 7이 아닌 '007').
+    
+    Args:
+        cursor: 데이터베이스 커서
+        state: start_table이 만든 적재 상태
+        column_types: 바꿀 타입 리스트
+    """
+    table_name = state['table_name']
+    csv_columns = state['csv_columns']
+    for col, declared_type, col_type in zip(csv_columns, state['declared_types'], column_types):
+        if (col_type or 'TEXT') != (declared_type or 'TEXT'):
+            state['log'](f"  컬럼 타입 변경: {col} {declared_type or 'TEXT'} -> {col_type}")
+    
+    cursor.execute(f"DROP TABLE {table_name}")
+    cursor.execute(get_create_table_sql(table_name, csv_columns, column_types, state['primary_key']))
+    rows = iter_converted_rows(state['csv_file'], column_types, state['inserted_count'])
+    while True:
+        batch = list(itertools.islice(rows, BATCH_SIZE))
+        if not batch:
+            break
+        cursor.executemany(state['insert_sql'], batch)
+
+
+def start_table(table_name, csv_file, csv_columns, log=print):
+    """
+    테이블 적재 상태 생성 (테이블은 첫 묶음을 받을 때 그 묶음까지의 컬럼 타입으로 생성)
+    
+    Args:
+        table_name: 생성할 테이블명
+        csv_file: CSV 파일 경로 (컬럼 타입이 넓어지면 이미 넣은 행을 다시 읽음)
+        csv_columns: 컬럼명 리스트
+        log: 진행 메시지 출력 함수
+    
+    Returns:
+        적재 상태 딕셔너리 (write_batch, finish_table에 전달)
+    """
+    log(f"  컬럼: {', '.join(csv_columns)}")
+    placeholders = ','.join(['?' for _ in csv_columns])
+    columns_str = ','.join([f'"{col}"' for col in csv_columns])
+    return {
+        'table_name': table_name,
+        'csv_file': csv_file,
+        'csv_columns': csv_columns,
+        'primary_key': get_primary_key(table_name, csv_columns),
+        'insert_sql': f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})",
+        'declared_types': None,
+        'inserted_count': 0,
+        'log': log,
+    }
+
+
+def write_batch(cursor, state, column_types, rows):
+    """
+    변환된 행 묶음을 테이블에 삽입
+    첫 묶음이면 테이블을 만들고, 이전 묶음보다 컬럼 타입이 넓어졌으면 삽입 전에 새 타입으로 테이블을 다시 만든다.
+    """
+    table_name = state['table_name']
+    log = state['log']
+    if state['declared_types'] is None:
+        # 테이블 생성
+        cursor.execute(get_create_table_sql(table_name, state['csv_columns'], column_types, state['primary_key']))
+        if state['primary_key']:
+            log(f"  테이블 생성 완료 (Primary Key: {state['primary_key']})")
+        else:
+            log(f"  테이블 생성 완료 (Primary Key 없음)")
+        state['declared_types'] = column_types
+    elif [t or 'TEXT' for t in column_types] != [t or 'TEXT' for t in state['declared_types']]:
+        # 이미 넣은 행이 있는 컬럼의 타입이 넓어짐 (값이 없던 컬럼은 TEXT로 선언되어 있으므로 TEXT가 되는 것은 변경 아님)
+        rebuild_table_with_types(cursor, state, column_types)
+        state['declared_types'] = column_types
+    else:
+        state['declared_types'] = column_types
+    
+    if rows:
+        cursor.executemany(state['insert_sql'], rows)
+        state['inserted_count'] += len(rows)
+
+
+def finish_table(cursor, state):
+    """
+    테이블 적재 마무리
+    
+    Returns:
+        삽입된 행 수
+    """
+    table_name = state['table_name']
+    log = state['log']
+    log(f"  데이터 삽입 완료: {state['inserted_count']}개 행")
+    type_list = [f"{col} {col_type or 'TEXT'}" for col, col_type in zip(state['csv_columns'], state['declared_types'])]
+    log(f"  컬럼 타입: {', '.join(type_list)}")
+    
+    return state['inserted_count']
 
 
 def create_table_from_csv(cursor, csv_file, table_name):
     """
     CSV 파일을 읽어서 테이블을 생성하고 데이터를 삽입
+    컬럼 타입은 데이터를 넣는 한 번의 읽기에서 모든 값을 보고 정한다 (INTEGER -> REAL -> TEXT로 넓힘).
+    첫 BATCH_SIZE 행으로 타입을 정해 테이블을 만들고, 그 뒤에 타입이 넓어지면 이미 넣은 행을 CSV에서 다시 읽어
+    새 타입으로 테이블을 다시 만든다.
     
     Args:
         cursor: 데이터베이스 커서
         csv_file: CSV 파일 경로
         table_name: 생성할 테이블명
-        
+    
     Returns:
         삽입된 행 수
     """
@@ -92,153 +348,203 @@ def create_table_from_csv(cursor, csv_file, table_name):
     
     print(f"\n처리 중: {table_name} 테이블 ({csv_file})")
     
-    # CSV 파일 읽기
-    with open(csv_file, 'r', encoding='utf-8') as infile:
-        reader = csv.DictReader(infile)
-        csv_columns = reader.fieldnames
-        
-        if not csv_columns:
-            print(f"경고: '{csv_file}' 파일에 컬럼이 없습니다. 건너뜁니다.")
-            return 0
-        
-        print(f"  컬럼: {', '.join(csv_columns)}")
-        
-        # 데이터 타입 추론을 위해 첫 몇 행 읽기
-        rows_for_inference = []
-        for i, row in enumerate(reader):
-            rows_for_inference.append(row)
-            if i >= 10:  # 최대 10행만 샘플로 사용
-                break
-        
-        # 각 컬럼의 데이터 타입 추론
-        column_types = {}
-        for col in csv_columns:
-            sample_values = [row.get(col, '') for row in rows_for_inference]
-            column_types[col] = infer_column_type(col, sample_values)
-        
-        # Primary Key 자동 감지
-        # 규칙: 파일명(테이블명)에서 끝의 's'를 제거하고 'Id'를 추가
-        # 예: Words -> word_id, Examples -> example_id, Definitions -> definition_id
-        primary_key = None
-        
-        # 테이블명에서 끝의 's' 제거 후 'Id' 추가
-        if table_name.endswith('s'):
-            singular_name = table_name[:-1]  # 끝의 's' 제거
-            expected_pk = f"{singular_name}Id"
-        else:
-            expected_pk = f"{table_name}Id"
-        
-        # 예상된 Primary Key 컬럼이 존재하는지 확인
-        if expected_pk in csv_columns:
-            primary_key = expected_pk
-        else:
-            # 없으면 Id로 끝나는 컬럼 중 가장 짧은 것 선택
-            id_columns = [col for col in csv_columns if col.endswith('Id')]
-            if id_columns:
-                primary_key = min(id_columns, key=len)
-        
-        # CREATE TABLE SQL 생성
-        column_defs = []
-        for col in csv_columns:
-            col_def = f'"{col}" {column_types[col]}'
-            if col == primary_key:
-                col_def += " PRIMARY KEY"
-            column_defs.append(col_def)
-        
-        create_table_sql = f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(column_defs)})"
-        
-        # 테이블 생성
-        cursor.execute(create_table_sql)
-        if primary_key:
-            print(f"  테이블 생성 완료 (Primary Key: {primary_key})")
-        else:
-            print(f"  테이블 생성 완료 (Primary Key 없음)")
-        
-        # 데이터 삽입 준비
-        placeholders = ','.join(['?' for _ in csv_columns])
-        columns_str = ','.join([f'"{col}"' for col in csv_columns])
-        insert_sql = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-        
-        # 첫 행부터 다시 읽기 (이미 읽은 행들 포함)
-        infile.seek(0)
-        reader = csv.DictReader(infile)
-        
-        # 데이터 삽입
-        rows_to_insert = []
-        for row in reader:
-            values = []
-            for col in csv_columns:
-                value = row.get(col, '').strip()
-                # 빈 문자열은 None으로 변환
-                if value == '':
-                    values.append(None)
-                else:
-                    # 타입에 맞게 변환
-                    col_type = column_types[col]
-                    if col_type == 'INTEGER':
-                        try:
-                            values.append(int(value) if value else None)
-                        except ValueError:
-                            values.append(None)
-                    elif col_type == 'REAL':
-                        try:
-                            values.append(float(value) if value else None)
-                        except ValueError:
-                            values.append(None)
-                    else:
-                        values.append(value)
-            rows_to_insert.append(tuple(values))
-        
-        # 배치 삽입
-        cursor.executemany(insert_sql, rows_to_insert)
-        inserted_count = len(rows_to_insert)
-        print(f"  데이터 삽입 완료: {inserted_count}개 행")
-        
-        return inserted_count
+    batches = iter_typed_batches(csv_file)
+    csv_columns = next(batches)
+    if not csv_columns:
+        print(f"경고: '{csv_file}' 파일에 컬럼이 없습니다. 건너뜁니다.")
+        return 0
+    
+    state = start_table(table_name, csv_file, csv_columns)
+    for column_types, rows in batches:
+        write_batch(cursor, state, column_types, rows)
+    return finish_table(cursor, state)
+
 
+# 병렬 파싱 워커 프로세스에서 결과를 보내는 큐와 중단 신호 (워커 초기화 시 설정)
+_batch_queue = None
+_stop_event = None
 
-def create_database_from_csvs(output_db, csv_files, overwrite=False):
+
+def init_parse_worker(batch_queue, stop_event):
     """
-    여러 CSV 파일로부터 새로운 데이터베이스 생성
+    병렬 파싱 워커 프로세스 초기화
+    """
+    global _batch_queue, _stop_event
+    _batch_queue = batch_queue
+    _stop_event = stop_event
+
+
+def parse_csv_worker(file_index, csv_file):
+    """
+    병렬 파싱 워커: CSV 파일을 읽고 변환한 행 묶음을 큐로 전달
+    큐 메시지: ('header', 파일 번호, 컬럼명 리스트), ('batch', 파일 번호, 컬럼 타입 리스트, 행 리스트),
+              ('done', 파일 번호), 오류가 나면 ('error', 파일 번호, 오류 메시지)
+    기록하는 쪽에서 오류가 나 중단 신호가 오면 더 보내지 않고 끝낸다.
+    """
+    try:
+        batches = iter_typed_batches(csv_file)
+        _batch_queue.put(('header', file_index, next(batches)))
+        for column_types, rows in batches:
+            if _stop_event.is_set():
+                return
+            _batch_queue.put(('batch', file_index, column_types, rows))
+        _batch_queue.put(('done', file_index))
+    except Exception as e:
+        _batch_queue.put(('error', file_index, f"{type(e).__name__}: {e}"))
+
+
+def load_csvs_parallel(cursor, csv_files, workers):
+    """
+    CSV 파일들을 여러 프로세스에서 동시에 파싱하고, 이 프로세스 하나가 SQLite에 기록
+    파일마다 워커 하나가 읽기와 타입 변환을 맡고, 변환된 행 묶음을 크기가 제한된 큐로 보낸다.
+    테이블은 파일 순서대로 생성하고 (앞 파일의 테이블이 아직 없으면 뒤 파일의 묶음은 잠시 보관),
+    각 테이블의 진행 메시지는 적재가 끝난 뒤 한 번에 출력한다.
+    기록 중 오류가 나면 (예: Primary Key 중복) 워커를 멈추고 큐를 비운 뒤 예외를 그대로 전달한다.
     
     Args:
-        output_db: 출력 데이터베이스 파일 경로
+        cursor: 데이터베이스 커서
         csv_files: CSV 파일 경로 리스트
-        overwrite: 기존 DB 파일을 덮어쓸지 여부
+        workers: 파싱 프로세스 수
+    
+    Returns:
+        (생성한 테이블 수, 삽입된 전체 행 수)
     """
-    # 출력 파일이 이미 존재하는지 확인
-    if os.path.exists(output_db) and not overwrite:
-        print(f"오류: 데이터베이스 파일 '{output_db}'이 이미 존재합니다.")
-        print("      덮어쓰려면 --overwrite 옵션을 사용하세요.")
-        sys.exit(1)
+    num_files = len(csv_files)
+    messages = [[f"\n처리 중: {get_table_name_from_csv(csv_file)} 테이블 ({csv_file})"] for csv_file in csv_files]
+    states = [None] * num_files
+    # 파일별 상태: 테이블이 생성되었거나 적재가 끝났으면 True (다음 파일의 테이블을 생성할 수 있음)
+    ready = [False] * num_files
+    pending = [[] for _ in range(num_files)]
+    errors = []
+    total_rows = 0
+    next_index = 0
     
-    # CSV 파일 존재 확인
-    for csv_file in csv_files:
-        if not os.path.exists(csv_file):
-            print(f"오류: CSV 파일 '{csv_file}'을 찾을 수 없습니다.")
-            sys.exit(1)
+    def apply_message(message):
+        nonlocal total_rows
+        kind, file_index = message[0], message[1]
+        if kind == 'batch':
+            write_batch(cursor, states[file_index], message[2], message[3])
+            ready[file_index] = True
+        elif kind == 'done':
+            total_rows += finish_table(cursor, states[file_index])
+            print('\n'.join(messages[file_index]))
+            ready[file_index] = True
+        else:
+            # 'skip': 컬럼이 없거나 오류가 난 파일
+            ready[file_index] = True
+    
+    def handle_message(message):
+        nonlocal next_index
+        if message[1] > next_index:
+            pending[message[1]].append(message)
+            return
+        apply_message(message)
+        # 앞 파일의 테이블이 준비되면 보관해 둔 뒤 파일의 묶음 적용
+        while next_index < num_files and ready[next_index]:
+            next_index += 1
+            if next_index < num_files:
+                for held in pending[next_index]:
+                    apply_message(held)
+                pending[next_index] = []
     
-    # 기존 파일 삭제 (overwrite 옵션이 있으면)
-    if os.path.exists(output_db) and overwrite:
-        os.remove(output_db)
-        print(f"기존 데이터베이스 파일 '{output_db}' 삭제됨")
+    # 워커마다 묶음 두 개까지만 큐에 쌓이도록 제한 (기록이 늦으면 파싱이 기다림)
+    batch_queue = multiprocessing.Queue(maxsize=workers * 2)
+    stop_event = multiprocessing.Event()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_parse_worker,
+                             initargs=(batch_queue, stop_event)) as pool:
+        futures = [pool.submit(parse_csv_worker, file_index, csv_file)
+                   for file_index, csv_file in enumerate(csv_files)]
+        
+        try:
+            remaining = num_files
+            while remaining:
+                message = batch_queue.get()
+                kind, file_index = message[0], message[1]
+                if kind == 'header':
+                    if message[2]:
+                        table_name = get_table_name_from_csv(csv_files[file_index])
+                        states[file_index] = start_table(table_name, csv_files[file_index], message[2],
+                                                         messages[file_index].append)
+                    else:
+                        print(f"경고: '{csv_files[file_index]}' 파일에 컬럼이 없습니다. 건너뜁니다.")
+                        handle_message(('skip', file_index))
+                        remaining -= 1
+                    continue
+                if kind == 'error':
+                    errors.append(f"'{csv_files[file_index]}': {message[2]}")
+                    handle_message(('skip', file_index))
+                    remaining -= 1
+                    continue
+                if kind == 'done':
+                    remaining -= 1
+                handle_message(message)
+        except BaseException:
+            # 꽉 찬 큐의 put()에서 기다리는 워커가 있으면 풀 종료가 끝나지 않으므로,
+            # 중단 신호를 보내고 시작하지 않은 작업은 취소한 뒤 모든 워커가 끝날 때까지 큐를 비움
+            stop_event.set()
+            for future in futures:
+                future.cancel()
+            while not all(future.done() for future in futures):
+                try:
+                    batch_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            raise
     
+    if errors:
+        for error in errors:
+            print(f"오류: CSV 파일 처리 실패 {error}")
+        sys.exit(1)
+    return num_files, total_rows
+
+
+def build_database(build_db, output_db, csv_files, bulk=False, workers=1):
+    """
+    빌드 파일에 CSV 파일들의 테이블 생성
+    
+    Args:
+        build_db: 테이블을 만들 빌드 데이터베이스 파일 경로
+        output_db: 최종 출력 데이터베이스 파일 경로 (출력용)
+        csv_files: CSV 파일 경로 리스트
+        bulk: 대량 적재 모드
+        workers: CSV 파싱 프로세스 수
+    """
     # 데이터베이스 연결
-    conn = sqlite3.connect(output_db)
+    conn = sqlite3.connect(build_db)
     cursor = conn.cursor()
     
     print(f"새 데이터베이스 생성: {output_db}")
     print(f"CSV 파일 수: {len(csv_files)}")
     
+    if bulk:
+        # 대량 적재 모드: 롤백 저널과 디스크 동기화를 끄고 페이지 캐시를 늘린 뒤 하나의 트랜잭션으로 적재
+        print("대량 적재 모드: journal_mode=OFF, synchronous=OFF, 단일 트랜잭션")
+        cursor.execute("PRAGMA journal_mode = OFF")
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA cache_size = -262144")
+        cursor.execute("PRAGMA temp_store = MEMORY")
+        cursor.execute("BEGIN")
+    
     total_tables = 0
     total_rows = 0
     
-    # 각 CSV 파일을 테이블로 변환
-    for csv_file in csv_files:
-        table_name = get_table_name_from_csv(csv_file)
-        row_count = create_table_from_csv(cursor, csv_file, table_name)
-        total_tables += 1
-        total_rows += row_count
+    workers = min(workers, len(csv_files))
+    try:
+        if workers > 1:
+            # 여러 CSV 파일을 동시에 파싱하고 SQLite 기록은 이 프로세스에서만 수행
+            print(f"병렬 파싱: {len(csv_files)}개 파일을 {workers}개 프로세스에서 읽습니다.")
+            total_tables, total_rows = load_csvs_parallel(cursor, csv_files, workers)
+        else:
+            # 각 CSV 파일을 테이블로 변환
+            for csv_file in csv_files:
+                table_name = get_table_name_from_csv(csv_file)
+                row_count = create_table_from_csv(cursor, csv_file, table_name)
+                total_tables += 1
+                total_rows += row_count
+    except BaseException:
+        # 호출하는 쪽에서 빌드 파일을 지울 수 있도록 연결을 닫음
+        conn.close()
+        raise
     
     # 변경사항 커밋
     conn.commit()
@@ -249,8 +555,9 @@ def create_database_from_csvs(output_db, csv_files, overwrite=False):
     print(f"생성된 테이블 수: {total_tables}")
     print(f"총 삽입된 행 수: {total_rows}")
     
-    # 각 테이블의 행 수 출력
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    # 각 테이블의 행 수 출력 (SQLite 내부 테이블과 도구가 만든 '_' 테이블 제외)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' "
+                   "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '\\_%' ESCAPE '\\'")
     tables = cursor.fetchall()
     print(f"\n테이블별 행 수:")
     for (table_name,) in tables:
@@ -261,13 +568,53 @@ def create_database_from_csvs(output_db, csv_files, overwrite=False):
     conn.close()
 
 
+def create_database_from_csvs(output_db, csv_files, overwrite=False, bulk=False, workers=1):
+    """
+    여러 CSV 파일로부터 새로운 데이터베이스 생성
+    
+    Args:
+        output_db: 출력 데이터베이스 파일 경로
+        csv_files: CSV 파일 경로 리스트
+        overwrite: 기존 DB 파일을 덮어쓸지 여부
+        bulk: 대량 적재 모드 (저널과 동기화를 끄고 전체를 하나의 트랜잭션으로 적재, 만드는 스키마는 같음)
+              빌드 파일에 만들므로 중간에 실패해도 기존 데이터베이스 파일은 그대로
+        workers: CSV 파싱 프로세스 수 (2 이상이면 파일마다 다른 프로세스에서 읽고 변환한 뒤
+                 이 프로세스 하나가 SQLite에 기록)
+    """
+    # 출력 파일이 이미 존재하는지 확인
+    if os.path.exists(output_db) and not overwrite:
+        print(f"오류: 데이터베이스 파일 '{output_db}'이 이미 존재합니다.")
+        print("      덮어쓰려면 --overwrite 옵션을 사용하세요.")
+        sys.exit(1)
+    
+    # CSV 파일 존재 확인
+    for csv_file in csv_files:
+        if not os.path.exists(csv_file):
+            print(f"오류: CSV 파일 '{csv_file}'을 찾을 수 없습니다.")
+            sys.exit(1)
+    
+    # 새 데이터베이스는 같은 디렉토리의 빌드 파일에 만든 뒤 무결성 검사를 거쳐 원자적으로 교체
+    # (기존 파일을 먼저 지우지 않으므로 빌드 중에도 읽는 쪽은 기존 데이터베이스를 그대로 읽음)
+    build_db = start_build(output_db)
+    try:
+        build_database(build_db, output_db, csv_files, bulk, workers)
+        publish_build(build_db, output_db)
+    except BaseException:
+        discard_build(build_db)
+        raise
+
+
 def main():
     if len(sys.argv) < 3:
         print("사용법: python script/create_db_from_csv.py <output_db> <csv_file1> [csv_file2] [csv_file3] ...")
         print("예시: python script/create_db_from_csv.py vocabulary.db Vocabulary.csv Meaning.csv Example.csv")
         print("      python script/create_db_from_csv.py vocabulary.db *.csv --overwrite")
+        print("      python script/create_db_from_csv.py vocabulary.db *.csv --overwrite --bulk")
+        print("      python script/create_db_from_csv.py vocabulary.db *.csv --overwrite --bulk --workers 3")
         print("\n옵션:")
         print("  --overwrite: 기존 데이터베이스 파일을 덮어씁니다")
+        print("  --bulk: 대량 적재 모드 (저널/동기화를 끄고 하나의 트랜잭션으로 적재, 스키마는 기본 모드와 같음)")
+        print("  --workers N: CSV 파일들을 N개 프로세스에서 동시에 읽고 변환 (SQLite 기록은 한 프로세스)")
         sys.exit(1)
     
     # 인자 파싱
@@ -275,6 +622,22 @@ def main():
     overwrite = '--overwrite' in args
     if overwrite:
         args.remove('--overwrite')
+    bulk = '--bulk' in args
+    if bulk:
+        args.remove('--bulk')
+    workers = 1
+    for i, arg in enumerate(args):
+        if arg == '--workers' or arg.startswith('--workers='):
+            value = arg.split('=', 1)[1] if '=' in arg else (args[i + 1] if i + 1 < len(args) else '')
+            try:
+                workers = int(value)
+            except ValueError:
+                workers = 0
+            if workers < 1:
+                print(f"오류: 잘못된 워커 수 '{value}'입니다. (1 이상의 정수)")
+                sys.exit(1)
+            del args[i:i + (1 if '=' in arg else 2)]
+            break
     
     output_db = args[0]
     csv_files = args[1:]
@@ -283,7 +646,7 @@ def main():
         print("오류: 최소 하나의 CSV 파일을 지정해야 합니다.")
         sys.exit(1)
     
-    create_database_from_csvs(output_db, csv_files, overwrite)
+    create_database_from_csvs(output_db, csv_files, overwrite, bulk, workers)
 
 
 if __name__ == "__main__":
@@ -2,82 +2,152 @@
 # -*- coding: utf-8 -*-
 """
 IELTS 단어장 CSV 파일들로부터 SQLite 데이터베이스를 생성하는 스크립트
+데이터베이스에는 테이블마다 원본 CSV 파일의 경로, 크기, 수정 시각, 내용 해시와 테이블 스키마를
+기록한 매니페스트(_build_manifest)를 남긴다. --incremental로 다시 만들면 원본 CSV나 스키마가 바뀐
+테이블만 다시 불러온다.
+데이터베이스는 빌드 파일에 만든 뒤 검사를 거쳐 원자적으로 교체하므로 빌드 중에도 기존 파일을 읽을 수 있다.
 
-사용법: python script/create_db_from_ielts_csv.py <output_db> [--overwrite]
+--layout clustered로 만들면 words/definitions/examples를 계층 키 순서로 저장하는 WITHOUT ROWID 테이블과
+커버링 인덱스를 만들어 WPF 앱(SQLiteQueries.cs)의 ORDER BY 조회를 정렬 없이 읽는다
+(실행 계획 비교: python script/explain_queries.py <db_file> [db_file2 ...]).
+
+사용법: python script/create_db_from_ielts_csv.py <output_db> [csv_dir] [--overwrite | --incremental] [--layout rowid|clustered]
 예시: python script/create_db_from_ielts_csv.py data/ielts_voca_20_30.db
 """
 
 import csv
+import hashlib
 import sqlite3
 import sys
 import os
 from pathlib import Path
 
+from db_publish import discard_build, publish_build, start_build
+
+# 원본 CSV 정보를 기록하는 매니페스트 테이블명
+MANIFEST_TABLE = '_build_manifest'
+# 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+
+BOOKS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS books (
+        book_id                INTEGER PRIMARY KEY,
+        code_name              TEXT    NOT NULL,
+        max_days               INTEGER NOT NULL,
+        max_words_per_day      INTEGER NOT NULL,
+        max_senses_per_word    INTEGER NOT NULL,
+        max_examples_per_sense INTEGER NOT NULL,
+        created_at             TEXT    NOT NULL
+    )
+"""
+
+WORDS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS words (
+        word_id INTEGER PRIMARY KEY,
+        day_no  INTEGER NOT NULL,
+        word_no INTEGER NOT NULL,
+        word    TEXT    NOT NULL,
+        UNIQUE (day_no, word_no)
+    )
+"""
+
+DEFINITIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS definitions (
+        definition_id  INTEGER PRIMARY KEY,
+        word_id        INTEGER NOT NULL,
+        sense_no       INTEGER NOT NULL,
+        definition     TEXT    NOT NULL,
+        part_of_speech TEXT,
+        FOREIGN KEY (word_id) REFERENCES words(word_id),
+        UNIQUE (word_id, sense_no)
+    )
+"""
+
+EXAMPLES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS examples (
+        example_id       INTEGER PRIMARY KEY,
+        definition_id    INTEGER NOT NULL,
+        example_no       INTEGER NOT NULL,
+        example_sentence TEXT    NOT NULL,
+        FOREIGN KEY (definition_id) REFERENCES definitions(definition_id),
+        UNIQUE (definition_id, example_no)
+    )
+"""
+
+# 인덱스 (성능 향상)
+INDEX_SQLS = [
+    "CREATE INDEX IF NOT EXISTS idx_definitions_word_id ON definitions(word_id)",
+    "CREATE INDEX IF NOT EXISTS idx_examples_definition_id ON examples(definition_id)",
+    "CREATE INDEX IF NOT EXISTS idx_words_day_no ON words(day_no)",
+]
 
-def create_database_from_csvs(output_db, csv_dir, overwrite=False):
+# ---- clustered 레이아웃 (WPF 앱의 조회 순서에 맞춘 물리 배치) ----
+# 행을 계층 키 (day_no, word_no) / (word_id, sense_no) / (definition_id, example_no) 순서로 저장하는
+# WITHOUT ROWID 테이블. 전역 ID는 이 키에서 계산되므로 (word_id = (day_no - 1) * 단어수 + word_no 등)
+# 키 순서가 곧 ID 순서이고, SQLiteQueries.cs의 ORDER BY가 정렬 없이 테이블 순서대로 읽힌다.
+# 전역 ID는 UNIQUE로 유지하여 외래 키와 ID 조회(UPDATE ... WHERE word_id = ?)에 그대로 사용한다.
+CLUSTERED_WORDS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS words (
+        word_id INTEGER NOT NULL,
+        day_no  INTEGER NOT NULL,
+        word_no INTEGER NOT NULL,
+        word    TEXT    NOT NULL,
+        PRIMARY KEY (day_no, word_no),
+        UNIQUE (word_id)
+    ) WITHOUT ROWID
+"""
+
+CLUSTERED_DEFINITIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS definitions (
+        definition_id  INTEGER NOT NULL,
+        word_id        INTEGER NOT NULL,
+        sense_no       INTEGER NOT NULL,
+        definition     TEXT    NOT NULL,
+        part_of_speech TEXT,
+        PRIMARY KEY (word_id, sense_no),
+        FOREIGN KEY (word_id) REFERENCES words(word_id),
+        UNIQUE (definition_id)
+    ) WITHOUT ROWID
+"""
+
+CLUSTERED_EXAMPLES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS examples (
+        example_id       INTEGER NOT NULL,
+        definition_id    INTEGER NOT NULL,
+        example_no       INTEGER NOT NULL,
+        example_sentence TEXT    NOT NULL,
+        PRIMARY KEY (definition_id, example_no),
+        FOREIGN KEY (definition_id) REFERENCES definitions(definition_id),
+        UNIQUE (example_id)
+    ) WITHOUT ROWID
+"""
+
+# clustered 레이아웃의 커버링 인덱스 (WITHOUT ROWID 테이블의 인덱스에는 기본 키 컬럼이 함께 들어감)
+# - words(word_id, word): word_id로 조인할 때 day_no, word_no, word를 테이블을 다시 읽지 않고 가져옴
+# - definitions(definition_id, definition): LoadExampleOnly에서 definition_id로 조인할 때 word_id, definition을 가져옴
+# examples는 문장을 인덱스에 복제하지 않도록 UNIQUE (example_id) 인덱스만 사용 (ORDER BY e.example_id도 정렬 없음)
+CLUSTERED_INDEX_SQLS = [
+    "CREATE INDEX IF NOT EXISTS idx_words_word_id_word ON words(word_id, word)",
+    "CREATE INDEX IF NOT EXISTS idx_definitions_definition_id_definition ON definitions(definition_id, definition)",
+]
+
+# 레이아웃: {레이아웃명: ({테이블명: CREATE TABLE SQL} (기본 스키마 대신 사용), 인덱스 SQL 목록)}
+LAYOUTS = {
+    'rowid': ({}, INDEX_SQLS),
+    'clustered': ({
+        'words': CLUSTERED_WORDS_TABLE_SQL,
+        'definitions': CLUSTERED_DEFINITIONS_TABLE_SQL,
+        'examples': CLUSTERED_EXAMPLES_TABLE_SQL,
+    }, CLUSTERED_INDEX_SQLS),
+}
+DEFAULT_LAYOUT = 'rowid'
+
+
+def load_books(cursor, csv_path):
     """
-    CSV 파일들로부터 데이터베이스 생성
-    
-    Args:
-        output_db: 출력 데이터베이스 파일 경로
-        csv_dir: CSV 파일들이 있는 디렉토리 경로
-        overwrite: 기존 DB 파일을 덮어쓸지 여부
+    book_meta.csv를 books 테이블에 삽입
     """
-    csv_dir = Path(csv_dir)
-    
-    # CSV 파일 경로
-    book_meta_csv = csv_dir / "book_meta.csv"
-    words_csv = csv_dir / "words.csv"
-    definitions_csv = csv_dir / "definitions.csv"
-    examples_csv = csv_dir / "examples.csv"
-    
-    # CSV 파일 존재 확인
-    csv_files = {
-        'book_meta': book_meta_csv,
-        'words': words_csv,
-        'definitions': definitions_csv,
-        'examples': examples_csv
-    }
-    
-    for name, path in csv_files.items():
-        if not path.exists():
-            print(f"오류: CSV 파일 '{path}'을 찾을 수 없습니다.")
-            sys.exit(1)
-    
-    # 출력 파일이 이미 존재하는지 확인
-    if os.path.exists(output_db) and not overwrite:
-        print(f"오류: 데이터베이스 파일 '{output_db}'이 이미 존재합니다.")
-        print("      덮어쓰려면 --overwrite 옵션을 사용하세요.")
-        sys.exit(1)
-    
-    # 기존 파일 삭제 (overwrite 옵션이 있으면)
-    if os.path.exists(output_db) and overwrite:
-        os.remove(output_db)
-        print(f"기존 데이터베이스 파일 '{output_db}' 삭제됨")
-    
-    # 데이터베이스 연결
-    conn = sqlite3.connect(output_db)
-    conn.execute("PRAGMA foreign_keys = ON;")
-    cursor = conn.cursor()
-    
-    print(f"새 데이터베이스 생성: {output_db}")
-    print(f"CSV 디렉토리: {csv_dir}\n")
-    
-    # 1. books 테이블 생성 및 데이터 삽입
-    print("=== books 테이블 생성 ===")
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS books (
-            book_id                INTEGER PRIMARY KEY,
-            code_name              TEXT    NOT NULL,
-            max_days               INTEGER NOT NULL,
-            max_words_per_day      INTEGER NOT NULL,
-            max_senses_per_word    INTEGER NOT NULL,
-            max_examples_per_sense INTEGER NOT NULL,
-            created_at             TEXT    NOT NULL
-        )
-    """)
-    
-    with open(book_meta_csv, 'r', encoding='utf-8') as f:
+    with open(csv_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             if row['book_id'].strip():  # 빈 행 건너뛰기
@@ -95,24 +165,13 @@ def create_database_from_csvs(output_db, csv_dir, overwrite=False):
                     int(row['max_examples_per_sense']),
                     row['created_at']
                 ))
-    
-    cursor.execute("SELECT COUNT(*) FROM books")
-    book_count = cursor.fetchone()[0]
-    print(f"  삽입된 행 수: {book_count}개\n")
-    
-    # 2. words 테이블 생성 및 데이터 삽입
-    print("=== words 테이블 생성 ===")
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS words (
-            word_id INTEGER PRIMARY KEY,
-            day_no  INTEGER NOT NULL,
-            word_no INTEGER NOT NULL,
-            word    TEXT    NOT NULL,
-            UNIQUE (day_no, word_no)
-        )
-    """)
-    
-    with open(words_csv, 'r', encoding='utf-8') as f:
+
+
+def load_words(cursor, csv_path):
+    """
+    words.csv를 words 테이블에 삽입
+    """
+    with open(csv_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         rows = []
         for row in reader:
@@ -128,26 +187,13 @@ def create_database_from_csvs(output_db, csv_dir, overwrite=False):
             INSERT INTO words (word_id, day_no, word_no, word)
             VALUES (?, ?, ?, ?)
         """, rows)
-    
-    cursor.execute("SELECT COUNT(*) FROM words")
-    word_count = cursor.fetchone()[0]
-    print(f"  삽입된 행 수: {word_count}개\n")
-    
-    # 3. definitions 테이블 생성 및 데이터 삽입
-    print("=== definitions 테이블 생성 ===")
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS definitions (
-            definition_id  INTEGER PRIMARY KEY,
-            word_id        INTEGER NOT NULL,
-            sense_no       INTEGER NOT NULL,
-            definition     TEXT    NOT NULL,
-            part_of_speech TEXT,
-            FOREIGN KEY (word_id) REFERENCES words(word_id),
-            UNIQUE (word_id, sense_no)
-        )
-    """)
-    
-    with open(definitions_csv, 'r', encoding='utf-8') as f:
+
+
+def load_definitions(cursor, csv_path):
+    """
+    definitions.csv를 definitions 테이블에 삽입
+    """
+    with open(csv_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         rows = []
         for row in reader:
@@ -166,25 +212,13 @@ def create_database_from_csvs(output_db, csv_dir, overwrite=False):
                 definition_id, word_id, sense_no, definition, part_of_speech
             ) VALUES (?, ?, ?, ?, ?)
         """, rows)
-    
-    cursor.execute("SELECT COUNT(*) FROM definitions")
-    def_count = cursor.fetchone()[0]
-    print(f"  삽입된 행 수: {def_count}개\n")
-    
-    # 4. examples 테이블 생성 및 데이터 삽입
-    print("=== examples 테이블 생성 ===")
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS examples (
-            example_id       INTEGER PRIMARY KEY,
-            definition_id    INTEGER NOT NULL,
-            example_no       INTEGER NOT NULL,
-            example_sentence TEXT    NOT NULL,
-            FOREIGN KEY (definition_id) REFERENCES definitions(definition_id),
-            UNIQUE (definition_id, example_no)
-        )
-    """)
-    
-    with open(examples_csv, 'r', encoding='utf-8') as f:
+
+
+def load_examples(cursor, csv_path):
+    """
+    examples.csv를 examples 테이블에 삽입
+    """
+    with open(csv_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         rows = []
         for row in reader:
@@ -201,10 +235,200 @@ def create_database_from_csvs(output_db, csv_dir, overwrite=False):
                 example_id, definition_id, example_no, example_sentence
             ) VALUES (?, ?, ?, ?)
         """, rows)
+
+
+# 테이블 생성 순서 (외래 키가 참조하는 테이블이 먼저): (테이블명, CSV 파일명, CREATE TABLE SQL, 삽입 함수)
+TABLES = [
+    ('books', 'book_meta.csv', BOOKS_TABLE_SQL, load_books),
+    ('words', 'words.csv', WORDS_TABLE_SQL, load_words),
+    ('definitions', 'definitions.csv', DEFINITIONS_TABLE_SQL, load_definitions),
+    ('examples', 'examples.csv', EXAMPLES_TABLE_SQL, load_examples),
+]
+
+
+def get_tables(layout=DEFAULT_LAYOUT):
+    """
+    레이아웃에 맞춘 테이블 목록: [(테이블명, CSV 파일명, CREATE TABLE SQL, 삽입 함수), ...]
+    """
+    table_sqls, _ = LAYOUTS[layout]
+    return [(table_name, csv_name, table_sqls.get(table_name, schema_sql), load_rows)
+            for table_name, csv_name, schema_sql, load_rows in TABLES]
+
+
+def hash_file(path):
+    """
+    파일 내용의 SHA-256 해시
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(cursor):
+    """
+    매니페스트 읽기
+    
+    Returns:
+        {테이블명: {'source_path', 'size', 'mtime_ns', 'sha256', 'schema_sql'}}
+        (매니페스트 테이블이 없으면 빈 딕셔너리)
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (MANIFEST_TABLE,))
+    if not cursor.fetchone():
+        return {}
+    cursor.execute(f"SELECT table_name, source_path, size, mtime_ns, sha256, schema_sql FROM {MANIFEST_TABLE}")
+    return {
+        table_name: {'source_path': source_path, 'size': size, 'mtime_ns': mtime_ns,
+                     'sha256': sha256, 'schema_sql': schema_sql}
+        for table_name, source_path, size, mtime_ns, sha256, schema_sql in cursor.fetchall()
+    }
+
+
+def get_source_state(csv_path, previous=None):
+    """
+    원본 CSV 파일의 상태 (경로, 크기, 수정 시각, 내용 해시)
+    경로, 크기, 수정 시각이 previous와 같으면 해시를 다시 계산하지 않는다.
+    
+    Args:
+        csv_path: CSV 파일 경로
+        previous: 매니페스트에 기록된 이전 상태 (없으면 None)
+    """
+    source_path = str(Path(csv_path).resolve())
+    stat = os.stat(csv_path)
+    if (previous and previous['source_path'] == source_path and
+            previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns):
+        sha256 = previous['sha256']
+    else:
+        sha256 = hash_file(csv_path)
+    return {'source_path': source_path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': sha256}
+
+
+def is_table_unchanged(cursor, table_name, schema_sql, state, previous):
+    """
+    테이블을 다시 불러오지 않아도 되는지 확인 (원본 경로, 내용, 스키마가 같고 테이블이 있음)
+    """
+    if not previous:
+        return False
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,))
+    if not cursor.fetchone():
+        return False
+    return (previous['source_path'] == state['source_path'] and
+            previous['sha256'] == state['sha256'] and
+            previous['schema_sql'] == schema_sql)
+
+
+def write_manifest(cursor, table_name, schema_sql, state, row_count):
+    """
+    매니페스트에 테이블의 원본 CSV 상태와 스키마 기록
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} (
+            table_name  TEXT PRIMARY KEY,
+            source_path TEXT    NOT NULL,
+            size        INTEGER NOT NULL,
+            mtime_ns    INTEGER NOT NULL,
+            sha256      TEXT    NOT NULL,
+            schema_sql  TEXT    NOT NULL,
+            row_count   INTEGER NOT NULL,
+            loaded_at   TEXT    NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+    cursor.execute(f"""
+        INSERT OR REPLACE INTO {MANIFEST_TABLE} (
+            table_name, source_path, size, mtime_ns, sha256, schema_sql, row_count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (table_name, state['source_path'], state['size'], state['mtime_ns'], state['sha256'], schema_sql, row_count))
+
+
+def plan_incremental_build(output_db, csv_files, layout=DEFAULT_LAYOUT):
+    """
+    기존 데이터베이스의 매니페스트와 CSV 파일을 비교하여 다시 불러올 테이블 결정 (기존 파일은 읽기만 함)
+    레이아웃이 바뀐 테이블은 스키마가 달라지므로 다시 불러온다.
+    
+    Args:
+        output_db: 기존 데이터베이스 파일 경로
+        csv_files: {테이블명: CSV 파일 경로}
+        layout: 테이블 레이아웃 ('rowid' 또는 'clustered')
+    
+    Returns:
+        {테이블명: (다시 불러올지 여부, 원본 CSV 상태)}
+    """
+    conn = sqlite3.connect(Path(output_db).resolve().as_uri() + '?mode=ro', uri=True)
+    try:
+        cursor = conn.cursor()
+        manifest = read_manifest(cursor)
+        plan = {}
+        for table_name, _, schema_sql, _ in get_tables(layout):
+            previous = manifest.get(table_name)
+            state = get_source_state(csv_files[table_name], previous)
+            plan[table_name] = (not is_table_unchanged(cursor, table_name, schema_sql, state, previous), state)
+    finally:
+        conn.close()
+    return plan
+
+
+def build_database(build_db, output_db, csv_dir, csv_files, plan, incremental=False, layout=DEFAULT_LAYOUT):
+    """
+    빌드 파일에 테이블 생성 (증분 생성이면 기존 데이터베이스를 복사해 둔 빌드 파일에서 바뀐 테이블만 다시 생성)
+    
+    Args:
+        build_db: 빌드 데이터베이스 파일 경로
+        output_db: 최종 출력 데이터베이스 파일 경로 (출력용)
+        csv_dir: CSV 파일들이 있는 디렉토리 경로
+        csv_files: {테이블명: CSV 파일 경로}
+        plan: {테이블명: (다시 불러올지 여부, 원본 CSV 상태)}
+        incremental: 증분 생성 여부
+        layout: 테이블 레이아웃 ('rowid' 또는 'clustered')
+    """
+    tables = get_tables(layout)
+    _, index_sqls = LAYOUTS[layout]
     
-    cursor.execute("SELECT COUNT(*) FROM examples")
-    ex_count = cursor.fetchone()[0]
-    print(f"  삽입된 행 수: {ex_count}개\n")
+    # 데이터베이스 연결
+    conn = sqlite3.connect(build_db)
+    cursor = conn.cursor()
+    
+    if incremental:
+        # 다른 테이블이 참조하는 테이블을 지우고 다시 불러올 수 있도록 외래 키 검사는 적재 후에 한 번에 수행
+        conn.execute("PRAGMA foreign_keys = OFF;")
+        print(f"증분 생성: {output_db}")
+    else:
+        conn.execute("PRAGMA foreign_keys = ON;")
+        print(f"새 데이터베이스 생성: {output_db}")
+    print(f"CSV 디렉토리: {csv_dir}")
+    print(f"테이블 레이아웃: {layout}\n")
+    
+    reloaded_tables = []
+    
+    for table_name, _, schema_sql, load_rows in tables:
+        reload, state = plan[table_name]
+        if not reload:
+            print(f"=== {table_name} 테이블: 변경 없음 (건너뜀) ===\n")
+            continue
+        
+        # 테이블 생성 및 데이터 삽입 (증분 생성이면 기존 테이블을 지우고 다시 생성)
+        print(f"=== {table_name} 테이블 생성 ===")
+        if incremental:
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+        cursor.execute(schema_sql)
+        load_rows(cursor, csv_files[table_name])
+        
+        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+        row_count = cursor.fetchone()[0]
+        print(f"  삽입된 행 수: {row_count}개\n")
+        write_manifest(cursor, table_name, schema_sql, state, row_count)
+        reloaded_tables.append(table_name)
+    
+    if incremental:
+        # 다시 불러온 테이블과 나머지 테이블 사이의 외래 키 확인 (위반이 있으면 교체하지 않음)
+        cursor.execute("PRAGMA foreign_key_check")
+        violations = cursor.fetchall()
+        if violations:
+            conn.close()
+            print(f"오류: 외래 키 위반 {len(violations)}건이 있어 데이터베이스를 교체하지 않습니다.")
+            for table_name, rowid, parent, _ in violations[:10]:
+                print(f"  {table_name} (rowid {rowid}) -> {parent}")
+            sys.exit(1)
     
     # 변경사항 커밋
     conn.commit()
@@ -212,31 +436,105 @@ def create_database_from_csvs(output_db, csv_dir, overwrite=False):
     # 최종 통계
     print("=== 생성 완료 ===")
     print(f"데이터베이스 파일: {output_db}")
+    if incremental:
+        print(f"다시 불러온 테이블: {', '.join(reloaded_tables)}")
     print(f"\n테이블별 행 수:")
-    for table in ['books', 'words', 'definitions', 'examples']:
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    for table_name, _, _, _ in tables:
+        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
         count = cursor.fetchone()[0]
-        print(f"  {table}: {count}개 행")
+        print(f"  {table_name}: {count}개 행")
     
-    # 인덱스 생성 (성능 향상)
+    # 인덱스 생성 (성능 향상, 다시 만든 테이블의 인덱스만 새로 생성됨)
     print("\n=== 인덱스 생성 ===")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_definitions_word_id ON definitions(word_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_examples_definition_id ON examples(definition_id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_words_day_no ON words(day_no)")
+    for index_sql in index_sqls:
+        cursor.execute(index_sql)
     conn.commit()
     print("  인덱스 생성 완료")
     
+    if layout == 'clustered':
+        # 통계(sqlite_stat1)가 있어야 옵티마이저가 words부터 키 순서대로 읽는 계획을 고름
+        # (없으면 LoadWordDefinitionExample이 examples부터 읽고 임시 B-트리로 정렬)
+        cursor.execute("ANALYZE")
+        conn.commit()
+        print("  통계 수집 완료 (ANALYZE)")
+    
     conn.close()
+
+
+def create_database_from_csvs(output_db, csv_dir, overwrite=False, incremental=False, layout=DEFAULT_LAYOUT):
+    """
+    CSV 파일들로부터 데이터베이스 생성
+    데이터베이스는 같은 디렉토리의 빌드 파일에 만들고, 무결성 검사를 통과하면 WAL 모드로 바꾸어
+    출력 파일 자리에 원자적으로 교체한다 (빌드 중에도 기존 데이터베이스를 읽는 쪽은 영향을 받지 않음).
+    
+    Args:
+        output_db: 출력 데이터베이스 파일 경로
+        csv_dir: CSV 파일들이 있는 디렉토리 경로
+        overwrite: 기존 DB 파일을 덮어쓸지 여부
+        incremental: 기존 DB 파일을 유지하고 원본 CSV 파일(내용 해시)이나 스키마가 바뀐 테이블만 다시 불러올지 여부
+                     (매니페스트가 없는 테이블도 다시 불러옴)
+        layout: 테이블 레이아웃
+                'rowid' - 전역 ID를 INTEGER PRIMARY KEY로 하는 기본 레이아웃
+                'clustered' - 계층 키 순서로 저장하는 WITHOUT ROWID 테이블과 커버링 인덱스
+                              (WPF 앱의 ORDER BY 조회를 정렬 없이 순서대로 읽음)
+    """
+    if layout not in LAYOUTS:
+        print(f"오류: 알 수 없는 레이아웃 '{layout}'입니다. ({', '.join(LAYOUTS)} 중 하나)")
+        sys.exit(1)
+    
+    csv_dir = Path(csv_dir)
+    
+    # CSV 파일 존재 확인
+    csv_files = {table_name: csv_dir / csv_name for table_name, csv_name, _, _ in TABLES}
+    
+    for name, path in csv_files.items():
+        if not path.exists():
+            print(f"오류: CSV 파일 '{path}'을 찾을 수 없습니다.")
+            sys.exit(1)
+    
+    # 증분 생성은 기존 파일이 있을 때만
+    incremental = incremental and os.path.exists(output_db)
+    
+    # 출력 파일이 이미 존재하는지 확인
+    if os.path.exists(output_db) and not overwrite and not incremental:
+        print(f"오류: 데이터베이스 파일 '{output_db}'이 이미 존재합니다.")
+        print("      덮어쓰려면 --overwrite 옵션을, 바뀐 테이블만 다시 불러오려면 --incremental 옵션을 사용하세요.")
+        sys.exit(1)
+    
+    if incremental:
+        plan = plan_incremental_build(output_db, csv_files, layout)
+        if not any(reload for reload, _ in plan.values()):
+            print("바뀐 CSV 파일이 없습니다. 데이터베이스를 그대로 둡니다.")
+            return
+    else:
+        plan = {table_name: (True, get_source_state(path)) for table_name, path in csv_files.items()}
+    
+    # 증분 생성이면 기존 데이터베이스를 빌드 파일에 복사한 뒤 바뀐 테이블만 다시 생성
+    build_db = start_build(output_db, output_db if incremental else None)
+    try:
+        build_database(build_db, output_db, csv_dir, csv_files, plan, incremental, layout)
+        publish_build(build_db, output_db)
+    except BaseException:
+        discard_build(build_db)
+        raise
+    
     print(f"\n데이터베이스 생성이 완료되었습니다: {output_db}")
 
 
 def main():
     if len(sys.argv) < 2:
-        print("사용법: python script/create_db_from_ielts_csv.py <output_db> [--overwrite]")
+        print("사용법: python script/create_db_from_ielts_csv.py <output_db> [csv_dir] [--overwrite | --incremental] [--layout rowid|clustered]")
         print("예시: python script/create_db_from_ielts_csv.py data/ielts_voca_20_30.db")
         print("      python script/create_db_from_ielts_csv.py data/ielts_voca_20_30.db --overwrite")
+        print("      python script/create_db_from_ielts_csv.py data/ielts_voca_20_30.db --incremental")
         print("\n옵션:")
         print("  --overwrite: 기존 데이터베이스 파일을 덮어씁니다")
+        print("  --incremental: 기존 데이터베이스 파일을 유지하고 CSV 파일 내용이나 스키마가 바뀐 테이블만 다시 불러옵니다")
+        print("                 (데이터베이스 파일이 없으면 새로 생성)")
+        print("  --layout: 테이블 레이아웃 (기본값: rowid)")
+        print("            rowid - 전역 ID를 INTEGER PRIMARY KEY로 하는 기본 레이아웃")
+        print("            clustered - 계층 키 순서로 저장하는 WITHOUT ROWID 테이블과 커버링 인덱스")
+        print("                        (--incremental과 함께 쓰면 레이아웃이 바뀐 테이블만 다시 불러옴)")
         print("\n참고: CSV 파일들은 output_db와 같은 디렉토리에 있어야 합니다.")
         print("      또는 CSV 디렉토리 경로를 지정할 수 있습니다.")
         sys.exit(1)
@@ -246,6 +544,15 @@ def main():
     overwrite = '--overwrite' in args
     if overwrite:
         args.remove('--overwrite')
+    incremental = '--incremental' in args
+    if incremental:
+        args.remove('--incremental')
+    layout = DEFAULT_LAYOUT
+    for i, arg in enumerate(args):
+        if arg == '--layout' or arg.startswith('--layout='):
+            layout = arg.split('=', 1)[1] if '=' in arg else (args[i + 1] if i + 1 < len(args) else '')
+            del args[i:i + (1 if '=' in arg else 2)]
+            break
     
     output_db = Path(args[0])
     
@@ -255,9 +562,8 @@ def main():
     else:
         csv_dir = output_db.parent
     
-    create_database_from_csvs(output_db, csv_dir, overwrite)
+    create_database_from_csvs(output_db, csv_dir, overwrite, incremental, layout)
 
 
 if __name__ == "__main__":
     main()
-
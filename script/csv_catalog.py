@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+CSV 스키마 카탈로그 (join_csv.py의 조인 경로 탐색용)
+데이터 폴더의 CSV 파일별 컬럼명, 크기, 수정 시각을 캐시 파일(.csv_catalog.json)에 저장하고,
+컬럼명으로 추론한 외래 키(FK) 그래프에서 너비 우선 탐색으로 조인 경로를 찾는다.
+캐시 항목은 파일의 크기나 수정 시각이 바뀐 경우에만 다시 읽는다.
+
+사용법: python script/csv_catalog.py <data_dir>                  (카탈로그와 FK 목록 출력)
+        python script/csv_catalog.py <data_dir> <left.csv> <right.csv> <left_key> <right_key>
+"""
+
+import csv
+import json
+import os
+import sys
+from collections import deque
+
+# 카탈로그 캐시 파일명 (탐색 디렉토리에 생성)
+CATALOG_FILENAME = '.csv_catalog.json'
+# 캐시 형식이 바뀌면 올려서 기존 캐시를 버림
+CATALOG_VERSION = 1
+
+def get_table_name(csv_file):
+    """
+    CSV 파일명에서 테이블명 추출 (확장자 제거)
+    """
+    return os.path.splitext(os.path.basename(csv_file))[0]
+
+def get_singular_name(table_name):
+    """
+    테이블명에서 끝의 's'를 제거한 단수형 (예: words -> word, Examples -> Example)
+    """
+    return table_name[:-1] if table_name.lower().endswith('s') else table_name
+
+def find_primary_key(table_name, columns):
+    """
+    컬럼명으로 테이블의 Primary Key 추정
+    우선순위: 1) Id, 2) {단수형}_id / {단수형}Id, 3) {테이블명}_id / {테이블명}Id
+
+    Returns:
+        Primary Key 컬럼명 또는 None
+    """
+    columns_lower = {col.lower(): col for col in columns}
+    singular = get_singular_name(table_name).lower()
+    candidates = ['id', f"{singular}_id", f"{singular}id", f"{table_name.lower()}_id", f"{table_name.lower()}id"]
+    for candidate in candidates:
+        if candidate in columns_lower:
+            return columns_lower[candidate]
+    return None
+
+def find_reference_columns(columns, own_primary_key, target_table, target_primary_key):
+    """
+    컬럼 중 대상 테이블의 Primary Key를 참조하는 컬럼 찾기
+    예: definitions.word_id -> words.word_id, Meaning.VocabularyId -> Vocabulary.Id
+
+    Returns:
+        참조 컬럼명 리스트
+    """
+    if target_primary_key.lower() == 'id':
+        singular = get_singular_name(target_table).lower()
+        names = {f"{target_table.lower()}id", f"{target_table.lower()}_id", f"{singular}id", f"{singular}_id"}
+    else:
+        names = {target_primary_key.lower()}
+    return [col for col in columns if col != own_primary_key and col.lower() in names]
+
+def find_linked_columns(table_name, columns, key, other_table, other_columns):
+    """
+    table_name.key와 추론한 외래 키로 이어지는 other_table의 컬럼 찾기 (build_fk_edges와 같은 규칙)
+    예: words.word_id -> definitions.word_id, examples.definition_id -> definitions.definition_id
+
+    Returns:
+        other_table의 컬럼명 리스트
+    """
+    primary_key = find_primary_key(table_name, columns)
+    other_primary_key = find_primary_key(other_table, other_columns)
+    linked = []
+    if primary_key == key:
+        linked.extend(find_reference_columns(other_columns, other_primary_key, table_name, primary_key))
+    if other_primary_key and key in find_reference_columns(columns, primary_key, other_table, other_primary_key):
+        linked.append(other_primary_key)
+    return linked
+
+def infer_middle_keys(left_table, left_columns, left_key, middle_table, middle_columns,
+                      right_table, right_columns, right_key):
+    """
+    지정한 중간 테이블에서 왼쪽, 오른쪽 키와 외래 키로 이어지는 컬럼 찾기 (find_join_path의 두 단계 경로와 같음)
+
+    Returns:
+        (left_to_middle, middle_id) 또는 None
+    """
+    left_links = find_linked_columns(left_table, left_columns, left_key, middle_table, middle_columns)
+    right_links = find_linked_columns(right_table, right_columns, right_key, middle_table, middle_columns)
+    if not left_links or not right_links:
+        return None
+    return left_links[0], right_links[0]
+
+def read_csv_header(csv_file):
+    """
+    CSV 파일의 헤더(컬럼명)만 읽기
+
+    Returns:
+        컬럼명 리스트 (읽을 수 없으면 빈 리스트)
+    """
+    try:
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            return next(reader, [])
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return []
+
+def build_fk_edges(files):
+    """
+    카탈로그의 파일 정보로 FK 그래프의 간선 계산
+
+    Args:
+        files: {상대 경로: {'columns': [...], ...}}
+
+    Returns:
+        [[참조하는 파일, 참조 컬럼, 참조되는 파일, Primary Key 컬럼], ...]
+    """
+    primary_keys = {}
+    for path, info in files.items():
+        primary_key = find_primary_key(get_table_name(path), info['columns'])
+        if primary_key:
+            primary_keys[path] = primary_key
+
+    edges = []
+    for path, info in sorted(files.items()):
+        for target, target_primary_key in sorted(primary_keys.items()):
+            if target == path:
+                continue
+            for col in find_reference_columns(info['columns'], primary_keys.get(path),
+                                              get_table_name(target), target_primary_key):
+                edges.append([path, col, target, target_primary_key])
+    return edges
+
+def load_catalog(search_dir):
+    """
+    탐색 디렉토리의 CSV 카탈로그를 불러오고, 바뀐 파일만 다시 읽어 갱신
+    output 하위 디렉토리는 제외 (조인 결과 파일)
+
+    Args:
+        search_dir: 탐색 디렉토리
+
+    Returns:
+        {'version': ..., 'files': {상대 경로: {'size', 'mtime', 'columns'}}, 'edges': [...]}
+    """
+    catalog_file = os.path.join(search_dir, CATALOG_FILENAME)
+    catalog = None
+    if os.path.exists(catalog_file):
+        try:
+            with open(catalog_file, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+        except (OSError, ValueError):
+            catalog = None
+    if not catalog or catalog.get('version') != CATALOG_VERSION:
+        catalog = {'version': CATALOG_VERSION, 'files': {}, 'edges': []}
+
+    cached_files = catalog['files']
+    files = {}
+    changed = False
+    for root, dirs, filenames in os.walk(search_dir):
+        # output 하위 디렉토리 제외
+        dirs[:] = [d for d in dirs if d != 'output']
+        for filename in filenames:
+            if not filename.lower().endswith('.csv'):
+                continue
+            file_path = os.path.join(root, filename)
+            rel_path = os.path.relpath(file_path, search_dir).replace(os.sep, '/')
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            cached = cached_files.get(rel_path)
+            if cached and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime_ns:
+                files[rel_path] = cached
+            else:
+                files[rel_path] = {
+                    'size': stat.st_size,
+                    'mtime': stat.st_mtime_ns,
+                    'columns': read_csv_header(file_path),
+                }
+                changed = True
+
+    if changed or set(files) != set(cached_files):
+        catalog['files'] = files
+        catalog['edges'] = build_fk_edges(files)
+        try:
+            with open(catalog_file, 'w', encoding='utf-8') as f:
+                json.dump(catalog, f, ensure_ascii=False, indent=1)
+        except OSError:
+            # 캐시를 저장할 수 없어도 탐색은 계속
+            pass
+
+    return catalog
+
+def get_adjacency(catalog, search_dir, extra_files=()):
+    """
+    FK 간선을 양방향 인접 리스트로 변환
+    카탈로그 밖의 파일(extra_files, 예: 다른 폴더의 오른쪽 파일)은 헤더를 바로 읽어 간선 추가
+
+    Returns:
+        {절대 경로: [(내 컬럼, 상대 파일 절대 경로, 상대 컬럼), ...]}
+    """
+    files = {os.path.abspath(os.path.join(search_dir, path)): info['columns']
+             for path, info in catalog['files'].items()}
+    edges = [(os.path.abspath(os.path.join(search_dir, a)), col_a,
+              os.path.abspath(os.path.join(search_dir, b)), col_b)
+             for a, col_a, b, col_b in catalog['edges']]
+
+    for extra in extra_files:
+        extra = os.path.abspath(extra)
+        if extra in files:
+            continue
+        columns = read_csv_header(extra)
+        table_name = get_table_name(extra)
+        primary_key = find_primary_key(table_name, columns)
+        for path, path_columns in files.items():
+            path_table = get_table_name(path)
+            path_primary_key = find_primary_key(path_table, path_columns)
+            if path_primary_key:
+                for col in find_reference_columns(columns, primary_key, path_table, path_primary_key):
+                    edges.append((extra, col, path, path_primary_key))
+            if primary_key:
+                for col in find_reference_columns(path_columns, path_primary_key, table_name, primary_key):
+                    edges.append((path, col, extra, primary_key))
+        files[extra] = columns
+
+    adjacency = {}
+    for a, col_a, b, col_b in edges:
+        adjacency.setdefault(a, []).append((col_a, b, col_b))
+        adjacency.setdefault(b, []).append((col_b, a, col_a))
+
+    # 같은 거리면 탐색 디렉토리에 가까운 파일, 그다음 경로 순서로 우선
+    def order(item):
+        rel_path = os.path.relpath(item[1], search_dir)
+        return (rel_path.count(os.sep), rel_path, item[0], item[2])
+
+    for neighbors in adjacency.values():
+        neighbors.sort(key=order)
+    return adjacency
+
+def find_join_path(left_file, right_file, left_key, right_key, search_dir=None):
+    """
+    FK 그래프에서 너비 우선 탐색으로 왼쪽 파일에서 오른쪽 파일까지의 조인 경로 찾기
+    경로는 중간 테이블을 하나 이상 거치며, 첫 단계는 left_key, 마지막 단계는 right_key를 사용
+
+    Args:
+        left_file: 왼쪽 CSV 파일 경로
+        right_file: 오른쪽 CSV 파일 경로
+        left_key: 왼쪽 파일의 키 컬럼명
+        right_key: 오른쪽 파일의 키 컬럼명
+        search_dir: 탐색 디렉토리 (None이면 왼쪽 파일의 디렉토리)
+
+    Returns:
+        [(파일, 컬럼, 다음 파일, 다음 파일 컬럼), ...] 형태의 단계 리스트 (가장 짧은 경로) 또는 None
+    """
+    left_abs = os.path.abspath(left_file)
+    right_abs = os.path.abspath(right_file)
+    if search_dir is None:
+        search_dir = os.path.dirname(left_abs)
+    if not os.path.exists(search_dir):
+        return None
+
+    catalog = load_catalog(search_dir)
+    adjacency = get_adjacency(catalog, search_dir, [left_abs, right_abs])
+
+    queue = deque()
+    visited = {left_abs, right_abs}
+    for col, neighbor, neighbor_col in adjacency.get(left_abs, []):
+        if col == left_key and neighbor not in visited:
+            visited.add(neighbor)
+            queue.append((neighbor, [(left_abs, col, neighbor, neighbor_col)]))
+
+    while queue:
+        node, path = queue.popleft()
+        for col, neighbor, neighbor_col in adjacency.get(node, []):
+            if neighbor == right_abs:
+                if neighbor_col == right_key:
+                    return path + [(node, col, neighbor, neighbor_col)]
+                continue
+            if neighbor not in visited:
+                visited.add(neighbor)
+                queue.append((neighbor, path + [(node, col, neighbor, neighbor_col)]))
+
+    return None
+
+def main():
+    if len(sys.argv) not in [2, 6]:
+        print("사용법: python script/csv_catalog.py <data_dir>")
+        print("        python script/csv_catalog.py <data_dir> <left.csv> <right.csv> <left_key> <right_key>")
+        sys.exit(1)
+
+    search_dir = sys.argv[1]
+    if not os.path.isdir(search_dir):
+        print(f"오류: 디렉토리 '{search_dir}'을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    if len(sys.argv) == 2:
+        catalog = load_catalog(search_dir)
+        print(f"카탈로그: {os.path.join(search_dir, CATALOG_FILENAME)}")
+        print(f"CSV 파일 수: {len(catalog['files'])}개")
+        for path, info in sorted(catalog['files'].items()):
+            print(f"  {path} ({info['size']} bytes): {', '.join(info['columns'])}")
+        print(f"\n외래 키: {len(catalog['edges'])}개")
+        for a, col_a, b, col_b in catalog['edges']:
+            print(f"  {a}.{col_a} -> {b}.{col_b}")
+        return
+
+    left_file, right_file, left_key, right_key = sys.argv[2:6]
+    path = find_join_path(left_file, right_file, left_key, right_key, search_dir)
+    if not path:
+        print("조인 경로를 찾을 수 없습니다.")
+        sys.exit(1)
+    print("조인 경로:")
+    for a, col_a, b, col_b in path:
+        print(f"  {os.path.relpath(a, search_dir)}.{col_a} = {os.path.relpath(b, search_dir)}.{col_b}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+데이터베이스 빌드 파일 생성과 교체 (create_db_from_csv.py, create_db_from_ielts_csv.py 공용)
+데이터베이스를 출력 파일과 같은 디렉토리의 임시 빌드 파일에 만든 뒤, 무결성 검사를 통과하면
+WAL 모드로 바꾸고 출력 파일 자리에 원자적으로 이름을 바꾸어 넣는다.
+교체 전까지 기존 데이터베이스는 그대로이므로, 빌드 중에도 읽는 쪽(WPF 앱 등)은 항상 완전한 데이터베이스를 본다.
+
+-wal/-shm/-journal 부속 파일은 파일이 아닌 경로에 묶이므로, 기존 파일의 부속 파일이 남은 채 교체하면
+새 파일에 적용되어 데이터베이스가 깨질 수 있다. 그래서 교체 전에 기존 파일의 WAL을 반영하고 부속 파일을 정리한다.
+다른 연결(WPF 앱 등)이 열려 있어 정리할 수 없으면 잠시 간격을 늘려 가며 다시 시도하고, 그래도 열려 있으면
+부속 파일을 경로에서 지운 뒤 교체한다. 열린 연결은 이미 연 기존 파일과 부속 파일을 계속 쓰므로 다시 열 때까지
+이전 내용을 보며, 그동안 기존 파일에 쓴 내용은 새 파일에 반영되지 않는다.
+Windows에서는 열린 파일을 지우거나 교체할 수 없으므로, 이때는 교체하지 않고 종료한다.
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+# 빌드 파일과 함께 생길 수 있는 SQLite 부속 파일 접미사
+SIDECAR_SUFFIXES = ['-journal', '-wal', '-shm']
+# 기존 출력 파일의 부속 파일 정리 시도 횟수와 시도마다의 잠금 대기 시간(초)
+RELEASE_ATTEMPTS = 5
+RELEASE_TIMEOUT = 1
+
+def get_build_path(output_db):
+    """
+    출력 파일과 같은 디렉토리의 빌드 파일 경로 (같은 파일 시스템이어야 이름 바꾸기가 원자적)
+    """
+    output_db = os.path.abspath(output_db)
+    directory, filename = os.path.split(output_db)
+    return os.path.join(directory, f".{filename}.build-{os.getpid()}")
+
+def discard_build(build_db):
+    """
+    빌드 파일과 부속 파일 삭제
+    """
+    for path in [build_db] + [build_db + suffix for suffix in SIDECAR_SUFFIXES]:
+        if os.path.exists(path):
+            os.remove(path)
+
+def start_build(output_db, base_db=None):
+    """
+    빌드 파일 준비
+
+    Args:
+        output_db: 최종 출력 데이터베이스 파일 경로
+        base_db: 빌드 파일에 먼저 복사해 둘 데이터베이스 (증분 생성용, None이면 빈 파일에서 시작)
+                 SQLite 백업 API로 복사하므로 다른 연결이 읽고 있어도 일관된 내용을 복사한다.
+
+    Returns:
+        빌드 파일 경로
+    """
+    build_db = get_build_path(output_db)
+    discard_build(build_db)
+    if base_db is not None:
+        source = sqlite3.connect(base_db)
+        target = sqlite3.connect(build_db)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+    return build_db
+
+def release_output(output_db):
+    """
+    교체 전 기존 출력 파일의 부속 파일 정리
+    부속 파일이 있으면 기존 파일을 롤백 저널(DELETE) 모드로 바꾸어 WAL 내용을 반영하고 부속 파일을 지운다.
+    저널 모드는 다른 연결이 없을 때만 바꿀 수 있으므로, 바꾸지 못하면 간격을 늘려 가며
+    RELEASE_ATTEMPTS번까지 다시 시도하고 그래도 안 되면 사용 중인 것으로 보고 False
+
+    Returns:
+        부속 파일이 없으면 True
+    """
+    sidecars = [output_db + suffix for suffix in SIDECAR_SUFFIXES]
+    for attempt in range(RELEASE_ATTEMPTS):
+        if not any(os.path.exists(path) for path in sidecars):
+            return True
+        if attempt:
+            time.sleep(0.1 * 2 ** attempt)
+        try:
+            conn = sqlite3.connect(output_db, timeout=RELEASE_TIMEOUT)
+            try:
+                conn.execute("PRAGMA journal_mode = DELETE").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+    return not any(os.path.exists(path) for path in sidecars)
+
+def detach_output(output_db):
+    """
+    다른 연결이 열려 있는 기존 출력 파일의 부속 파일을 경로에서 삭제
+    열린 연결은 이미 연 부속 파일을 계속 쓰고 (POSIX에서는 지워도 열린 파일은 남음), 교체 후 여는 연결은
+    새 파일의 부속 파일을 새로 만든다. (SQLite는 데이터베이스 파일이 교체된 연결을 닫을 때 체크포인트와
+    부속 파일 삭제를 하지 않으므로 새 파일의 부속 파일을 건드리지 않는다)
+
+    Returns:
+        삭제했으면 True, 열린 파일을 지울 수 없으면 (Windows) False
+    """
+    if os.name == 'nt':
+        return False
+    for path in [output_db + suffix for suffix in SIDECAR_SUFFIXES]:
+        if os.path.exists(path):
+            os.remove(path)
+    return True
+
+def publish_build(build_db, output_db):
+    """
+    빌드 파일을 검사한 뒤 WAL 모드로 바꾸고 출력 파일 자리에 원자적으로 교체
+    무결성 검사에 실패하면 빌드 파일을 지우고 종료하며, 기존 출력 파일은 그대로 둔다.
+    기존 출력 파일을 연 연결(WPF 앱 등)이 있으면 부속 파일을 떼어 내고 교체하며, 그 연결은 다시 열 때까지
+    이전 내용을 본다. (Windows에서는 열린 파일을 교체할 수 없으므로 빌드 파일을 지우고 종료)
+
+    Args:
+        build_db: 빌드 파일 경로 (모든 연결을 닫은 상태여야 함)
+        output_db: 최종 출력 데이터베이스 파일 경로
+    """
+    conn = sqlite3.connect(build_db)
+    try:
+        result = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+        if result != ['ok']:
+            conn.close()
+            discard_build(build_db)
+            print("오류: 새 데이터베이스의 무결성 검사에 실패하여 교체하지 않습니다.")
+            for message in result[:10]:
+                print(f"  {message}")
+            sys.exit(1)
+        # WAL 모드는 파일에 기록되므로 교체 후에 여는 연결은 읽는 동안 쓰기를 막지 않음
+        # (마지막 연결을 닫을 때 WAL 내용이 데이터베이스 파일에 반영되어 파일 하나만 남음)
+        conn.execute("PRAGMA journal_mode = WAL").fetchall()
+    finally:
+        conn.close()
+
+    replaced = os.path.exists(output_db)
+    if replaced and not release_output(output_db):
+        if not detach_output(output_db):
+            discard_build(build_db)
+            print(f"오류: 기존 데이터베이스 파일 '{output_db}'을 다른 프로그램이 사용 중이어서 교체하지 않습니다.")
+            print("      (-wal/-shm 파일을 정리할 수 없음) 데이터베이스를 연 프로그램을 닫은 뒤 다시 실행하세요.")
+            sys.exit(1)
+        print(f"경고: 기존 데이터베이스 파일 '{output_db}'을 다른 프로그램이 열고 있습니다.")
+        print("      그대로 교체하며, 열려 있는 연결은 다시 열 때까지 이전 내용을 봅니다.")
+    try:
+        os.replace(build_db, output_db)
+    except PermissionError:
+        discard_build(build_db)
+        print(f"오류: 기존 데이터베이스 파일 '{output_db}'을 다른 프로그램이 사용 중이어서 교체할 수 없습니다.")
+        print("      데이터베이스를 연 프로그램을 닫은 뒤 다시 실행하세요.")
+        sys.exit(1)
+    if replaced:
+        print(f"기존 데이터베이스 파일 '{output_db}'을 새 파일로 교체했습니다.")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+WPF 앱(SQLiteQueries.cs)의 쿼리 실행 계획(EXPLAIN QUERY PLAN) 비교 리포트
+SQLiteQueries.cs의 쿼리 상수를 그대로 읽어 데이터베이스마다 실행 계획을 출력하고,
+ORDER BY를 위해 임시 B-트리 정렬(USE TEMP B-TREE)을 하는 쿼리와 인덱스를 거쳐 테이블을 다시 찾는
+(커버링이 아닌) 단계 수를 요약한다.
+create_db_from_ielts_csv.py의 --layout rowid / --layout clustered로 만든 데이터베이스를 비교할 때 사용한다.
+
+사용법: python script/explain_queries.py <db_file> [db_file2 ...] [--queries <SQLiteQueries.cs>]
+예시: python script/explain_queries.py data/rowid.db data/clustered.db
+"""
+
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+# 기본 쿼리 파일 (WPF 앱)
+DEFAULT_QUERIES_FILE = Path(__file__).resolve().parent.parent / 'WpfAppCvoca' / 'WpfAppCvoca' / 'Services' / 'SQLiteQueries.cs'
+
+# public const string 이름 = @"...";
+QUERY_PATTERN = re.compile(r'public\s+const\s+string\s+(\w+)\s*=\s*@"(.*?)";', re.S)
+# @파라미터
+PARAMETER_PATTERN = re.compile(r'@(\w+)')
+
+def load_queries(queries_file):
+    """
+    SQLiteQueries.cs에서 쿼리 상수 읽기
+
+    Returns:
+        [(쿼리 이름, SQL), ...] (파일에 나온 순서)
+    """
+    with open(queries_file, 'r', encoding='utf-8') as f:
+        source = f.read()
+    # C# 축자 문자열의 "" 는 큰따옴표 하나
+    return [(name, sql.replace('""', '"').strip().rstrip(';'))
+            for name, sql in QUERY_PATTERN.findall(source)]
+
+def explain_query(conn, sql):
+    """
+    쿼리의 실행 계획 단계 목록 (파라미터는 모두 NULL로 바인딩)
+    """
+    parameters = {name: None for name in PARAMETER_PATTERN.findall(sql)}
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", parameters)]
+
+def is_temp_sort(step):
+    """
+    ORDER BY / GROUP BY를 위한 임시 B-트리 정렬 단계인지 여부
+    """
+    return step.startswith('USE TEMP B-TREE')
+
+def is_table_lookup(step):
+    """
+    인덱스로 찾은 뒤 테이블 행을 다시 읽는 단계인지 여부 (커버링 인덱스, 기본 키, 테이블 스캔은 제외)
+    """
+    return ' USING INDEX ' in step
+
+def explain_databases(db_files, queries):
+    """
+    데이터베이스별 실행 계획 출력 후 요약
+
+    Args:
+        db_files: 데이터베이스 파일 경로 목록
+        queries: [(쿼리 이름, SQL), ...]
+    """
+    connections = []
+    for db_file in db_files:
+        if not os.path.exists(db_file):
+            print(f"오류: 데이터베이스 파일 '{db_file}'을 찾을 수 없습니다.")
+            sys.exit(1)
+        # 읽기 전용으로 열기 (실행 계획만 확인)
+        connections.append(sqlite3.connect(Path(db_file).resolve().as_uri() + '?mode=ro', uri=True))
+
+    # {데이터베이스 순번: (임시 정렬 쿼리 수, 테이블 재조회 단계 수)}
+    totals = [[0, 0] for _ in db_files]
+    summary = []
+    try:
+        for name, sql in queries:
+            print(f"=== {name} ===")
+            row = [name]
+            for index, (db_file, conn) in enumerate(zip(db_files, connections)):
+                try:
+                    steps = explain_query(conn, sql)
+                except sqlite3.Error as e:
+                    print(f"  [{db_file}] 오류: {e}")
+                    row.append('오류')
+                    continue
+                print(f"  [{db_file}]")
+                for step in steps:
+                    print(f"    {step}")
+                temp_sorts = sum(1 for step in steps if is_temp_sort(step))
+                lookups = sum(1 for step in steps if is_table_lookup(step))
+                totals[index][0] += 1 if temp_sorts else 0
+                totals[index][1] += lookups
+                row.append(f"{'정렬' if temp_sorts else '-'} / {lookups}")
+            summary.append(row)
+            print()
+    finally:
+        for conn in connections:
+            conn.close()
+
+    # 요약: 쿼리별 (임시 정렬 여부 / 테이블 재조회 단계 수)
+    print("=== 요약 (임시 B-트리 정렬 / 인덱스 후 테이블 재조회 단계 수) ===")
+    name_width = max(len(name) for name, _ in queries) if queries else 10
+    column_width = max(12, max(len(os.path.basename(db_file)) for db_file in db_files))
+    header = f"{'쿼리':<{name_width}}  " + '  '.join(f"{os.path.basename(db_file):<{column_width}}" for db_file in db_files)
+    print(header)
+    print('-' * len(header))
+    for row in summary:
+        print(f"{row[0]:<{name_width}}  " + '  '.join(f"{cell:<{column_width}}" for cell in row[1:]))
+    print('-' * len(header))
+    print(f"{'합계':<{name_width}}  " + '  '.join(f"{f'정렬 {sorts}개 / {lookups}':<{column_width}}" for sorts, lookups in totals))
+
+def main():
+    if len(sys.argv) < 2:
+        print("사용법: python script/explain_queries.py <db_file> [db_file2 ...] [--queries <SQLiteQueries.cs>]")
+        print("예시: python script/explain_queries.py data/rowid.db data/clustered.db")
+        print("\n옵션:")
+        print(f"  --queries: 쿼리 파일 (기본값: {DEFAULT_QUERIES_FILE})")
+        sys.exit(1)
+
+    # 인자 파싱
+    args = sys.argv[1:]
+    queries_file = DEFAULT_QUERIES_FILE
+    if '--queries' in args:
+        index = args.index('--queries')
+        if index + 1 >= len(args):
+            print("오류: --queries 옵션에 쿼리 파일 경로가 필요합니다.")
+            sys.exit(1)
+        queries_file = Path(args[index + 1])
+        del args[index:index + 2]
+
+    if not os.path.exists(queries_file):
+        print(f"오류: 쿼리 파일 '{queries_file}'을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    queries = load_queries(queries_file)
+    if not queries:
+        print(f"오류: 쿼리 파일 '{queries_file}'에서 쿼리를 찾을 수 없습니다.")
+        sys.exit(1)
+
+    explain_databases(args, queries)
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,48 @@
 데이터베이스의 모든 테이블을 각각 CSV 파일로 내보내는 스크립트
 각 테이블은 테이블명.csv 파일로 저장됩니다.
 
-사용법: python script/export_all_tables_to_csv.py <db_file> [output_dir] [--overwrite]
+모든 테이블은 같은 시점의 데이터(하나의 스냅샷)에서 읽습니다.
+출력 디렉토리의 export_manifest.json에 테이블별 내용 해시(digest)와 쓴 CSV 파일의 크기·수정 시각을 기록해 두고,
+다음 실행 때 내용이 그대로인 테이블은 다시 쓰지 않고 건너뜁니다.
+--overwrite가 없으면 내보낸 뒤 수정된 CSV 파일(과 기록에 없는 기존 파일)은 덮어쓰지 않고 건너뜁니다.
+--delta를 주면 지난 --delta 내보내기 이후 바뀐 행만 delta/ 디렉토리에 씁니다.
+    delta/테이블명.csv: 추가되거나 바뀐 행 (import_csv_to_db.py -rf로 그대로 반영 가능)
+    delta/테이블명.deleted.csv: 삭제된 행의 기본 키
+
+사용법: python script/export_all_tables_to_csv.py <db_file> [output_dir] [--overwrite] [--jobs N] [--delta]
 예시: python script/export_all_tables_to_csv.py vocabulary.db
       python script/export_all_tables_to_csv.py vocabulary.db data/output
       python script/export_all_tables_to_csv.py vocabulary.db data/output --overwrite
+      python script/export_all_tables_to_csv.py vocabulary.db data/output --jobs 4
+      python script/export_all_tables_to_csv.py vocabulary.db data/output --delta
 """
 
+import ast
 import csv
+import hashlib
+import json
+import multiprocessing
 import sqlite3
 import sys
 import os
+import threading
+from pathlib import Path
+
+# fetchmany 한 번에 읽는 행 수
+FETCH_SIZE = 10000
+# 테이블별 내용 해시를 기록하는 파일 (출력 디렉토리 안)
+MANIFEST_FILE = 'export_manifest.json'
+MANIFEST_VERSION = 1
+# --delta 출력 디렉토리와 행 해시 기준 디렉토리 (출력 디렉토리 안, 테이블마다 파일 하나)
+DELTA_DIR = 'delta'
+STATE_DIR = '.export_state'
+# --jobs에서 작업 프로세스들의 스냅샷을 맞추는 시도 횟수와 barrier 대기 시간(초)
+SNAPSHOT_ATTEMPTS = 5
+SNAPSHOT_TIMEOUT = 30
+# 스냅샷 맞추기 상태 (작업 프로세스와 공유)
+SNAPSHOT_PENDING = 0
+SNAPSHOT_PINNED = 1
+SNAPSHOT_FAILED = 2
 
 
 def get_table_schema(cursor, table_name):
@@ -86,36 +118,493 @@ def export_table_to_csv(cursor, table_name, output_file, force=False):
     reverse_mapping = get_reverse_column_mapping(db_columns)
     csv_columns = [reverse_mapping.get(col, col) for col in db_columns]
     
-    # 데이터 가져오기
+    # 데이터를 FETCH_SIZE행씩 읽어 바로 CSV 파일로 저장 (테이블 크기와 무관한 메모리 사용)
+    # 행은 DB 컬럼 순서 그대로 쓰고, 컬럼명 변환은 헤더에만 적용 (csv.writer는 None을 빈 문자열로 씀)
     cursor.execute(f"SELECT * FROM {table_name}")
-    rows = cursor.fetchall()
-    
-    # CSV 파일로 저장
+    row_count = 0
     with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=csv_columns)
-        writer.writeheader()
+        writer = csv.writer(outfile)
+        writer.writerow(csv_columns)
+        
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            writer.writerows(rows)
+            row_count += len(rows)
+    
+    return row_count
+
+
+def get_primary_key_columns(schema):
+    """
+    스키마에서 기본 키 컬럼명 리스트 (복합 키는 키 순서대로, 기본 키가 없으면 모든 컬럼)
+    """
+    pk_columns = sorted((col for col in schema if col[5]), key=lambda col: col[5])
+    return [col[1] for col in (pk_columns or schema)]
+
+
+def compute_table_digest(cursor, table_name, db_columns):
+    """
+    테이블 내용 해시 계산 (컬럼 목록도 해시에 넣어 스키마가 바뀌면 다른 해시가 됨)
+    CSV로 바꾸는 것보다 가벼우므로, 이 값으로 변경 여부를 먼저 확인한 뒤 바뀐 테이블만 CSV로 쓴다.
+    
+    Returns:
+        (16진수 해시, 행 수)
+    """
+    digest = hashlib.blake2b(repr(db_columns).encode('utf-8'), digest_size=16)
+    cursor.execute(f"SELECT * FROM {table_name}")
+    row_count = 0
+    while True:
+        rows = cursor.fetchmany(FETCH_SIZE)
+        if not rows:
+            break
+        digest.update(('\n'.join(map(repr, rows)) + '\n').encode('utf-8'))
+        row_count += len(rows)
+    return digest.hexdigest(), row_count
+
+
+def load_manifest(output_dir):
+    """
+    출력 디렉토리의 매니페스트 읽기
+    
+    Returns:
+        {테이블명: {'csv': {'digest', 'row_count', 'size', 'mtime_ns'}, 'delta': {'digest', 'row_count'}}}
+        (파일이 없거나 읽을 수 없으면 빈 딕셔너리)
+    """
+    manifest_file = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_file):
+        return {}
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"경고: 매니페스트 '{manifest_file}'을 읽을 수 없어 모든 테이블을 다시 내보냅니다: {e}")
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('tables', {})
+
+
+def save_manifest(output_dir, db_file, tables):
+    """
+    매니페스트 저장 (임시 파일에 쓴 뒤 이름 바꾸기로 교체)
+    """
+    manifest_file = os.path.join(output_dir, MANIFEST_FILE)
+    temp_file = manifest_file + '.tmp'
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'db_file': os.path.abspath(db_file),
+        'tables': tables,
+    }
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(temp_file, manifest_file)
+
+
+def get_file_stamp(path):
+    """
+    파일 크기와 수정 시각(ns) (매니페스트에 기록하여 내보낸 뒤 파일이 수정되었는지 확인)
+    """
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def remove_files(*paths):
+    """
+    있는 파일만 삭제
+    """
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def export_table_delta(cursor, table_name, delta_file, deleted_file, state_file):
+    """
+    지난 --delta 내보내기 이후 바뀐 행만 CSV로 내보내기
+    state_file(SQLite)에 기본 키별 행 해시를 기록해 두고, 해시가 다르거나 새로 생긴 행은 delta_file에,
+    없어진 행의 기본 키는 deleted_file에 쓴 뒤 기록을 현재 내용으로 갱신한다.
+    (기록이 없으면 모든 행을 새 행으로 내보냄, 기본 키가 없는 테이블은 행 전체를 키로 사용)
+    
+    Args:
+        cursor: 데이터베이스 커서
+        table_name: 테이블명
+        delta_file: 추가·변경 행 CSV 파일 경로
+        deleted_file: 삭제된 행 CSV 파일 경로 (삭제된 행이 없으면 만들지 않음)
+        state_file: 행 해시 기록 파일 경로
         
-        for row in rows:
-            # DB 컬럼 순서대로 딕셔너리 생성
-            row_dict = {}
-            for i, db_col in enumerate(db_columns):
-                csv_col = reverse_mapping.get(db_col, db_col)
-                value = row[i] if row[i] is not None else ''
-                row_dict[csv_col] = value
+    Returns:
+        (추가·변경 행 수, 삭제된 행 수)
+    """
+    # 테이블 스키마 가져오기
+    schema = get_table_schema(cursor, table_name)
+    db_columns = [col[1] for col in schema]
+    key_columns = get_primary_key_columns(schema)
+    key_indices = [db_columns.index(col) for col in key_columns]
+    
+    # 역매핑 생성 (DB 컬럼 -> CSV 컬럼)
+    reverse_mapping = get_reverse_column_mapping(db_columns)
+    csv_columns = [reverse_mapping.get(col, col) for col in db_columns]
+    key_csv_columns = [reverse_mapping.get(col, col) for col in key_columns]
+    
+    os.makedirs(os.path.dirname(delta_file), exist_ok=True)
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
+    
+    state = sqlite3.connect(state_file)
+    try:
+        state.execute(
+            "CREATE TABLE IF NOT EXISTS row_hashes (row_key TEXT PRIMARY KEY, row_hash BLOB NOT NULL) WITHOUT ROWID"
+        )
+        state.execute("CREATE TEMP TABLE batch (row_key TEXT, row_hash BLOB)")
+        state.execute("CREATE TEMP TABLE seen (row_key TEXT PRIMARY KEY) WITHOUT ROWID")
+        
+        # 행을 FETCH_SIZE개씩 읽어 기록된 해시와 비교하고, 바뀐 행만 바로 CSV에 씀
+        cursor.execute(f"SELECT * FROM {table_name}")
+        changed_count = 0
+        with open(delta_file, 'w', encoding='utf-8', newline='') as outfile:
+            writer = csv.writer(outfile)
+            writer.writerow(csv_columns)
             
-            writer.writerow(row_dict)
+            while True:
+                rows = cursor.fetchmany(FETCH_SIZE)
+                if not rows:
+                    break
+                
+                # 키는 기본 키 값 튜플의 repr (삭제된 행의 키 값을 되살릴 수 있도록)
+                hashes = [(repr(tuple(row[i] for i in key_indices)),
+                           hashlib.blake2b(repr(row).encode('utf-8'), digest_size=16).digest())
+                          for row in rows]
+                state.execute("DELETE FROM temp.batch")
+                state.executemany("INSERT INTO temp.batch (row_key, row_hash) VALUES (?, ?)", hashes)
+                changed_keys = {row_key for (row_key,) in state.execute(
+                    "SELECT b.row_key FROM temp.batch AS b LEFT JOIN row_hashes AS r ON r.row_key = b.row_key "
+                    "WHERE r.row_hash IS NOT b.row_hash"
+                )}
+                if changed_keys:
+                    changed_rows = [row for row, (row_key, _) in zip(rows, hashes) if row_key in changed_keys]
+                    writer.writerows(changed_rows)
+                    changed_count += len(changed_rows)
+                    state.execute(
+                        "INSERT INTO row_hashes (row_key, row_hash) SELECT row_key, row_hash FROM temp.batch WHERE true "
+                        "ON CONFLICT(row_key) DO UPDATE SET row_hash = excluded.row_hash"
+                    )
+                state.execute("INSERT OR IGNORE INTO temp.seen (row_key) SELECT row_key FROM temp.batch")
+        
+        # 이번에 보이지 않은 키는 삭제된 행
+        deleted_count = 0
+        remove_files(deleted_file)
+        deleted_cursor = state.execute(
+            "SELECT row_key FROM row_hashes WHERE row_key NOT IN (SELECT row_key FROM temp.seen)"
+        )
+        keys = deleted_cursor.fetchmany(FETCH_SIZE)
+        if keys:
+            with open(deleted_file, 'w', encoding='utf-8', newline='') as outfile:
+                writer = csv.writer(outfile)
+                writer.writerow(key_csv_columns)
+                while keys:
+                    writer.writerows(ast.literal_eval(row_key) for (row_key,) in keys)
+                    deleted_count += len(keys)
+                    keys = deleted_cursor.fetchmany(FETCH_SIZE)
+            state.execute("DELETE FROM row_hashes WHERE row_key NOT IN (SELECT row_key FROM temp.seen)")
+        
+        state.commit()
+    finally:
+        state.close()
+    
+    return changed_count, deleted_count
+
+
+def export_table_incremental(cursor, table_name, output_dir, entry, force=False, delta=False):
+    """
+    테이블 내용 해시를 매니페스트 기록과 비교하여 바뀐 테이블만 내보내기
+    
+    Args:
+        cursor: 데이터베이스 커서
+        table_name: 테이블명
+        output_dir: 출력 디렉토리
+        entry: 매니페스트의 테이블 기록 (없으면 빈 딕셔너리)
+        force: 기록과 상관없이 다시 내보낼지 여부 (--delta면 행 해시 기록도 지우고 모든 행을 내보냄)
+        delta: 바뀐 행만 delta/ 디렉토리에 내보낼지 여부
+        
+    Returns:
+        (상태, 행 수, 새 테이블 기록, (추가·변경 행 수, 삭제된 행 수) 또는 None)
+        상태: 'exported'(내보냄), 'unchanged'(변경 없어 건너뜀),
+              'existing'(기록에 없거나 내보낸 뒤 수정된 기존 파일이라 건너뜀)
+    """
+    schema = get_table_schema(cursor, table_name)
+    db_columns = [col[1] for col in schema]
+    digest, row_count = compute_table_digest(cursor, table_name, db_columns)
+    new_entry = dict(entry)
+    
+    if delta:
+        delta_file = os.path.join(output_dir, DELTA_DIR, f"{table_name}.csv")
+        deleted_file = os.path.join(output_dir, DELTA_DIR, f"{table_name}.deleted.csv")
+        state_file = os.path.join(output_dir, STATE_DIR, f"{table_name}.db")
+        previous = entry.get('delta')
+        
+        if force:
+            remove_files(state_file)
+        elif previous and previous['digest'] == digest and os.path.exists(state_file):
+            # 지난번 delta 파일은 이번 실행의 변경분이 아니므로 삭제
+            remove_files(delta_file, deleted_file)
+            return 'unchanged', row_count, new_entry, None
+        
+        changes = export_table_delta(cursor, table_name, delta_file, deleted_file, state_file)
+        new_entry['delta'] = {'digest': digest, 'row_count': row_count}
+        return 'exported', row_count, new_entry, changes
+    
+    csv_file = os.path.join(output_dir, f"{table_name}.csv")
+    previous = entry.get('csv')
+    if not force and os.path.exists(csv_file):
+        # 지난번에 쓴 그대로인 파일만 내보내기 결과로 보고 덮어씀 (CSV를 고친 뒤 가져오는 작업을 잃지 않도록)
+        if not previous or {key: previous.get(key) for key in ('size', 'mtime_ns')} != get_file_stamp(csv_file):
+            print(f"  경고: 파일 '{csv_file}'이 이미 존재합니다. 건너뜁니다.")
+            if previous:
+                print("        (마지막 내보내기 이후 수정된 파일입니다. 덮어쓰려면 --overwrite를 쓰세요)")
+            return 'existing', 0, new_entry, None
+        if previous['digest'] == digest:
+            return 'unchanged', row_count, new_entry, None
+    
+    export_table_to_csv(cursor, table_name, csv_file, force=True)
+    new_entry['csv'] = {'digest': digest, 'row_count': row_count, **get_file_stamp(csv_file)}
+    return 'exported', row_count, new_entry, None
+
+
+def describe_result(status, row_count, changes):
+    """
+    export_table_incremental 결과를 한 줄 메시지로
+    """
+    if status == 'unchanged':
+        return f"변경 없음: 건너뜀 ({row_count}개 행)"
+    if status == 'existing':
+        return "기존 파일: 건너뜀"
+    if changes is not None:
+        changed_count, deleted_count = changes
+        return f"완료: 추가·변경 {changed_count}개 행, 삭제 {deleted_count}개 행 (전체 {row_count}개 행)"
+    return f"완료: {row_count}개 행 내보냄"
+
+
+def connect_read_only(db_file):
+    """
+    읽기 전용(mode=ro) 자동 커밋 연결 열기
+    """
+    uri = Path(db_file).resolve().as_uri() + '?mode=ro'
+    return sqlite3.connect(uri, uri=True, isolation_level=None)
+
+
+def begin_snapshot(conn):
+    """
+    읽기 트랜잭션 시작
+    트랜잭션이 끝날 때까지 연결은 처음 읽은 시점의 데이터(스냅샷)만 본다.
+    (BEGIN만으로는 스냅샷이 정해지지 않으므로 첫 읽기까지 실행)
+    """
+    conn.execute("BEGIN")
+    conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+
+
+def open_snapshot_connection(db_file):
+    """
+    읽기 트랜잭션을 시작한 읽기 전용 연결 열기
+    
+    Args:
+        db_file: SQLite 데이터베이스 파일 경로
+        
+    Returns:
+        연결
+    """
+    conn = connect_read_only(db_file)
+    begin_snapshot(conn)
+    return conn
+
+
+def close_snapshot_connection(conn):
+    """
+    스냅샷 연결의 읽기 트랜잭션을 끝내고 닫기
+    """
+    if conn.in_transaction:
+        conn.execute("COMMIT")
+    conn.close()
+
+
+# 작업 프로세스의 스냅샷 연결과 연결 오류 (init_export_worker에서 설정)
+_worker_conn = None
+_worker_error = None
+
+
+def init_export_worker(db_file, barrier, state):
+    """
+    작업 프로세스 초기화: 부모 프로세스와 barrier로 맞추어 스냅샷 연결의 읽기 트랜잭션을 시작
+    한 번의 시도는 barrier 세 번(부모 스냅샷 시작, 모든 작업 프로세스 시작, 부모 판정)으로 이루어지고,
+    state가 SNAPSHOT_PENDING이면 트랜잭션을 끝내고 다시 시도한다.
+    오류는 저장해 두고 작업에서 알린다. (오류가 나도 barrier는 통과해야 부모 프로세스가 기다리지 않음)
+    스냅샷이 정해진 뒤 다시 시작된 작업 프로세스(앞 프로세스가 죽은 경우)는 같은 스냅샷을 읽을 수 없으므로
+    barrier를 기다리지 않고 오류만 저장한다.
+    """
+    global _worker_conn, _worker_error
+    if state.value != SNAPSHOT_PENDING:
+        _worker_error = RuntimeError("스냅샷을 정한 뒤 다시 시작된 작업 프로세스라 같은 시점의 데이터를 읽을 수 없습니다")
+        return
+    try:
+        _worker_conn = connect_read_only(db_file)
+    except sqlite3.Error as e:
+        _worker_error = e
+    try:
+        while True:
+            barrier.wait(SNAPSHOT_TIMEOUT)
+            if _worker_error is None:
+                try:
+                    begin_snapshot(_worker_conn)
+                except sqlite3.Error as e:
+                    _worker_error = e
+            barrier.wait(SNAPSHOT_TIMEOUT)
+            barrier.wait(SNAPSHOT_TIMEOUT)
+            if state.value != SNAPSHOT_PENDING:
+                break
+            if _worker_conn is not None and _worker_conn.in_transaction:
+                _worker_conn.execute("COMMIT")
+    except threading.BrokenBarrierError:
+        _worker_error = RuntimeError("부모 프로세스와 스냅샷을 맞추지 못했습니다")
+    if _worker_error is None and state.value != SNAPSHOT_PINNED:
+        _worker_error = RuntimeError("부모 프로세스와 스냅샷을 맞추지 못했습니다")
+
+
+def export_table_in_worker(task):
+    """
+    작업 프로세스에서 테이블 하나를 내보내기 (export_table_incremental)
+    
+    Args:
+        task: (테이블명, 출력 디렉토리, 매니페스트의 테이블 기록, force, delta)
+        
+    Returns:
+        (테이블명, export_table_incremental 결과 또는 None, 오류 메시지 또는 None)
+    """
+    table_name, output_dir, entry, force, delta = task
+    try:
+        if _worker_error is not None:
+            raise _worker_error
+        return table_name, export_table_incremental(_worker_conn.cursor(), table_name, output_dir, entry, force, delta), None
+    except Exception as e:
+        return table_name, None, str(e)
+
+
+def open_snapshot(db_file, jobs):
+    """
+    내보내기에 쓸 스냅샷 열기
+    jobs가 1이면 읽기 트랜잭션을 시작한 연결 하나만 열고,
+    2 이상이면 같은 스냅샷을 읽는 작업 프로세스 jobs개의 프로세스 풀도 함께 시작한다.
+    (CSV 변환은 GIL을 잡고 하므로 스레드가 아닌 프로세스로 나눔)
     
-    return len(rows)
+    모든 연결은 읽기 전용(mode=ro)이며 잠금을 잡지 않으므로 앱의 쓰기를 막지 않는다.
+    (sqlite3 모듈에는 sqlite3_snapshot_open이 없어 스냅샷을 직접 넘길 수 없음)
+    대신 이 프로세스와 작업 프로세스들이 barrier로 맞추어 거의 동시에 읽기 트랜잭션을 시작하고,
+    그 전후의 PRAGMA data_version이 같으면 그 사이에 다른 연결의 커밋이 없었으므로 모든 연결이 같은 스냅샷을 읽는다.
+    커밋이 끼어들면 SNAPSHOT_ATTEMPTS번까지 다시 시도하고, 그래도 맞추지 못하거나 작업 프로세스가
+    SNAPSHOT_TIMEOUT초 안에 준비되지 않으면 경고를 출력하고 프로세스 풀 없이 연결 하나로 내보낸다.
+    
+    Args:
+        db_file: SQLite 데이터베이스 파일 경로
+        jobs: 작업 프로세스 수
+        
+    Returns:
+        (연결, 프로세스 풀 또는 None)
+    """
+    try:
+        if jobs == 1:
+            return open_snapshot_connection(db_file), None
+        conn = connect_read_only(db_file)
+        monitor = connect_read_only(db_file)
+    except sqlite3.Error as e:
+        print(f"오류: 데이터베이스 '{db_file}'을 열 수 없습니다: {e}")
+        sys.exit(1)
+    
+    state = multiprocessing.Value('i', SNAPSHOT_PENDING)
+    barrier = multiprocessing.Barrier(jobs + 1)
+    # 작업 프로세스를 교체하지 않음 (교체된 프로세스는 같은 스냅샷을 읽을 수 없음)
+    pool = multiprocessing.Pool(jobs, initializer=init_export_worker, initargs=(db_file, barrier, state),
+                                maxtasksperchild=None)
+    try:
+        for attempt in range(SNAPSHOT_ATTEMPTS):
+            data_version = monitor.execute("PRAGMA data_version").fetchone()[0]
+            begin_snapshot(conn)
+            barrier.wait(SNAPSHOT_TIMEOUT)
+            barrier.wait(SNAPSHOT_TIMEOUT)
+            if monitor.execute("PRAGMA data_version").fetchone()[0] == data_version:
+                state.value = SNAPSHOT_PINNED
+            elif attempt == SNAPSHOT_ATTEMPTS - 1:
+                state.value = SNAPSHOT_FAILED
+            barrier.wait(SNAPSHOT_TIMEOUT)
+            if state.value == SNAPSHOT_PINNED:
+                return conn, pool
+            conn.execute("COMMIT")
+        reason = f"다른 연결의 커밋이 계속되어 {SNAPSHOT_ATTEMPTS}번 시도하는 동안"
+    except threading.BrokenBarrierError:
+        state.value = SNAPSHOT_FAILED
+        reason = f"작업 프로세스가 {SNAPSHOT_TIMEOUT}초 안에 준비되지 않아"
+    except sqlite3.Error as e:
+        pool.terminate()
+        pool.join()
+        print(f"오류: 데이터베이스 '{db_file}'을 읽을 수 없습니다: {e}")
+        sys.exit(1)
+    finally:
+        monitor.close()
+    
+    pool.terminate()
+    pool.join()
+    print(f"경고: {reason} 작업 프로세스들의 스냅샷을 맞추지 못했습니다. 연결 하나로 내보냅니다.")
+    if conn.in_transaction:
+        conn.execute("COMMIT")
+    begin_snapshot(conn)
+    return conn, None
+
+
+def close_snapshot(conn, pool=None):
+    """
+    스냅샷 연결의 읽기 트랜잭션을 끝내고 닫기 (프로세스 풀이 있으면 작업 프로세스도 종료)
+    """
+    if pool is not None:
+        pool.close()
+        pool.join()
+    close_snapshot_connection(conn)
 
 
-def export_all_tables_to_csv(db_file, output_dir=None, force=False):
+def export_tables_concurrently(pool, tables, output_dir, manifest, force, delta):
+    """
+    테이블들을 프로세스 풀에서 동시에 내보내기
+    
+    Args:
+        pool: open_snapshot으로 시작한 프로세스 풀
+        tables: 테이블명 리스트
+        output_dir: 출력 디렉토리
+        manifest: 매니페스트의 테이블 기록 {테이블명: 기록}
+        force: 기존 파일을 강제로 덮어쓸지 여부
+        delta: 바뀐 행만 내보낼지 여부
+        
+    Returns:
+        {테이블명: export_table_incremental 결과} (실패한 테이블 제외)
+    """
+    tasks = [(table_name, output_dir, manifest.get(table_name, {}), force, delta) for table_name in tables]
+    results = {}
+    for table_name, result, error in pool.imap_unordered(export_table_in_worker, tasks):
+        if error is not None:
+            print(f"오류: {table_name}: {error}")
+            continue
+        results[table_name] = result
+        print(f"{table_name}: {describe_result(result[0], result[1], result[3])}")
+    
+    return results
+
+
+def export_all_tables_to_csv(db_file, output_dir=None, force=False, jobs=1, delta=False):
     """
     데이터베이스의 모든 테이블을 각각 CSV 파일로 내보내기
+    매니페스트의 내용 해시와 같은(변경 없는) 테이블은 건너뛴다.
     
     Args:
         db_file: SQLite 데이터베이스 파일 경로
         output_dir: 출력 디렉토리 (None이면 DB 파일과 같은 디렉토리)
-        force: 기존 파일을 강제로 덮어쓸지 여부
+        force: 기존 파일을 강제로 덮어쓸지 여부 (변경 없는 테이블도 다시 내보냄)
+        jobs: 동시에 내보낼 테이블 수 (작업 프로세스 수)
+        delta: 지난 --delta 내보내기 이후 바뀐 행만 delta/ 디렉토리에 내보낼지 여부
     """
     if not os.path.exists(db_file):
         print(f"오류: 데이터베이스 파일 '{db_file}'을 찾을 수 없습니다.")
@@ -132,79 +621,130 @@ def export_all_tables_to_csv(db_file, output_dir=None, force=False):
     # 출력 디렉토리 생성
     os.makedirs(output_dir, exist_ok=True)
     
-    # 데이터베이스 연결
-    conn = sqlite3.connect(db_file)
+    # 데이터베이스 연결 (테이블 목록과 모든 테이블을 같은 시점의 스냅샷에서 읽음)
+    conn, pool = open_snapshot(db_file, jobs)
     cursor = conn.cursor()
     
-    # 모든 테이블 목록 가져오기
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-    tables = cursor.fetchall()
+    # 모든 테이블 목록 가져오기 (SQLite 내부 테이블과 도구가 만든 '_' 테이블(_import_row_hashes 등) 제외)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' "
+                   "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '\\_%' ESCAPE '\\' ORDER BY name")
+    tables = [table_name for (table_name,) in cursor.fetchall()]
     
     if not tables:
         print(f"경고: 데이터베이스 '{db_file}'에 테이블이 없습니다.")
-        conn.close()
+        close_snapshot(conn, pool)
         return
     
     print(f"데이터베이스: {db_file}")
     print(f"출력 디렉토리: {output_dir}")
-    print(f"테이블 수: {len(tables)}개\n")
+    print(f"테이블 수: {len(tables)}개")
+    print(f"동시 작업 수: {jobs if pool is not None else 1}개")
+    print(f"내보내기 방식: {'바뀐 행만 (--delta)' if delta else '전체 테이블'}\n")
     
-    total_rows = 0
-    exported_tables = []
+    manifest = load_manifest(output_dir)
+    results = {}
     
-    # 각 테이블을 CSV로 내보내기
-    for (table_name,) in tables:
-        csv_filename = f"{table_name}.csv"
-        csv_file = os.path.join(output_dir, csv_filename)
-        
-        print(f"처리 중: {table_name} -> {csv_filename}")
-        
-        try:
-            row_count = export_table_to_csv(cursor, table_name, csv_file, force)
-            total_rows += row_count
-            exported_tables.append((table_name, csv_filename, row_count))
-            print(f"  완료: {row_count}개 행 내보냄")
-        except Exception as e:
-            print(f"  오류: {e}")
+    try:
+        if pool is not None:
+            # 여러 테이블을 동시에 CSV로 내보내기
+            results = export_tables_concurrently(pool, tables, output_dir, manifest, force, delta)
+        else:
+            # 각 테이블을 CSV로 내보내기
+            for table_name in tables:
+                target = f"{DELTA_DIR}/{table_name}.csv" if delta else f"{table_name}.csv"
+                print(f"처리 중: {table_name} -> {target}")
+                
+                try:
+                    result = export_table_incremental(cursor, table_name, output_dir,
+                                                      manifest.get(table_name, {}), force, delta)
+                    results[table_name] = result
+                    print(f"  {describe_result(result[0], result[1], result[3])}")
+                except Exception as e:
+                    print(f"  오류: {e}")
+    finally:
+        close_snapshot(conn, pool)
     
-    conn.close()
+    # 매니페스트 갱신 (실패한 테이블은 이전 기록 유지, DB에 없는 테이블의 기록은 삭제)
+    new_manifest = {}
+    for table_name in tables:
+        entry = results[table_name][2] if table_name in results else manifest.get(table_name)
+        if entry:
+            new_manifest[table_name] = entry
+    save_manifest(output_dir, db_file, new_manifest)
+    
+    exported_tables = [(table_name, result) for table_name, result in results.items() if result[0] == 'exported']
+    unchanged_count = sum(1 for result in results.values() if result[0] == 'unchanged')
+    if delta:
+        total_rows = sum(result[3][0] + result[3][1] for _, result in exported_tables)
+    else:
+        total_rows = sum(result[1] for _, result in exported_tables)
     
     # 최종 통계
     print(f"\n=== 내보내기 완료 ===")
     print(f"데이터베이스: {db_file}")
     print(f"출력 디렉토리: {output_dir}")
     print(f"내보낸 테이블 수: {len(exported_tables)}개")
+    print(f"변경 없어 건너뛴 테이블 수: {unchanged_count}개")
     print(f"총 내보낸 행 수: {total_rows}개\n")
     
-    print("내보낸 파일:")
-    for table_name, csv_filename, row_count in exported_tables:
-        csv_path = os.path.join(output_dir, csv_filename)
-        print(f"  {csv_filename} ({row_count}개 행) -> {csv_path}")
+    if exported_tables:
+        print("내보낸 파일:")
+    for table_name, (_, row_count, _, changes) in sorted(exported_tables):
+        if changes is not None:
+            changed_count, deleted_count = changes
+            delta_path = os.path.join(output_dir, DELTA_DIR, f"{table_name}.csv")
+            print(f"  {DELTA_DIR}/{table_name}.csv (추가·변경 {changed_count}개 행) -> {delta_path}")
+            if deleted_count:
+                deleted_path = os.path.join(output_dir, DELTA_DIR, f"{table_name}.deleted.csv")
+                print(f"  {DELTA_DIR}/{table_name}.deleted.csv (삭제 {deleted_count}개 행) -> {deleted_path}")
+        else:
+            csv_path = os.path.join(output_dir, f"{table_name}.csv")
+            print(f"  {table_name}.csv ({row_count}개 행) -> {csv_path}")
 
 
 def main():
     if len(sys.argv) < 2:
-        print("사용법: python script/export_all_tables_to_csv.py <db_file> [output_dir] [--overwrite]")
+        print("사용법: python script/export_all_tables_to_csv.py <db_file> [output_dir] [--overwrite] [--jobs N] [--delta]")
         print("예시: python script/export_all_tables_to_csv.py vocabulary.db")
         print("      python script/export_all_tables_to_csv.py vocabulary.db data/output")
         print("      python script/export_all_tables_to_csv.py vocabulary.db data/output --overwrite")
+        print("      python script/export_all_tables_to_csv.py vocabulary.db data/output --jobs 4")
+        print("      python script/export_all_tables_to_csv.py vocabulary.db data/output --delta")
         print("\n옵션:")
         print("  output_dir: 출력 디렉토리 (기본값: DB 파일과 같은 디렉토리의 output 폴더)")
-        print("  --overwrite: 기존 CSV 파일을 덮어씁니다")
+        print(f"  --overwrite: 기존 CSV 파일을 덮어씁니다 ({MANIFEST_FILE} 기록상 변경 없는 테이블도 다시 씀)")
+        print("  --jobs N: 테이블 N개를 동시에 내보냅니다 (기본값: 1)")
+        print("            모든 연결은 읽기 전용이며 잠금을 잡지 않아 앱의 쓰기를 막지 않습니다")
+        print("            작업 프로세스들이 함께 읽기를 시작한 전후의 data_version이 같을 때만 같은 스냅샷으로 보고,")
+        print(f"            커밋이 끼어들어 {SNAPSHOT_ATTEMPTS}번 안에 맞추지 못하거나 작업 프로세스가 {SNAPSHOT_TIMEOUT}초 안에")
+        print("            준비되지 않으면 경고 후 연결 하나로 내보냅니다")
+        print(f"  --delta: 지난 --delta 내보내기 이후 바뀐 행만 {DELTA_DIR}/ 디렉토리에 씁니다")
+        print("           (처음 실행하면 모든 행, --overwrite와 함께 쓰면 기준을 지우고 모든 행)")
         sys.exit(1)
     
     db_file = sys.argv[1]
     output_dir = None
     force = False
+    jobs = 1
+    delta = False
     
     # 인자 파싱
-    for arg in sys.argv[2:]:
+    args = iter(sys.argv[2:])
+    for arg in args:
         if arg == '--overwrite':
             force = True
+        elif arg == '--delta':
+            delta = True
+        elif arg == '--jobs' or arg.startswith('--jobs='):
+            value = arg.split('=', 1)[1] if '=' in arg else next(args, '')
+            if not value.isdigit() or int(value) < 1:
+                print("오류: --jobs 옵션에는 1 이상의 정수가 필요합니다.")
+                sys.exit(1)
+            jobs = int(value)
         elif not arg.startswith('--'):
             output_dir = arg
     
-    export_all_tables_to_csv(db_file, output_dir, force)
+    export_all_tables_to_csv(db_file, output_dir, force, jobs, delta)
 
 
 if __name__ == "__main__":
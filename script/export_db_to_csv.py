@@ -11,6 +11,9 @@ import sqlite3
 import sys
 import os
 
+# fetchmany 한 번에 읽는 행 수
+FETCH_SIZE = 10000
+
 def get_table_name_from_csv(csv_file):
     """
     CSV 파일명에서 테이블명 추출 (확장자 제거)
@@ -121,32 +124,28 @@ def export_table_to_csv(csv_file, db_file, force=False):
     csv_columns = [reverse_mapping.get(col, col) for col in db_columns]
     print(f"CSV 컬럼: {', '.join(csv_columns)}")
     
-    # 데이터 가져오기
+    # 데이터를 FETCH_SIZE행씩 읽어 바로 CSV 파일로 저장 (테이블 크기와 무관한 메모리 사용)
+    # 행은 DB 컬럼 순서 그대로 쓰고, 컬럼명 변환은 헤더에만 적용 (csv.writer는 None을 빈 문자열로 씀)
     cursor.execute(f"SELECT * FROM {table_name} ORDER BY Id")
-    rows = cursor.fetchall()
-    
-    conn.close()
-    
-    # CSV 파일로 저장
+    row_count = 0
     with open(csv_file, 'w', encoding='utf-8', newline='') as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=csv_columns)
-        writer.writeheader()
+        writer = csv.writer(outfile)
+        writer.writerow(csv_columns)
         
-        for row in rows:
-            # DB 컬럼 순서대로 딕셔너리 생성
-            row_dict = {}
-            for i, db_col in enumerate(db_columns):
-                csv_col = reverse_mapping.get(db_col, db_col)
-                value = row[i] if row[i] is not None else ''
-                row_dict[csv_col] = value
-            
-            writer.writerow(row_dict)
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            writer.writerows(rows)
+            row_count += len(rows)
+    
+    conn.close()
     
     print(f"\n내보내기 완료!")
     print(f"  데이터베이스: {db_file}")
     print(f"  테이블: {table_name}")
     print(f"  출력 파일: {csv_file}")
-    print(f"  총 행 수: {len(rows)}개 (헤더 제외)")
+    print(f"  총 행 수: {row_count}개 (헤더 제외)")
 
 if __name__ == "__main__":
     # 인자 확인
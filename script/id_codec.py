@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+계층 ID(word_id / definition_id / example_id) 인코딩과 디코딩
+    word_id       = (day_no - 1) * max_words_per_day + word_no
+    definition_id = word_id * MAX_SENSES_PER_WORD + sense_no
+    example_id    = definition_id * MAX_EXAMPLES_PER_SENSE + example_no
+
+- 값 하나: encode_word_id, day_of, word_no_of, encode_definition_id, word_of, sense_of, ...
+- 컬럼 전체: encode_word_ids, days_of, word_nos_of, encode_definition_ids, words_of, senses_of, ...
+  (시퀀스를 받아 NumPy가 있으면 NumPy int64 배열 연산으로 한 번에 계산하고,
+   없으면 원소마다 값 하나 함수를 호출하여 array('q')로 모음. 벡터 연산이 아니므로 큰 컬럼에는 NumPy를 권장)
+- SQLite: register_sqlite_functions(conn)로 같은 함수를 결정적(deterministic) 사용자 정의 함수로 등록하여
+  검사와 채우기를 SQL 한 문장으로 처리 (예: UPDATE examples SET definition_id = definition_of(example_id))
+
+사용법: python script/id_codec.py <db_file>    (데이터베이스의 모든 ID가 계산식과 맞는지 검사)
+"""
+
+import os
+import sqlite3
+import sys
+from array import array
+from itertools import repeat
+
+try:
+    import numpy as np
+except ImportError:  # NumPy는 선택 사항 (없으면 array 모듈 사용)
+    np = None
+
+# ---- Cvoca 설계 상수 (불변, script/1117/init_db.py도 이 값을 가져다 씀) ----
+MAX_SENSES_PER_WORD = 10
+MAX_EXAMPLES_PER_SENSE = 10
+
+# array 모듈의 64비트 부호 있는 정수 타입 코드
+ARRAY_TYPECODE = 'q'
+
+
+# ---- 값 하나 ----
+def encode_word_id(day_no, word_no, max_words):
+    """
+    (day_no, word_no) -> word_id
+    """
+    return (day_no - 1) * max_words + word_no
+
+
+def day_of(word_id, max_words):
+    """
+    word_id -> day_no
+    """
+    return (word_id - 1) // max_words + 1
+
+
+def word_no_of(word_id, max_words):
+    """
+    word_id -> word_no (Day 안의 단어 번호)
+    """
+    return (word_id - 1) % max_words + 1
+
+
+def encode_definition_id(word_id, sense_no):
+    """
+    (word_id, sense_no) -> definition_id
+    """
+    return word_id * MAX_SENSES_PER_WORD + sense_no
+
+
+def word_of(definition_id):
+    """
+    definition_id -> word_id
+    """
+    return definition_id // MAX_SENSES_PER_WORD
+
+
+def sense_of(definition_id):
+    """
+    definition_id -> sense_no
+    """
+    return definition_id % MAX_SENSES_PER_WORD
+
+
+def encode_example_id(definition_id, example_no):
+    """
+    (definition_id, example_no) -> example_id
+    """
+    return definition_id * MAX_EXAMPLES_PER_SENSE + example_no
+
+
+def definition_of(example_id):
+    """
+    example_id -> definition_id
+    """
+    return example_id // MAX_EXAMPLES_PER_SENSE
+
+
+def example_no_of(example_id):
+    """
+    example_id -> example_no
+    """
+    return example_id % MAX_EXAMPLES_PER_SENSE
+
+
+# ---- 컬럼 전체 ----
+def to_column(values):
+    """
+    정수 시퀀스를 계산용 컬럼으로 변환 (NumPy가 있으면 int64 배열, 없으면 array('q'))
+    """
+    if np is not None:
+        return np.asarray(values, dtype=np.int64)
+    if isinstance(values, array) and values.typecode == ARRAY_TYPECODE:
+        return values
+    return array(ARRAY_TYPECODE, values)
+
+
+def apply_columns(func, *columns):
+    """
+    값 하나 함수 func를 컬럼 전체에 적용 (정수 인자는 모든 행에 같은 값으로 씀)
+    NumPy 배열은 func의 산술 연산이 그대로 원소별 연산이 되므로 한 번에 계산한다.
+    NumPy가 없으면 원소마다 func를 한 번씩 호출하는 파이썬 루프이며, 결과를 array('q')로 돌려준다.
+    """
+    if np is not None:
+        return func(*(column if isinstance(column, int) else to_column(column) for column in columns))
+    return array(ARRAY_TYPECODE, map(func, *(repeat(column) if isinstance(column, int) else column
+                                             for column in columns)))
+
+
+def encode_word_ids(day_nos, word_nos, max_words):
+    """
+    day_no, word_no 컬럼 -> word_id 컬럼
+    """
+    return apply_columns(encode_word_id, day_nos, word_nos, max_words)
+
+
+def days_of(word_ids, max_words):
+    """
+    word_id 컬럼 -> day_no 컬럼
+    """
+    return apply_columns(day_of, word_ids, max_words)
+
+
+def word_nos_of(word_ids, max_words):
+    """
+    word_id 컬럼 -> word_no 컬럼
+    """
+    return apply_columns(word_no_of, word_ids, max_words)
+
+
+def encode_definition_ids(word_ids, sense_nos):
+    """
+    word_id, sense_no 컬럼 -> definition_id 컬럼
+    """
+    return apply_columns(encode_definition_id, word_ids, sense_nos)
+
+
+def words_of(definition_ids):
+    """
+    definition_id 컬럼 -> word_id 컬럼
+    """
+    return apply_columns(word_of, definition_ids)
+
+
+def senses_of(definition_ids):
+    """
+    definition_id 컬럼 -> sense_no 컬럼
+    """
+    return apply_columns(sense_of, definition_ids)
+
+
+def encode_example_ids(definition_ids, example_nos):
+    """
+    definition_id, example_no 컬럼 -> example_id 컬럼
+    """
+    return apply_columns(encode_example_id, definition_ids, example_nos)
+
+
+def definitions_of(example_ids):
+    """
+    example_id 컬럼 -> definition_id 컬럼
+    """
+    return apply_columns(definition_of, example_ids)
+
+
+def example_nos_of(example_ids):
+    """
+    example_id 컬럼 -> example_no 컬럼
+    """
+    return apply_columns(example_no_of, example_ids)
+
+
+# ---- SQLite 사용자 정의 함수 ----
+# (SQL 함수명, 인자 수, 파이썬 함수)
+SQLITE_FUNCTIONS = [
+    ('encode_word_id', 3, encode_word_id),
+    ('day_of', 2, day_of),
+    ('word_no_of', 2, word_no_of),
+    ('encode_definition_id', 2, encode_definition_id),
+    ('word_of', 1, word_of),
+    ('sense_of', 1, sense_of),
+    ('encode_example_id', 2, encode_example_id),
+    ('definition_of', 1, definition_of),
+    ('example_no_of', 1, example_no_of),
+]
+
+
+def null_safe(func):
+    """
+    인자에 NULL이 있으면 NULL을 돌려주는 SQL 함수로 감싸기 (SQL 내장 산술 연산과 같은 동작)
+    """
+    def wrapper(*args):
+        if any(arg is None for arg in args):
+            return None
+        return func(*(int(arg) for arg in args))
+    return wrapper
+
+
+def register_sqlite_functions(conn):
+    """
+    연결에 ID 인코딩/디코딩 함수를 결정적 사용자 정의 함수로 등록
+    (결정적 함수는 인덱스 식, 생성 컬럼, CHECK 제약에도 쓸 수 있고 옵티마이저가 상수 인자 호출을 한 번만 계산함)
+    max_words가 필요한 함수는 인자로 받는다: day_of(word_id, (SELECT max_words_per_day FROM books))
+    """
+    for name, num_args, func in SQLITE_FUNCTIONS:
+        conn.create_function(name, num_args, null_safe(func), deterministic=True)
+
+
+# ---- 데이터베이스 검사 ----
+# (검사 이름, 계산식과 맞지 않는 행 수를 세는 SQL)
+CHECK_SQLS = [
+    ('words.word_id',
+     "SELECT COUNT(*) FROM words "
+     "WHERE word_id != encode_word_id(day_no, word_no, (SELECT max_words_per_day FROM books WHERE book_id = 1))"),
+    ('definitions.definition_id',
+     "SELECT COUNT(*) FROM definitions WHERE definition_id != encode_definition_id(word_id, sense_no)"),
+    ('examples.example_id',
+     "SELECT COUNT(*) FROM examples WHERE example_id != encode_example_id(definition_id, example_no)"),
+]
+
+
+def check_database(db_file):
+    """
+    데이터베이스의 모든 ID가 계산식과 맞는지 SQL 한 문장씩으로 검사
+
+    Returns:
+        {검사 이름: 맞지 않는 행 수}
+    """
+    if not os.path.exists(db_file):
+        print(f"오류: 데이터베이스 파일 '{db_file}'을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    conn = sqlite3.connect(db_file)
+    try:
+        register_sqlite_functions(conn)
+        row = conn.execute(
+            "SELECT max_words_per_day, max_senses_per_word, max_examples_per_sense FROM books WHERE book_id = 1"
+        ).fetchone()
+        # words 검사는 books의 max_words_per_day로 계산하므로 값이 없으면 NULL과 비교되어 검사가 통과해 버림
+        if row is None or row[0] is None:
+            print(f"오류: '{db_file}'의 books 테이블에 book_id = 1 행(max_words_per_day)이 없어 word_id를 검사할 수 없습니다.")
+            sys.exit(1)
+        if tuple(row[1:]) != (MAX_SENSES_PER_WORD, MAX_EXAMPLES_PER_SENSE):
+            print(f"경고: books의 (max_senses_per_word, max_examples_per_sense) = {tuple(row[1:])}가 "
+                  f"코덱 상수 ({MAX_SENSES_PER_WORD}, {MAX_EXAMPLES_PER_SENSE})와 다릅니다.")
+        return {name: conn.execute(sql).fetchone()[0] for name, sql in CHECK_SQLS}
+    finally:
+        conn.close()
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("사용법: python script/id_codec.py <db_file>")
+        print("예시: python script/id_codec.py data/ielts_voca_20_30.db")
+        sys.exit(1)
+
+    results = check_database(sys.argv[1])
+    for name, mismatches in results.items():
+        status = "OK" if mismatches == 0 else f"계산식과 다른 행 {mismatches}개"
+        print(f"  {name}: {status}")
+    if any(results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
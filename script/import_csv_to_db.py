@@ -3,14 +3,27 @@
 """
 CSV 파일을 vocabulary.db에 중복을 제외하고 업데이트하는 스크립트
 CSV 파일명이 데이터베이스의 테이블명과 일치해야 합니다.
-사용법: ./script/import_csv_to_db.py Vocabulary.csv vocabulary.db [-rf]
+--delta로 가져오면 행마다 내용 해시를 _import_row_hashes 테이블에 기록해 두고, 다음 가져오기에서
+해시가 바뀐 행만 반영한다 (추가/변경된 행만 쓰고 요약을 출력, --delete-missing이면 CSV에서 빠진 행 삭제).
+--staging으로 가져오면 CSV 전체를 TEMP 스테이징 테이블에 넣은 뒤 INSERT ... SELECT / UPDATE ... FROM /
+DELETE 몇 문장으로 한 번에 반영한다 (--delete-missing이면 CSV에 없는 행 삭제, 테이블 전체 동기화용).
+사용법: ./script/import_csv_to_db.py Vocabulary.csv vocabulary.db [-rf] [--delta | --staging] [--delete-missing]
 """
 
 import csv
+import hashlib
+import json
 import sqlite3
 import sys
 import os
 
+# executemany 한 번에 넣는 행 수
+BATCH_SIZE = 10000
+# 행 내용 해시를 기록하는 테이블 (--delta)
+ROW_HASH_TABLE = '_import_row_hashes'
+# IN (...) 한 번에 넣는 키 수
+KEY_CHUNK_SIZE = 500
+
 def get_table_name_from_csv(csv_file):
     """
     CSV 파일명에서 테이블명 추출 (확장자 제거)
@@ -77,15 +90,405 @@ def get_column_mapping(csv_columns, db_columns):
     
     return mapping
 
-def update_table_from_csv(csv_file, db_file, force=False):
+def has_unique_key(cursor, table_name, column):
+    """
+    컬럼 하나로 된 PRIMARY KEY 또는 UNIQUE 인덱스가 있는지 확인 (ON CONFLICT 대상이 될 수 있는지)
+    
+    Args:
+        cursor: 데이터베이스 커서
+        table_name: 테이블명
+        column: 컬럼명
+        
+    Returns:
+        ON CONFLICT(column)을 쓸 수 있으면 True
+    """
+    pk_columns = [col[1] for col in get_table_schema(cursor, table_name) if col[5]]
+    if pk_columns == [column]:
+        return True
+    
+    # index_list: (seq, name, unique, origin, partial)
+    cursor.execute(f"PRAGMA index_list({table_name})")
+    for index in cursor.fetchall():
+        if index[2] and not index[4]:
+            cursor.execute(f"PRAGMA index_info({index[1]})")
+            if [info[2] for info in cursor.fetchall()] == [column]:
+                return True
+    return False
+
+def iter_csv_values(reader, csv_pk, columns_to_insert, reverse_mapping):
+    """
+    CSV 행을 (Primary Key 값, DB 컬럼 순서의 값 튜플)로 변환
+    Primary Key가 비어 있는 행은 건너뛰고, 숫자가 아닌 행은 경고 후 건너뛴다.
+    
+    Args:
+        reader: csv.DictReader
+        csv_pk: Primary Key에 해당하는 CSV 컬럼명
+        columns_to_insert: 값을 넣을 DB 컬럼 리스트
+        reverse_mapping: 딕셔너리 {db_column: csv_column}
+    """
+    for row in reader:
+        # Primary Key가 비어있으면 건너뛰기
+        if not row.get(csv_pk, '').strip():
+            continue
+        
+        try:
+            row_id = int(row[csv_pk].strip())
+        except ValueError:
+            print(f"경고: 행을 건너뜁니다 - Primary Key가 숫자가 아닙니다: {row.get(csv_pk, 'N/A')}")
+            continue
+        
+        # CSV 행에서 DB 컬럼에 해당하는 값만 추출
+        values = []
+        for db_col in columns_to_insert:
+            # DB 컬럼에 매핑된 CSV 컬럼명 찾기
+            csv_col = reverse_mapping.get(db_col, db_col)
+            value = row.get(csv_col, '').strip()
+            # 빈 문자열은 None으로 변환
+            if value == '':
+                values.append(None)
+            else:
+                values.append(value)
+        
+        yield row_id, tuple(values)
+
+def iter_batches(items, batch_size=BATCH_SIZE):
+    """
+    이터레이터를 batch_size개씩 나누기
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def upsert_rows(cursor, table_name, primary_key, columns_to_insert, rows, force=False):
+    """
+    CSV 행을 배치 단위로 INSERT ... ON CONFLICT(primary_key) 문에 넣어 반영 (기존 Primary Key 목록을 읽지 않음)
+    CSV 안에서 같은 Primary Key가 반복되면 뒤의 행이 앞의 행을 덮어쓰거나(-rf) 건너뛴다.
+    
+    Args:
+        cursor: 데이터베이스 커서
+        table_name: 테이블명
+        primary_key: Primary Key 컬럼명 (PRIMARY KEY 또는 UNIQUE 제약이 있어야 함)
+        columns_to_insert: 값을 넣을 DB 컬럼 리스트
+        rows: (Primary Key 값, 값 튜플) 이터레이터
+        force: 중복 시 덮어쓸지 여부 (True면 DO UPDATE, False면 DO NOTHING)
+        
+    Returns:
+        (추가된 항목 수, 업데이트된 항목 수, 건너뛴 항목 수)
+    """
+    columns_str = ','.join(columns_to_insert)
+    placeholders = ','.join(['?' for _ in columns_to_insert])
+    update_columns = [col for col in columns_to_insert if col != primary_key]
+    if force and update_columns:
+        conflict_action = "DO UPDATE SET " + ', '.join([f"{col} = excluded.{col}" for col in update_columns])
+    else:
+        conflict_action = "DO NOTHING"
+    upsert_query = (f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders}) "
+                    f"ON CONFLICT({primary_key}) {conflict_action}")
+    
+    # 추가된 항목 수는 테이블 행 수의 변화, 나머지는 중복 항목 (업데이트 또는 건너뛰기)
+    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+    count_before = cursor.fetchone()[0]
+    
+    processed_count = 0
+    for batch in iter_batches(values for _, values in rows):
+        cursor.executemany(upsert_query, batch)
+        processed_count += len(batch)
+    
+    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+    inserted_count = cursor.fetchone()[0] - count_before
+    duplicate_count = processed_count - inserted_count
+    if force:
+        return inserted_count, duplicate_count, 0
+    return inserted_count, 0, duplicate_count
+
+def merge_rows_rowwise(cursor, table_name, primary_key, columns_to_insert, rows, force=False):
+    """
+    기존 Primary Key 목록과 비교하여 행마다 반영
+    Primary Key 컬럼에 UNIQUE 제약이 없어 ON CONFLICT를 쓸 수 없는 테이블용
+    
+    Args:
+        upsert_rows와 같음
+        
+    Returns:
+        (추가된 항목 수, 업데이트된 항목 수, 건너뛴 항목 수)
+    """
+    # 기존 데이터의 Primary Key 목록 가져오기 (중복 체크용)
+    cursor.execute(f"SELECT {primary_key} FROM {table_name}")
+    existing_ids = set(row[0] for row in cursor.fetchall())
+    
+    update_set = ', '.join([f"{col} = ?" for col in columns_to_insert])
+    update_query = f"UPDATE {table_name} SET {update_set} WHERE {primary_key} = ?"
+    
+    new_rows = []
+    updated_count = 0
+    skipped_count = 0
+    for row_id, values in rows:
+        # 중복 체크: Primary Key가 이미 존재하는지 확인
+        if row_id in existing_ids:
+            if force:
+                # 덮어쓰기: UPDATE 쿼리 실행 (마지막에 Primary Key 추가)
+                cursor.execute(update_query, list(values) + [row_id])
+                updated_count += 1
+            else:
+                # 건너뛰기
+                skipped_count += 1
+        else:
+            # 새 데이터 추가
+            new_rows.append(values)
+            existing_ids.add(row_id)  # 메모리에서도 중복 방지
+    
+    # 새 데이터 삽입
+    if new_rows:
+        columns_str = ','.join(columns_to_insert)
+        placeholders = ','.join(['?' for _ in columns_to_insert])
+        cursor.executemany(f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})", new_rows)
+    
+    return len(new_rows), updated_count, skipped_count
+
+def get_row_hasher(columns):
+    """
+    행 내용 해시 함수 (컬럼 목록도 해시에 넣어 컬럼 매핑이 바뀌면 다른 해시가 됨)
+    
+    Args:
+        columns: 값 튜플의 DB 컬럼 리스트
+        
+    Returns:
+        값 튜플 -> 16바이트 해시 함수
+    """
+    base = hashlib.blake2b(json.dumps(columns).encode('utf-8'), digest_size=16)
+    
+    def row_hash(values):
+        digest = base.copy()
+        digest.update(json.dumps(values, ensure_ascii=False).encode('utf-8'))
+        return digest.digest()
+    
+    return row_hash
+
+def clear_row_hashes(cursor, table_name):
+    """
+    테이블의 행 해시 기록 삭제 (--delta 없이 가져오면 기록된 해시가 테이블 내용과 맞지 않게 되므로)
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?", (ROW_HASH_TABLE,))
+    if cursor.fetchone():
+        cursor.execute(f"DELETE FROM {ROW_HASH_TABLE} WHERE table_name = ?", (table_name,))
+
+def execute_in_chunks(cursor, query, keys, params=()):
+    """
+    query의 {keys} 자리에 키를 KEY_CHUNK_SIZE개씩 넣어 실행
+    
+    Returns:
+        (결과 행 리스트, 바뀐 행 수 합계)
+    """
+    results = []
+    rowcount = 0
+    for i in range(0, len(keys), KEY_CHUNK_SIZE):
+        chunk = keys[i:i + KEY_CHUNK_SIZE]
+        cursor.execute(query.format(keys=','.join(['?' for _ in chunk])), list(params) + chunk)
+        results.extend(cursor.fetchall())
+        rowcount += max(cursor.rowcount, 0)
+    return results, rowcount
+
+def apply_delta(cursor, table_name, primary_key, columns_to_insert, rows, force=False, delete_missing=False):
+    """
+    행 내용 해시를 지난 가져오기 때 기록한 해시와 비교하여 바뀐 행만 반영
+    - 해시가 같은 행은 테이블을 읽거나 쓰지 않는다.
+    - 새 키는 추가하고, 해시가 다른 기존 행은 -rf일 때만 바꾼다 (내용이 실제로 다른 컬럼이 있을 때만 씀).
+    - 지난번에 가져온 키가 CSV에서 빠졌으면 delete_missing일 때만 테이블에서 삭제하고, 아니면 개수만 센다.
+    해시는 테이블에 반영된 행만 기록하며, 가져오기 사이에 앱 등에서 직접 바꾼 행은 CSV의 그 행이 바뀌어야 다시 덮어쓴다.
+    
+    Args:
+        upsert_rows와 같음
+        delete_missing: 지난번에 가져왔지만 CSV에 없는 키의 행을 테이블에서 삭제할지 여부
+        
+    Returns:
+        딕셔너리 {'added', 'changed', 'deleted', 'unchanged', 'skipped', 'missing'}: 항목 수
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {ROW_HASH_TABLE} (
+            table_name TEXT    NOT NULL,
+            row_key    INTEGER NOT NULL,
+            row_hash   BLOB    NOT NULL,
+            PRIMARY KEY (table_name, row_key)
+        ) WITHOUT ROWID
+    """)
+    # 이번 CSV에 있는 키 (삭제된 키 찾기용)
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS import_seen_keys (row_key INTEGER PRIMARY KEY)")
+    cursor.execute("DELETE FROM temp.import_seen_keys")
+    
+    row_hash = get_row_hasher(columns_to_insert)
+    columns_str = ','.join(columns_to_insert)
+    placeholders = ','.join(['?' for _ in columns_to_insert])
+    update_columns = [col for col in columns_to_insert if col != primary_key]
+    if force and update_columns:
+        update_set = ', '.join([f"{col} = excluded.{col}" for col in update_columns])
+        changed_condition = ' OR '.join([f"{col} IS NOT excluded.{col}" for col in update_columns])
+        conflict_action = f"DO UPDATE SET {update_set} WHERE {changed_condition}"
+    else:
+        conflict_action = "DO NOTHING"
+    upsert_query = (f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders}) "
+                    f"ON CONFLICT({primary_key}) {conflict_action}")
+    
+    counts = dict.fromkeys(['added', 'changed', 'deleted', 'unchanged', 'skipped', 'missing'], 0)
+    for batch in iter_batches(rows):
+        # 배치 안에서 같은 키가 반복되면 마지막 행 사용
+        latest = dict(batch)
+        keys = list(latest)
+        cursor.executemany("INSERT OR IGNORE INTO temp.import_seen_keys (row_key) VALUES (?)", [(key,) for key in keys])
+        
+        # 기록된 해시와 비교
+        stored, _ = execute_in_chunks(
+            cursor, f"SELECT row_key, row_hash FROM {ROW_HASH_TABLE} WHERE table_name = ? AND row_key IN ({{keys}})",
+            keys, (table_name,))
+        stored = dict(stored)
+        pending = []
+        for key, values in latest.items():
+            digest = row_hash(values)
+            if stored.get(key) == digest:
+                counts['unchanged'] += 1
+            else:
+                pending.append((key, values, digest))
+        if not pending:
+            continue
+        
+        # 해시가 다르거나 없는 행만 반영
+        existing, _ = execute_in_chunks(
+            cursor, f"SELECT {primary_key} FROM {table_name} WHERE {primary_key} IN ({{keys}})",
+            [key for key, _, _ in pending])
+        existing = {row[0] for row in existing}
+        changes_before = cursor.connection.total_changes
+        cursor.executemany(upsert_query, [values for _, values, _ in pending])
+        written_count = cursor.connection.total_changes - changes_before
+        added_count = sum(1 for key, _, _ in pending if key not in existing)
+        counts['added'] += added_count
+        if force:
+            # 해시 기록이 없을 뿐 내용이 같은 행은 쓰지 않음
+            counts['changed'] += written_count - added_count
+            counts['unchanged'] += len(pending) - written_count
+            recorded = pending
+        else:
+            counts['skipped'] += len(pending) - added_count
+            recorded = [item for item in pending if item[0] not in existing]
+        cursor.executemany(
+            f"INSERT OR REPLACE INTO {ROW_HASH_TABLE} (table_name, row_key, row_hash) VALUES (?, ?, ?)",
+            [(table_name, key, digest) for key, _, digest in recorded])
+    
+    # 지난번에 가져왔지만 이번 CSV에 없는 키
+    cursor.execute(f"""
+        SELECT row_key FROM {ROW_HASH_TABLE}
+        WHERE table_name = ? AND row_key NOT IN (SELECT row_key FROM temp.import_seen_keys)
+    """, (table_name,))
+    missing_keys = [row[0] for row in cursor.fetchall()]
+    if missing_keys and delete_missing:
+        _, counts['deleted'] = execute_in_chunks(
+            cursor, f"DELETE FROM {table_name} WHERE {primary_key} IN ({{keys}})", missing_keys)
+        execute_in_chunks(
+            cursor, f"DELETE FROM {ROW_HASH_TABLE} WHERE table_name = ? AND row_key IN ({{keys}})",
+            missing_keys, (table_name,))
+    else:
+        counts['missing'] = len(missing_keys)
+    
+    return counts
+
+def merge_via_staging(cursor, table_name, primary_key, columns_to_insert, rows, force=False, delete_missing=False):
+    """
+    CSV 행을 TEMP 스테이징 테이블에 배치로 넣은 뒤 집합 연산 SQL 몇 문장으로 한 번에 반영
+    - UPDATE ... FROM: 기존 키 중 내용이 다른 행만 덮어쓰기 (-rf일 때)
+    - INSERT ... SELECT: 새 키 추가
+    - DELETE: CSV에 없는 키 삭제 (delete_missing일 때)
+    CSV 안에서 같은 키가 반복되면 -rf일 때는 마지막 행, 아니면 첫 행을 사용한다 (upsert_rows와 같음).
+    Primary Key 컬럼에 UNIQUE 제약이 없어도 된다.
+    
+    Args:
+        upsert_rows와 같음
+        delete_missing: CSV에 없는 키의 행을 테이블에서 삭제할지 여부
+        
+    Returns:
+        딕셔너리 {'added', 'changed', 'deleted', 'unchanged', 'skipped', 'missing'}: 항목 수
+    """
+    # 스테이징 테이블은 대상 테이블과 같은 선언 타입을 써서 같은 타입 변환(affinity)을 거치게 함
+    declared_types = {col[1]: col[2] for col in get_table_schema(cursor, table_name)}
+    column_defs = ', '.join([f"{col} {declared_types[col]}" for col in columns_to_insert])
+    cursor.execute("DROP TABLE IF EXISTS temp.import_staging")
+    cursor.execute(f"CREATE TEMP TABLE import_staging (staging_row INTEGER PRIMARY KEY, {column_defs})")
+    
+    columns_str = ','.join(columns_to_insert)
+    placeholders = ','.join(['?' for _ in columns_to_insert])
+    for batch in iter_batches(values for _, values in rows):
+        cursor.executemany(f"INSERT INTO temp.import_staging ({columns_str}) VALUES ({placeholders})", batch)
+    
+    # 같은 키는 한 행만 남기고 키로 인덱스 생성
+    keep_row = 'MAX' if force else 'MIN'
+    cursor.execute(f"""
+        DELETE FROM temp.import_staging
+        WHERE staging_row NOT IN (SELECT {keep_row}(staging_row) FROM temp.import_staging GROUP BY {primary_key})
+    """)
+    cursor.execute(f"CREATE UNIQUE INDEX temp.idx_import_staging_key ON import_staging({primary_key})")
+    
+    counts = dict.fromkeys(['added', 'changed', 'deleted', 'unchanged', 'skipped', 'missing'], 0)
+    cursor.execute(f"""
+        SELECT COUNT(*) FROM temp.import_staging AS s
+        WHERE EXISTS (SELECT 1 FROM {table_name} AS t WHERE t.{primary_key} = s.{primary_key})
+    """)
+    existing_count = cursor.fetchone()[0]
+    
+    # 1) 기존 키: 내용이 다른 행만 덮어쓰기
+    update_columns = [col for col in columns_to_insert if col != primary_key]
+    if force and update_columns:
+        update_set = ', '.join([f"{col} = s.{col}" for col in update_columns])
+        changed_condition = ' OR '.join([f"{table_name}.{col} IS NOT s.{col}" for col in update_columns])
+        cursor.execute(f"""
+            UPDATE {table_name} SET {update_set}
+            FROM temp.import_staging AS s
+            WHERE {table_name}.{primary_key} = s.{primary_key} AND ({changed_condition})
+        """)
+        counts['changed'] = cursor.rowcount
+        counts['unchanged'] = existing_count - counts['changed']
+    elif force:
+        counts['unchanged'] = existing_count
+    else:
+        counts['skipped'] = existing_count
+    
+    # 2) 새 키 추가 (키 순서대로 넣어 B-트리 끝에 추가되도록)
+    cursor.execute(f"""
+        INSERT INTO {table_name} ({columns_str})
+        SELECT {columns_str} FROM temp.import_staging AS s
+        WHERE NOT EXISTS (SELECT 1 FROM {table_name} AS t WHERE t.{primary_key} = s.{primary_key})
+        ORDER BY s.{primary_key}
+    """)
+    counts['added'] = cursor.rowcount
+    
+    # 3) CSV에 없는 키
+    if delete_missing:
+        cursor.execute(f"DELETE FROM {table_name} WHERE {primary_key} NOT IN (SELECT {primary_key} FROM temp.import_staging)")
+        counts['deleted'] = cursor.rowcount
+    else:
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM {table_name} AS t
+            WHERE NOT EXISTS (SELECT 1 FROM temp.import_staging AS s WHERE s.{primary_key} = t.{primary_key})
+        """)
+        counts['missing'] = cursor.fetchone()[0]
+    
+    cursor.execute("DROP TABLE temp.import_staging")
+    return counts
+
+def update_table_from_csv(csv_file, db_file, force=False, delta=False, staging=False, delete_missing=False):
     """
     CSV 파일의 데이터를 vocabulary.db의 해당 테이블에 업데이트
     CSV 파일명이 테이블명과 일치해야 합니다.
+    CSV 행은 배치 단위로 INSERT ... ON CONFLICT 문에 넣어 반영한다 (Primary Key에 UNIQUE 제약이 없으면 행 단위 비교).
     
     Args:
         csv_file: CSV 파일 경로
         db_file: SQLite 데이터베이스 파일 경로
         force: 중복 시 덮어쓸지 여부 (True면 UPDATE, False면 건너뛰기)
+        delta: 행 내용 해시를 비교하여 지난 가져오기 이후 바뀐 행만 반영할지 여부
+        staging: CSV를 TEMP 스테이징 테이블에 넣은 뒤 집합 연산 SQL로 한 번에 반영할지 여부
+        delete_missing: delta나 staging일 때 CSV에 없는 키의 행을 삭제할지 여부
     """
     # 파일 존재 확인
     if not os.path.exists(csv_file):
@@ -120,21 +523,21 @@ def update_table_from_csv(csv_file, db_file, force=False):
     primary_key = None
     pk_columns = [col[1] for col in schema if col[5]]  # col[5]는 pk 플래그
     
-    if pk_columns:
+    if len(pk_columns) == 1:
         primary_key = pk_columns[0]
     else:
-        # Primary Key가 없으면 규칙에 따라 찾기
-        # 규칙: 테이블명에서 끝의 's'를 제거하고 'Id'를 추가
-        # 예: Words -> word_id, Examples -> example_id, Definitions -> definition_id
+        # Primary Key가 없거나 여러 컬럼이면 (WITHOUT ROWID 등) 규칙에 따라 찾기
+        # 규칙: 테이블명에서 끝의 's'를 제거하고 '_id' 또는 'Id'를 추가
+        # 예: words -> word_id, Examples -> ExampleId, definitions -> definition_id
         if table_name.endswith('s'):
             singular_name = table_name[:-1]  # 끝의 's' 제거
-            expected_pk = f"{singular_name}Id"
         else:
-            expected_pk = f"{table_name}Id"
+            singular_name = table_name
+        expected_pks = [f"{singular_name}_id", f"{singular_name}Id"]
         
         # 예상된 Primary Key 컬럼이 존재하는지 확인
-        if expected_pk in db_columns:
-            primary_key = expected_pk
+        if any(expected_pk in db_columns for expected_pk in expected_pks):
+            primary_key = next(expected_pk for expected_pk in expected_pks if expected_pk in db_columns)
         else:
             # 없으면 Id로 끝나는 컬럼 중 가장 짧은 것 선택
             id_columns = [col[1] for col in schema if col[1].endswith('Id')]
@@ -150,14 +553,18 @@ def update_table_from_csv(csv_file, db_file, force=False):
     
     print(f"Primary Key 컬럼: {primary_key}")
     
-    # 기존 데이터의 Primary Key 목록 가져오기 (중복 체크용)
-    cursor.execute(f"SELECT {primary_key} FROM {table_name}")
-    existing_ids = set(row[0] for row in cursor.fetchall())
+    # ON CONFLICT를 쓸 수 있으면 배치 UPSERT, 아니면 행 단위 비교 (스테이징은 UNIQUE 제약이 필요 없음)
+    if staging or has_unique_key(cursor, table_name, primary_key):
+        merge_rows = upsert_rows
+    elif delta:
+        print(f"오류: --delta는 '{primary_key}' 컬럼에 PRIMARY KEY 또는 UNIQUE 제약이 있어야 합니다.")
+        conn.close()
+        sys.exit(1)
+    else:
+        print(f"참고: '{primary_key}' 컬럼에 UNIQUE 제약이 없어 행 단위로 비교합니다.")
+        merge_rows = merge_rows_rowwise
     
     # CSV 파일 읽기
-    new_rows = []
-    skipped_count = 0
-    
     with open(csv_file, 'r', encoding='utf-8') as infile:
         reader = csv.DictReader(infile)
         csv_columns = reader.fieldnames
@@ -186,8 +593,6 @@ def update_table_from_csv(csv_file, db_file, force=False):
         
         # 매핑된 컬럼만 사용
         columns_to_insert = [col for col in db_columns if col in column_mapping.values()]
-        placeholders = ','.join(['?' for _ in columns_to_insert])
-        columns_str = ','.join(columns_to_insert)
         
         # 역매핑 생성 (DB 컬럼 -> CSV 컬럼)
         reverse_mapping = {db_col: csv_col for csv_col, db_col in column_mapping.items()}
@@ -198,64 +603,43 @@ def update_table_from_csv(csv_file, db_file, force=False):
             print(f"경고: CSV에 없는 DB 컬럼: {', '.join(missing_columns)}")
             print("      이 컬럼들은 NULL 또는 기본값으로 설정됩니다.")
         
-        for row in reader:
-            # Primary Key가 비어있으면 건너뛰기
-            if not row.get(csv_pk, '').strip():
-                continue
-            
-            try:
-                row_id = int(row[csv_pk].strip())
-                
-                # CSV 행에서 DB 컬럼에 해당하는 값만 추출
-                values = []
-                for db_col in columns_to_insert:
-                    # DB 컬럼에 매핑된 CSV 컬럼명 찾기
-                    csv_col = reverse_mapping.get(db_col, db_col)
-                    value = row.get(csv_col, '').strip()
-                    # 빈 문자열은 None으로 변환
-                    if value == '':
-                        values.append(None)
-                    else:
-                        values.append(value)
-                
-                # 중복 체크: Primary Key가 이미 존재하는지 확인
-                if row_id in existing_ids:
-                    if force:
-                        # 덮어쓰기: UPDATE 쿼리 실행
-                        update_values = values + [row_id]  # 마지막에 Primary Key 추가
-                        update_set = ', '.join([f"{col} = ?" for col in columns_to_insert])
-                        update_query = f"UPDATE {table_name} SET {update_set} WHERE {primary_key} = ?"
-                        cursor.execute(update_query, update_values)
-                        skipped_count += 1  # 업데이트된 항목으로 카운트
-                    else:
-                        # 건너뛰기
-                        skipped_count += 1
-                        continue
-                else:
-                    # 새 데이터 추가
-                    new_rows.append(tuple(values))
-                    existing_ids.add(row_id)  # 메모리에서도 중복 방지
-                
-            except ValueError as e:
-                print(f"경고: 행을 건너뜁니다 - Primary Key가 숫자가 아닙니다: {row.get(csv_pk, 'N/A')}")
-                continue
+        rows = iter_csv_values(reader, csv_pk, columns_to_insert, reverse_mapping)
+        if delta:
+            counts = apply_delta(cursor, table_name, primary_key, columns_to_insert, rows, force, delete_missing)
+        elif staging:
+            counts = merge_via_staging(cursor, table_name, primary_key, columns_to_insert, rows, force, delete_missing)
+            clear_row_hashes(cursor, table_name)
+        else:
+            inserted_count, updated_count, skipped_count = merge_rows(
+                cursor, table_name, primary_key, columns_to_insert, rows, force)
+            clear_row_hashes(cursor, table_name)
     
-    # 새 데이터 삽입
-    if new_rows:
-        insert_query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-        cursor.executemany(insert_query, new_rows)
-        print(f"성공: {len(new_rows)}개의 새 항목이 추가되었습니다.")
+    if delta or staging:
+        conn.commit()
+        summary = (f"변경 요약: 추가 {counts['added']}개, 변경 {counts['changed']}개, "
+                   f"삭제 {counts['deleted']}개, 동일 {counts['unchanged']}개")
+        if counts['skipped']:
+            summary += f", 건너뛴 중복 {counts['skipped']}개"
+        print(summary)
+        if counts['missing']:
+            print(f"CSV에 없는 기존 항목: {counts['missing']}개 (--delete-missing을 쓰면 삭제됩니다)")
+        cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+        print(f"'{table_name}' 테이블의 총 항목 수: {cursor.fetchone()[0]}개")
+        conn.close()
+        return
+    
+    if inserted_count:
+        print(f"성공: {inserted_count}개의 새 항목이 추가되었습니다.")
     
     # 변경사항 커밋
     conn.commit()
     
+    if updated_count > 0:
+        print(f"업데이트된 중복 항목: {updated_count}개")
     if skipped_count > 0:
-        if force:
-            print(f"업데이트된 중복 항목: {skipped_count}개")
-        else:
-            print(f"건너뛴 중복 항목: {skipped_count}개")
+        print(f"건너뛴 중복 항목: {skipped_count}개")
     
-    if not new_rows and not skipped_count:
+    if not inserted_count and not updated_count and not skipped_count:
         print("처리할 항목이 없습니다.")
     
     # 최종 통계
@@ -268,15 +652,28 @@ def update_table_from_csv(csv_file, db_file, force=False):
 if __name__ == "__main__":
     # 인자 확인
     if len(sys.argv) < 3:
-        print("사용법: python script/import_csv_to_db.py <csv_file> <db_file> [-rf]")
+        print("사용법: python script/import_csv_to_db.py <csv_file> <db_file> [-rf] [--delta | --staging] [--delete-missing]")
         print("예시: python script/import_csv_to_db.py Vocabulary.csv vocabulary.db")
         print("      python script/import_csv_to_db.py Vocabulary.csv vocabulary.db -rf")
+        print("      python script/import_csv_to_db.py Vocabulary.csv vocabulary.db -rf --delta")
         print("      (-rf 옵션: 중복 시 기존 데이터를 덮어씁니다)")
+        print("      (--delta 옵션: 지난 --delta 가져오기 이후 내용이 바뀐 행만 반영하고 요약을 출력합니다)")
+        print("      (--staging 옵션: CSV를 TEMP 스테이징 테이블에 넣은 뒤 집합 연산 SQL로 한 번에 반영합니다)")
+        print("      (--delete-missing 옵션: --delta나 --staging과 함께 쓰면 CSV에 없는 행을 삭제합니다)")
         sys.exit(1)
     
     csv_file = sys.argv[1]
     db_file = sys.argv[2]
     force = '-rf' in sys.argv
+    delta = '--delta' in sys.argv
+    staging = '--staging' in sys.argv
+    delete_missing = '--delete-missing' in sys.argv
+    if delta and staging:
+        print("오류: --delta와 --staging은 함께 쓸 수 없습니다.")
+        sys.exit(1)
+    if delete_missing and not (delta or staging):
+        print("오류: --delete-missing은 --delta나 --staging과 함께 써야 합니다.")
+        sys.exit(1)
     
-    update_table_from_csv(csv_file, db_file, force)
+    update_table_from_csv(csv_file, db_file, force, delta, staging, delete_missing)
 
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
-Vocabulary_join_Meaning.csv와 Meaning_join_Example.csv를 합치는 스크립트
+Vocabulary.csv, Meaning.csv, Example.csv를 한 번에 연쇄 조인하는 스크립트
+(중간 파일 Vocabulary_join_Meaning.csv, Meaning_join_Example.csv 없이 같은 결과 생성)
 사용법: python script/join/2_Vocabulary_Meaning_Example.py [join_type] [output_file]
 """
 
@@ -9,9 +10,9 @@ import csv
 import sys
 import os
 
-# 상위 디렉토리의 join_csv.py import
+# 상위 디렉토리의 join_chain.py import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from join_csv import join_csv_files
+from join_chain import join_csv_chain
 
 def main():
     # 기본 경로 설정
@@ -19,12 +20,12 @@ def main():
     data_dir = os.path.join(os.path.dirname(os.path.dirname(script_dir)), 'data')
     output_dir = os.path.join(data_dir, 'output')
     
-    left_file = os.path.join(output_dir, 'Vocabulary_join_Meaning.csv')
-    right_file = os.path.join(output_dir, 'Meaning_join_Example.csv')
-    
-    # 조인 키 설정: 두 파일 모두 MeaningId를 가지고 있음
-    left_key = 'MeaningId'  # Vocabulary_join_Meaning.csv의 MeaningId
-    right_key = 'MeaningId'  # Meaning_join_Example.csv의 MeaningId
+    # 조인 체인 설정: (파일, 이전 파일과의 키, 다음 파일과의 키)
+    chain = [
+        (os.path.join(data_dir, 'Vocabulary.csv'), 'Id', 'Id'),                # Vocabulary.Id
+        (os.path.join(data_dir, 'Meaning.csv'), 'VocabularyId', 'Id'),         # Meaning.VocabularyId, Meaning.Id
+        (os.path.join(data_dir, 'Example.csv'), 'MeaningId', 'MeaningId'),     # Example.MeaningId
+    ]
     
     # 인자 파싱
     join_type = 'inner'
@@ -41,9 +42,7 @@ def main():
         output_file = os.path.join(output_dir, 'Vocabulary_Meaning_Example.csv')
     
     # 조인 수행
-    join_csv_files(left_file, right_file, left_key, right_key, 
-                   join_type=join_type, output_file=output_file)
+    join_csv_chain(chain, join_type=join_type, output_file=output_file)
 
 if __name__ == "__main__":
     main()
-
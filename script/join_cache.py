@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+join_csv.py 조인 결과 캐시
+입력 파일 내용의 해시, 조인 키, 조인 타입, 출력 컬럼, 도구 버전으로 만든 키로 조인 결과 CSV를 저장해 두고,
+같은 조인을 다시 실행하면 저장된 파일을 출력 경로에 복사하여 바로 끝낸다.
+결과 파일은 출력 파일과 따로 복사해 두고 (하드 링크를 쓰면 출력 파일을 고칠 때 캐시도 바뀜)
+저장할 때의 SHA-256 해시와 복사할 때 계산한 해시가 다르면 캐시 결과를 버리고 다시 조인한다.
+캐시 전체 크기가 제한을 넘으면 가장 오래 사용하지 않은 결과부터 지운다 (LRU).
+입력 파일 해시는 파일의 크기와 수정 시각이 그대로면 다시 계산하지 않는다.
+DB 테이블 입력은 db 파일과 함께 -wal 파일도 해시하므로, 아직 체크포인트되지 않은 커밋도 키에 반영된다.
+
+사용법: python script/join_cache.py <cache_dir>            (캐시 항목 출력)
+        python script/join_cache.py <cache_dir> --clear    (캐시 비우기)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+
+# 캐시 인덱스 파일명 (캐시 디렉토리에 생성)
+CACHE_INDEX_FILENAME = 'index.json'
+# 인덱스 형식이 바뀌면 올려서 기존 캐시를 버림
+CACHE_VERSION = 1
+# 출력 디렉토리 안의 기본 캐시 디렉토리명 (환경 변수 JOIN_CSV_CACHE_DIR로 변경 가능)
+DEFAULT_CACHE_DIRNAME = '.join_cache'
+# 기본 캐시 크기 제한 (바이트)
+DEFAULT_CACHE_SIZE = 1024 ** 3
+# 도구 버전으로 사용할 소스 파일 (내용이 바뀌면 이전 결과를 재사용하지 않음)
+TOOL_SOURCES = ['join_csv.py', 'join_sqlite.py', 'join_cache.py']
+# 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def get_default_cache_dir(output_file):
+    """
+    기본 캐시 디렉토리 (JOIN_CSV_CACHE_DIR 환경 변수, 없으면 출력 파일 디렉토리의 .join_cache)
+    """
+    cache_dir = os.environ.get('JOIN_CSV_CACHE_DIR')
+    if cache_dir:
+        return cache_dir
+    return os.path.join(os.path.dirname(os.path.abspath(output_file)), DEFAULT_CACHE_DIRNAME)
+
+def load_index(cache_dir):
+    """
+    캐시 인덱스 불러오기
+
+    Returns:
+        {'version': ..., 'entries': {키: {'size', 'sha256', 'last_used', 'stats'}}, 'files': {경로: {'size', 'mtime', 'sha256'}}}
+    """
+    index_file = os.path.join(cache_dir, CACHE_INDEX_FILENAME)
+    index = None
+    if os.path.exists(index_file):
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = None
+    if not index or index.get('version') != CACHE_VERSION:
+        index = {'version': CACHE_VERSION, 'entries': {}, 'files': {}}
+    return index
+
+def save_index(cache_dir, index):
+    """
+    캐시 인덱스 저장 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 인덱스가 깨지지 않음)
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    index_file = os.path.join(cache_dir, CACHE_INDEX_FILENAME)
+    temp_file = f"{index_file}.{os.getpid()}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    os.replace(temp_file, index_file)
+
+def get_object_path(cache_dir, key):
+    """
+    캐시 키의 결과 파일 경로
+    """
+    return os.path.join(cache_dir, 'objects', f"{key}.csv")
+
+def hash_file(path, index):
+    """
+    파일 내용의 SHA-256 해시 (크기와 수정 시각이 인덱스에 기록된 값과 같으면 기록된 해시 사용)
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    cached = index['files'].get(path)
+    if cached and cached['size'] == stat.st_size and cached['mtime'] == stat.st_mtime_ns:
+        return cached['sha256']
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    index['files'][path] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+    return index['files'][path]['sha256']
+
+def hash_input(path, name, index):
+    """
+    입력 파일의 해시 (DB 테이블 입력이면 -wal 파일 내용도 포함: WAL 모드 DB의 커밋은 체크포인트 전까지 -wal에만 있음)
+    """
+    digest = hash_file(path, index)
+    wal_file = f"{path}-wal"
+    if name and os.path.exists(wal_file):
+        digest = hashlib.sha256(f"{digest}:{hash_file(wal_file, index)}".encode('utf-8')).hexdigest()
+    return digest
+
+def get_tool_version(index):
+    """
+    도구 버전 (조인 스크립트 소스 파일 내용의 해시)
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for filename in TOOL_SOURCES:
+        path = os.path.join(script_dir, filename)
+        if os.path.exists(path):
+            digest.update(filename.encode('utf-8'))
+            digest.update(hash_file(path, index).encode('utf-8'))
+    return digest.hexdigest()
+
+def get_cache_key(cache_dir, inputs, params):
+    """
+    조인 결과의 캐시 키 계산
+
+    Args:
+        cache_dir: 캐시 디렉토리
+        inputs: [(입력 파일 경로, 파일 안의 대상 이름(DB 테이블명, CSV 파일이면 '')), ...]
+        params: 결과를 결정하는 조인 설정 (JSON으로 직렬화 가능한 딕셔너리:
+                조인 타입, 조인 키, 출력 컬럼 등)
+
+    Returns:
+        캐시 키 (16진수 문자열)
+    """
+    index = load_index(cache_dir)
+    key_data = {
+        'tool': get_tool_version(index),
+        'inputs': [[hash_input(path, name, index), name] for path, name in inputs],
+        'params': params,
+    }
+    save_index(cache_dir, index)
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def copy_with_hash(source, target):
+    """
+    source 파일을 target 경로에 복사하면서 내용의 SHA-256 해시 계산
+
+    Returns:
+        16진수 해시
+    """
+    digest = hashlib.sha256()
+    with open(source, 'rb') as infile, open(target, 'wb') as outfile:
+        for chunk in iter(lambda: infile.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+            outfile.write(chunk)
+    return digest.hexdigest()
+
+def discard_entry(cache_dir, index, key):
+    """
+    캐시 항목과 결과 파일 제거
+    """
+    del index['entries'][key]
+    object_path = get_object_path(cache_dir, key)
+    if os.path.exists(object_path):
+        os.remove(object_path)
+    save_index(cache_dir, index)
+
+def use_cached_result(cache_dir, key, output_file):
+    """
+    캐시에 결과가 있으면 출력 경로에 복사
+    출력 파일 옆의 임시 파일에 복사하면서 해시를 확인하고, 저장할 때의 해시와 같을 때만 출력 파일로 교체한다.
+
+    Returns:
+        저장된 조인 통계 딕셔너리, 캐시에 없으면 None
+    """
+    index = load_index(cache_dir)
+    entry = index['entries'].get(key)
+    if entry is None:
+        return None
+
+    object_path = get_object_path(cache_dir, key)
+    # 결과 파일이 없어졌거나 바뀌었으면 항목 제거
+    if not os.path.exists(object_path) or os.path.getsize(object_path) != entry['size']:
+        discard_entry(cache_dir, index, key)
+        return None
+
+    temp_file = f"{os.path.abspath(output_file)}.{os.getpid()}.tmp"
+    try:
+        sha256 = copy_with_hash(object_path, temp_file)
+        if sha256 != entry['sha256']:
+            os.remove(temp_file)
+            discard_entry(cache_dir, index, key)
+            return None
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+    entry['last_used'] = time.time()
+    save_index(cache_dir, index)
+    return entry['stats']
+
+def store_result(cache_dir, key, output_file, stats, max_size=DEFAULT_CACHE_SIZE):
+    """
+    조인 결과를 캐시에 저장하고, 전체 크기가 max_size를 넘으면 오래 사용하지 않은 결과부터 제거
+
+    Args:
+        cache_dir: 캐시 디렉토리
+        key: 캐시 키
+        output_file: 조인 결과 CSV 파일 경로
+        stats: 조인 통계 딕셔너리
+        max_size: 캐시 크기 제한 (바이트)
+    """
+    object_path = get_object_path(cache_dir, key)
+    index = load_index(cache_dir)
+    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+    sha256 = copy_with_hash(output_file, object_path)
+
+    index['entries'][key] = {
+        'size': os.path.getsize(object_path),
+        'sha256': sha256,
+        'last_used': time.time(),
+        'stats': stats,
+    }
+
+    # LRU 제거 (방금 저장한 결과는 남김)
+    total_size = sum(entry['size'] for entry in index['entries'].values())
+    for old_key, entry in sorted(index['entries'].items(), key=lambda item: item[1]['last_used']):
+        if total_size <= max_size:
+            break
+        if old_key == key:
+            continue
+        old_path = get_object_path(cache_dir, old_key)
+        if os.path.exists(old_path):
+            os.remove(old_path)
+        total_size -= entry['size']
+        del index['entries'][old_key]
+
+    # 더 이상 없는 입력 파일의 해시 기록 정리
+    index['files'] = {path: info for path, info in index['files'].items() if os.path.exists(path)}
+    save_index(cache_dir, index)
+
+def main():
+    if len(sys.argv) not in [2, 3] or (len(sys.argv) == 3 and sys.argv[2] != '--clear'):
+        print("사용법: python script/join_cache.py <cache_dir>")
+        print("        python script/join_cache.py <cache_dir> --clear")
+        sys.exit(1)
+
+    cache_dir = sys.argv[1]
+    if not os.path.isdir(cache_dir):
+        print(f"오류: 디렉토리 '{cache_dir}'을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    if len(sys.argv) == 3:
+        shutil.rmtree(os.path.join(cache_dir, 'objects'), ignore_errors=True)
+        save_index(cache_dir, {'version': CACHE_VERSION, 'entries': {}, 'files': {}})
+        print(f"캐시를 비웠습니다: {cache_dir}")
+        return
+
+    index = load_index(cache_dir)
+    entries = sorted(index['entries'].items(), key=lambda item: item[1]['last_used'], reverse=True)
+    total_size = sum(entry['size'] for _, entry in entries)
+    print(f"캐시: {cache_dir}")
+    print(f"결과 수: {len(entries)}개, 전체 크기: {total_size} bytes")
+    for key, entry in entries:
+        last_used = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['last_used']))
+        print(f"  {key[:12]}  {entry['size']} bytes  마지막 사용: {last_used}  행: {entry['stats']['joined']}개")
+
+if __name__ == "__main__":
+    main()
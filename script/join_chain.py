@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+여러 CSV 파일을 한 번에 연쇄 조인하는 스크립트 (중간 파일 없이 파이프라인으로 처리)
+예: words -> definitions -> examples 를 한 번의 읽기로 조인
+컬럼명 규칙은 join_csv.py의 직접 조인과 같음 (Id -> {테이블명}Id, 중복 컬럼은 왼쪽 것만 유지)
+
+사용법: python script/join_chain.py <file1.csv>:<key> <file2.csv>:<key>[:<next_key>] ... [join_type] [output_file]
+예시: python script/join_chain.py words.csv:word_id definitions.csv:word_id:definition_id examples.csv:definition_id
+"""
+
+import csv
+import sys
+import os
+
+from join_csv import get_direct_output_plan, make_values_getter, read_csv_rows
+
+def parse_chain_item(item):
+    """
+    '<file>:<key>[:<next_key>]' 형식의 인자를 해석
+
+    Args:
+        item: 체인 인자 문자열
+
+    Returns:
+        (파일 경로, 이전 테이블과 조인하는 키, 다음 테이블과 조인하는 키) 또는 None
+    """
+    parts = item.rsplit(':', 2)
+    # 경로에 ':'가 들어간 경우(예: Windows 드라이브 문자)를 위해 .csv로 끝나는 부분까지를 경로로 사용
+    while len(parts) > 1 and not parts[0].lower().endswith('.csv'):
+        parts = [parts[0] + ':' + parts[1]] + parts[2:]
+    if len(parts) < 2 or not parts[1]:
+        return None
+    csv_file = parts[0]
+    key = parts[1]
+    next_key = parts[2] if len(parts) > 2 and parts[2] else key
+    return csv_file, key, next_key
+
+def join_csv_chain(chain, join_type='inner', output_file=None):
+    """
+    CSV 파일들을 순서대로 연쇄 조인 ((file1 ⋈ file2) ⋈ file3 ⋈ ...)
+    첫 번째 파일은 스트리밍으로 읽고, 나머지 파일은 해시 인덱스로 만든 뒤
+    각 행을 모든 단계에 차례로 통과시켜 바로 출력 파일에 기록한다.
+
+    Args:
+        chain: [(파일 경로, 키, 다음 키), ...] - 첫 파일은 다음 키만 사용
+        join_type: 조인 타입 ('inner', 'left')
+        output_file: 출력 CSV 파일 경로 (None이면 자동 생성)
+    """
+    if len(chain) < 2:
+        print("오류: 최소 두 개의 파일을 지정해야 합니다.")
+        sys.exit(1)
+
+    if join_type not in ['inner', 'left']:
+        print(f"오류: 잘못된 조인 타입 '{join_type}'입니다.")
+        print("      사용 가능한 타입: inner, left")
+        sys.exit(1)
+
+    for csv_file, _, _ in chain:
+        if not os.path.exists(csv_file):
+            print(f"오류: 파일 '{csv_file}'을 찾을 수 없습니다.")
+            sys.exit(1)
+
+    table_names = [os.path.splitext(os.path.basename(csv_file))[0] for csv_file, _, _ in chain]
+
+    if output_file is None:
+        # 첫 번째 파일의 디렉토리에 output 폴더 생성
+        input_dir = os.path.dirname(os.path.abspath(chain[0][0]))
+        output_dir = os.path.join(input_dir, 'output')
+        os.makedirs(output_dir, exist_ok=True)
+        output_file = os.path.join(output_dir, f"{'_'.join(table_names)}.csv")
+
+    # 각 파일의 컬럼명 읽기
+    fieldnames_list = []
+    for csv_file, key, next_key in chain:
+        with open(csv_file, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            fieldnames = list(reader.fieldnames)
+        for col in [key, next_key]:
+            if col not in fieldnames:
+                print(f"오류: '{csv_file}'에 '{col}' 컬럼이 없습니다.")
+                print(f"사용 가능한 컬럼: {', '.join(fieldnames)}")
+                sys.exit(1)
+        fieldnames_list.append(fieldnames)
+
+    # 단계별 조인 설정 계산
+    # 누적 행에서 이전 테이블의 next_key가 어떤 이름으로 남아있는지 추적 (Id -> {테이블명}Id 변환 등)
+    output_fieldnames = list(fieldnames_list[0])
+    column_names = {}
+    steps = []
+    for i in range(1, len(chain)):
+        right_file, right_key, _ = chain[i]
+        right_fieldnames = fieldnames_list[i]
+        # 첫 단계는 첫 번째 파일의 컬럼 그대로, 이후 단계는 직전 테이블의 next_key가 누적 행에서 갖는 이름
+        left_key = chain[0][2] if i == 1 else column_names[chain[i - 1][2]]
+        left_table_name = table_names[i - 1]
+        right_table_name = table_names[i]
+
+        new_fieldnames, right_indices = get_direct_output_plan(
+            output_fieldnames, right_fieldnames, left_key, right_key, left_table_name, right_table_name)
+
+        # 오른쪽 컬럼이 누적 행에서 갖는 이름 (키 컬럼은 왼쪽 키와 같은 값)
+        column_names = {}
+        for col in right_fieldnames:
+            if col == right_key:
+                column_names[col] = f"{left_table_name}Id" if i == 1 and left_key.lower() == 'id' else left_key
+            elif col.lower() == 'id':
+                column_names[col] = f"{right_table_name}Id"
+            else:
+                column_names[col] = col
+
+        # 누적 행은 출력 컬럼 순서의 튜플이므로 왼쪽 키는 위치로 찾음
+        steps.append({
+            'right_file': right_file,
+            'right_key_index': right_fieldnames.index(right_key),
+            'left_key_index': output_fieldnames.index(left_key),
+            'get_right': make_values_getter(right_indices),
+            'width': len(right_indices),
+        })
+        output_fieldnames = new_fieldnames
+    
+    # 단계에서 매칭되지 않으면 그 단계부터 끝까지의 컬럼을 빈 값으로 채움
+    for i, step in enumerate(steps):
+        step['empty_rest'] = ('',) * sum(later['width'] for later in steps[i:])
+
+    # 두 번째 파일부터 해시 인덱스 생성
+    for step in steps:
+        index = {}
+        key_index = step['right_key_index']
+        for row in read_csv_rows(step['right_file']):
+            key = row[key_index].strip()
+            if key:
+                if key not in index:
+                    index[key] = []
+                index[key].append(row)
+        step['index'] = index
+        print(f"{os.path.basename(step['right_file'])}: {len(index)}개의 고유 키, "
+              f"{sum(len(rows) for rows in index.values())}개 행")
+
+    # 첫 번째 파일을 스트리밍하며 모든 단계를 차례로 적용
+    joined_count = 0
+    left_only_count = 0
+
+    def expand(row, step_index):
+        """
+        누적 행 하나를 step_index 단계부터 끝까지 조인한 결과 행들을 생성
+        """
+        if step_index == len(steps):
+            yield row, True
+            return
+        step = steps[step_index]
+        key = row[step['left_key_index']].strip()
+        right_rows = step['index'].get(key) if key else None
+        if right_rows:
+            get_right = step['get_right']
+            for right_row in right_rows:
+                yield from expand((*row, *get_right(right_row)), step_index + 1)
+        elif join_type == 'left':
+            # 매칭되지 않은 단계부터는 나머지 컬럼을 빈 값으로 채움
+            yield (*row, *step['empty_rest']), False
+
+    with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(output_fieldnames)
+        for row in read_csv_rows(chain[0][0]):
+            for new_row, matched in expand(row, 0):
+                writer.writerow(new_row)
+                joined_count += 1
+                if not matched:
+                    left_only_count += 1
+
+    print(f"\n연쇄 조인 완료!")
+    for (csv_file, key, next_key), table_name in zip(chain, table_names):
+        print(f"  {table_name}: {csv_file} (키: {key}" + (f" -> {next_key})" if next_key != key else ")"))
+    print(f"  조인 타입: {join_type}")
+    print(f"  출력 파일: {output_file}")
+    print(f"\n통계:")
+    print(f"  총 조인된 행: {joined_count}개")
+    print(f"  매칭된 행: {joined_count - left_only_count}개")
+    if join_type == 'left':
+        print(f"  일부 단계에서 매칭되지 않은 행: {left_only_count}개")
+
+def main():
+    if len(sys.argv) < 3:
+        print("사용법: python script/join_chain.py <file1.csv>:<key> <file2.csv>:<key>[:<next_key>] ... [join_type] [output_file]")
+        print("예시: python script/join_chain.py words.csv:word_id definitions.csv:word_id:definition_id examples.csv:definition_id")
+        print("      python script/join_chain.py Vocabulary.csv:Id Meaning.csv:VocabularyId:Id Example.csv:MeaningId left output.csv")
+        print("\n각 파일은 '<파일>:<키>[:<다음 키>]' 형식:")
+        print("  키: 이전 파일과 조인하는 컬럼 (첫 번째 파일은 다음 파일과 조인하는 컬럼)")
+        print("  다음 키: 다음 파일과 조인하는 컬럼 (생략하면 키와 같음)")
+        print("\n조인 타입:")
+        print("  inner: 모든 단계에서 매칭된 행만 (기본값)")
+        print("  left: 첫 번째 파일의 모든 행 + 매칭")
+        sys.exit(1)
+
+    chain = []
+    join_type = 'inner'
+    output_file = None
+
+    for arg in sys.argv[1:]:
+        if arg in ['inner', 'left']:
+            join_type = arg
+            continue
+        item = parse_chain_item(arg)
+        if item is not None:
+            chain.append(item)
+        elif arg.endswith('.csv'):
+            output_file = arg
+        else:
+            print(f"경고: '{arg}'는 무시됩니다.")
+
+    join_csv_chain(chain, join_type, output_file)
+
+if __name__ == "__main__":
+    main()
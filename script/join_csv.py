@@ -2,147 +2,1238 @@
 # -*- coding: utf-8 -*-
 """
 두 CSV 파일을 조인하는 스크립트 (중간 테이블을 통한 간접 조인 지원)
-사용법: python script/join_csv.py <left_file.csv> <right_file.csv> <left_key> <right_key> [middle_file.csv] [join_type] [output_file]
+사용법: python script/join_csv.py <left_file.csv> <right_file.csv> <left_key> <right_key> [middle_file.csv] [join_type] [output_file] [--memory-limit SIZE] [--engine hash|merge|sqlite] [--workers N] [--no-cache] [--cache-dir DIR] [--cache-size SIZE]
 """
 
 import csv
+import heapq
+import math
+import operator
 import sys
 import os
+import sqlite3
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from csv_catalog import find_join_path, infer_middle_keys
+from join_cache import DEFAULT_CACHE_SIZE, get_cache_key, get_default_cache_dir, store_result, use_cached_result
+
+# 해시 인덱스(딕셔너리)가 CSV 파일 크기 대비 차지하는 메모리 배율 (대략치)
+HASH_MEMORY_FACTOR = 8
+# 그레이스 해시 조인의 최대 파티션 수 (동시에 여는 버킷 파일 수 제한)
+MAX_PARTITIONS = 256
+# 지원하는 조인 타입
+JOIN_TYPES = ['inner', 'left', 'right', 'full', 'semi', 'anti']
+# '<db 파일>:<테이블>' 형식 입력으로 인식하는 데이터베이스 파일 확장자 (--engine sqlite)
+DB_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
 
 def find_indirect_path(left_file, right_file, left_key, right_key):
     """
     중간 테이블을 통한 간접 조인 경로 찾기
-    data 폴더의 모든 CSV 파일을 탐색하여 두 키를 모두 가진 중간 파일을 찾음
+    data 폴더의 CSV 카탈로그(csv_catalog.py)에서 추론한 외래 키 그래프를 탐색하여
+    중간 테이블 하나를 거치는 경로를 찾음
     
     Returns:
-        (middle_file, left_to_middle_key, middle_id, middle_to_right_key) 또는 None
+        (middle_file, left_to_middle, middle_id, middle_to_right) 또는 None
+    """
+    path = find_join_path(left_file, right_file, left_key, right_key)
+    if not path or len(path) != 2:
+        return None
+    (_, _, middle_file, left_to_middle), (_, middle_id, _, _) = path
+    return (middle_file, left_to_middle, middle_id, middle_id)
+
+def parse_db_input(path):
     """
-    # 왼쪽/오른쪽 파일의 디렉토리 찾기 (보통 data 폴더)
-    left_dir = os.path.dirname(os.path.abspath(left_file))
-    right_dir = os.path.dirname(os.path.abspath(right_file))
+    '<db 파일>:<테이블>' 형식의 입력 해석 (예: data/ielts_voca_20_30.db:words)
     
-    # 공통 디렉토리 찾기 (보통 둘 다 같은 data 폴더에 있음)
-    search_dir = left_dir if left_dir == right_dir else left_dir
+    Returns:
+        (db 파일 경로, 테이블명) 또는 None (CSV 파일 입력)
+    """
+    db_file, sep, table = path.rpartition(':')
+    if sep and table and db_file.lower().endswith(DB_EXTENSIONS):
+        return db_file, table
+    return None
+
+def input_exists(path):
+    """
+    입력 파일(CSV 파일 또는 DB 테이블의 db 파일)이 있는지 확인
+    """
+    db_input = parse_db_input(path)
+    return os.path.exists(db_input[0] if db_input else path)
+
+def read_input_columns(path):
+    """
+    입력의 컬럼명 읽기 (CSV 파일은 헤더, DB 테이블은 테이블 정의)
     
-    # 왼쪽/오른쪽 파일명에서 테이블명 추출
-    left_table_name = os.path.splitext(os.path.basename(left_file))[0]
-    right_table_name = os.path.splitext(os.path.basename(right_file))[0]
+    Returns:
+        컬럼명 리스트 (DB에 테이블이 없으면 빈 리스트)
+    """
+    db_input = parse_db_input(path)
+    if db_input is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            return list(reader.fieldnames)
     
-    # 왼쪽/오른쪽 파일의 전체 경로 (제외할 파일)
-    left_abs = os.path.abspath(left_file)
-    right_abs = os.path.abspath(right_file)
+    db_file, table = db_input
+    conn = sqlite3.connect(db_file)
+    try:
+        cursor = conn.execute(f'PRAGMA table_info("{table}")')
+        return [row[1] for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+def get_input_table_name(path):
+    """
+    입력의 테이블명 (CSV 파일은 확장자를 뺀 파일명, DB 테이블은 테이블명)
+    """
+    db_input = parse_db_input(path)
+    if db_input:
+        return db_input[1]
+    return os.path.splitext(os.path.basename(path))[0]
+
+def read_csv_rows(csv_file):
+    """
+    CSV 파일의 데이터 행을 리스트로 읽기 (헤더 제외)
+    csv.DictReader와 같이 빈 줄은 건너뛰고, 컬럼 수보다 짧은 행은 빈 값으로 채움
+    (컬럼 수보다 긴 행의 나머지 값은 버림)
     
-    # search_dir의 모든 CSV 파일 탐색 (output 하위 제외)
-    if not os.path.exists(search_dir):
-        return None
+    Yields:
+        행 리스트 (길이는 항상 헤더의 컬럼 수)
+    """
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        width = len(header) if header else 0
+        for row in reader:
+            if not row:
+                continue
+            length = len(row)
+            if length < width:
+                row.extend([''] * (width - length))
+            elif length > width:
+                del row[width:]
+            yield row
+
+def make_values_getter(indices):
+    """
+    행 리스트에서 주어진 위치의 값들을 튜플로 꺼내는 함수 생성
+    """
+    if not indices:
+        return lambda row: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: (row[index],)
+    return operator.itemgetter(*indices)
+
+def compile_row_builder(spec):
+    """
+    조인 설정의 출력 계획으로 출력 행 생성 함수 만들기
+    행마다 컬럼명을 다시 계산하지 않고, 미리 계산한 위치로 값을 꺼내 튜플을 만든다.
+    출력 행 = 왼쪽 행 전체 + 중간 행의 middle_indices 위치 값 + 오른쪽 행의 right_indices 위치 값
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+    
+    Returns:
+        build(left_row, middle_row, right_row) -> 출력 행 튜플
+        (매칭되지 않은 쪽은 None, 직접 조인에서는 middle_row를 사용하지 않음)
+    """
+    middle_indices = spec.get('middle_indices', [])
+    right_indices = spec['right_indices']
+    get_middle = make_values_getter(middle_indices)
+    get_right = make_values_getter(right_indices)
+    empty_middle = ('',) * len(middle_indices)
+    empty_right = ('',) * len(right_indices)
+    
+    def build(left_row, middle_row, right_row):
+        return (*left_row,
+                *(get_middle(middle_row) if middle_row is not None else empty_middle),
+                *(get_right(right_row) if right_row is not None else empty_right))
+    
+    return build
+
+def get_empty_left_row(spec, key):
+    """
+    오른쪽에만 있는 행에 사용할 빈 왼쪽 행 생성
+    직접 조인에서 왼쪽 키가 Id이면 ({테이블명}Id 컬럼) 조인 키 값을 채움
+    """
+    empty_left_row = [''] * len(spec['left_fieldnames'])
+    if 'middle_file' not in spec and spec['left_key'].lower() == 'id':
+        empty_left_row[spec['left_key_index']] = key
+    return empty_left_row
+
+def find_middle_keys(middle_fieldnames, left_key, right_key):
+    """
+    중간 테이블에서 조인에 사용할 컬럼 찾기
+    
+    Args:
+        middle_fieldnames: 중간 테이블의 컬럼명 리스트
+        left_key: 왼쪽 파일의 키 컬럼명
+        right_key: 오른쪽 파일의 키 컬럼명
+        
+    Returns:
+        (left_to_middle, middle_id, middle_to_right) - 찾지 못한 항목은 None
+    """
+    left_to_middle = None
+    middle_id = None
+    middle_to_right = None
+    
+    # left_key를 참조하는 컬럼 찾기 (예: VocabularyId)
+    # Vocabulary.Id -> Meaning.VocabularyId
+    for col in middle_fieldnames:
+        # Id를 VocabularyId로 변환하거나, VocabularyId 컬럼 찾기
+        if left_key.lower() == 'id':
+            # Vocabulary의 Id를 찾는 경우 -> VocabularyId 컬럼 찾기
+            if 'vocabulary' in col.lower() and 'id' in col.lower():
+                left_to_middle = col
+                break
+        elif left_key.lower() in col.lower() or col.lower() in left_key.lower():
+            if 'id' in col.lower():
+                left_to_middle = col
+                break
     
-    # CSV 파일 목록 수집
-    csv_files = []
-    for root, dirs, files in os.walk(search_dir):
-        # output 하위 디렉토리 제외
-        if 'output' in root.split(os.sep):
+    # middle_id 찾기 (Meaning의 Id)
+    if 'Id' in middle_fieldnames:
+        middle_id = 'Id'
+    
+    # right_key를 참조하는 컬럼 찾기 (예: MeaningId)
+    # Example.MeaningId -> Meaning.Id
+    # right_key가 MeaningId인 경우, 중간 테이블의 Id를 사용
+    if right_key.lower() == 'meaningid' or ('meaning' in right_key.lower() and 'id' in right_key.lower()):
+        # MeaningId는 중간 테이블의 Id를 참조
+        middle_to_right = middle_id  # Meaning.Id
+    else:
+        # 다른 경우 컬럼에서 찾기
+        for col in middle_fieldnames:
+            if right_key.lower() in col.lower() or col.lower() in right_key.lower():
+                if 'id' in col.lower():
+                    middle_to_right = col
+                    break
+    
+    return left_to_middle, middle_id, middle_to_right
+
+def get_direct_output_plan(left_fieldnames, right_fieldnames, left_key, right_key, left_table_name, right_table_name):
+    """
+    직접 조인의 출력 계획 생성 (중복 제거)
+    출력 행은 왼쪽 행 전체 뒤에 오른쪽 행의 right_indices 위치 값을 붙인 것
+    
+    Returns:
+        (출력 컬럼명 리스트, 출력에 들어가는 오른쪽 컬럼 위치 리스트)
+    """
+    # 왼쪽 컬럼: Id는 {파일명}Id로 변경
+    output_fieldnames = []
+    for col in left_fieldnames:
+        if col == left_key and col.lower() == 'id':
+            # Id 컬럼은 파일명Id로 변경
+            output_fieldnames.append(f"{left_table_name}Id")
+        else:
+            output_fieldnames.append(col)
+    
+    # 오른쪽 컬럼 추가 (중복 제거)
+    right_indices = []
+    for index, col in enumerate(right_fieldnames):
+        if col == right_key:
+            # 키 컬럼은 제외 (이미 왼쪽에 있거나 조인 키로 사용됨)
             continue
+        # Id 컬럼은 파일명Id로 변경
+        new_col = f"{right_table_name}Id" if col.lower() == 'id' else col
+        # 중복 컬럼은 제외 (왼쪽 것만 유지)
+        if new_col not in output_fieldnames:
+            output_fieldnames.append(new_col)
+            right_indices.append(index)
+    
+    return output_fieldnames, right_indices
+
+def get_indirect_output_plan(left_fieldnames, middle_fieldnames, right_fieldnames, left_to_middle, middle_id, actual_right_key):
+    """
+    간접 조인의 출력 계획 생성 (중복 컬럼은 _middle, _right 접미사)
+    출력 행은 왼쪽 행 전체 뒤에 중간 행의 middle_indices 위치 값, 오른쪽 행의 right_indices 위치 값을 붙인 것
+    
+    Returns:
+        (출력 컬럼명 리스트, 중간 컬럼 위치 리스트, 오른쪽 컬럼 위치 리스트)
+    """
+    output_fieldnames = list(left_fieldnames)
+    middle_indices = []
+    for index, col in enumerate(middle_fieldnames):
+        if col != left_to_middle and col != middle_id:
+            if col not in output_fieldnames:
+                output_fieldnames.append(col)
+            else:
+                output_fieldnames.append(f"{col}_middle")
+            middle_indices.append(index)
+    right_indices = []
+    for index, col in enumerate(right_fieldnames):
+        if col != actual_right_key:
+            if col not in output_fieldnames:
+                output_fieldnames.append(col)
+            else:
+                output_fieldnames.append(f"{col}_right")
+            right_indices.append(index)
+    return output_fieldnames, middle_indices, right_indices
+
+def new_join_stats():
+    """
+    조인 통계 딕셔너리 생성
+    """
+    return {'joined': 0, 'matched': 0, 'left_only': 0, 'right_only': 0}
+
+def join_direct_in_memory(spec, writer):
+    """
+    직접 조인 (인메모리 해시 조인)
+    오른쪽 파일 전체를 해시 인덱스로 만들고 왼쪽 파일을 스트리밍하며 조인
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    left_key_index = spec['left_key_index']
+    right_key_index = spec['right_key_index']
+    join_type = spec['join_type']
+    build_row = compile_row_builder(spec)
+    stats = new_join_stats()
+    
+    # 오른쪽 파일 읽기 (인덱스 생성)
+    right_data = {}
+    for row in read_csv_rows(spec['right_file']):
+        key = row[right_key_index].strip()
+        if key:
+            if key not in right_data:
+                right_data[key] = []
+            right_data[key].append(row)
+    
+    print(f"오른쪽 파일: {len(right_data)}개의 고유 키, {sum(len(rows) for rows in right_data.values())}개 행")
+    
+    # RIGHT/FULL 조인: 조인하면서 매칭된 오른쪽 키를 기록 (왼쪽 파일을 다시 읽지 않음)
+    track_matched = join_type in ['right', 'full']
+    matched_keys = set()
+    
+    # 왼쪽 파일 읽기 및 조인 (결과 행은 만들어지는 즉시 출력 파일에 기록)
+    for row in read_csv_rows(spec['left_file']):
+        key = row[left_key_index].strip()
         
-        for file in files:
-            if file.lower().endswith('.csv'):
-                file_path = os.path.join(root, file)
-                # 왼쪽/오른쪽 파일 자체는 제외
-                abs_path = os.path.abspath(file_path)
-                if abs_path == left_abs or abs_path == right_abs:
-                    continue
-                csv_files.append(file_path)
-    
-    # 각 CSV 파일을 중간 테이블 후보로 검사
-    for middle_file in csv_files:
-        try:
-            with open(middle_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                middle_columns = list(reader.fieldnames)
-                
-                if not middle_columns:
-                    continue
-                
-                # 중간 테이블의 Id 컬럼 찾기
-                middle_id = None
-                for col in middle_columns:
-                    if col.lower() == 'id':
-                        middle_id = col
-                        break
+        # 오른쪽에서 매칭되는 행 찾기
+        if key and key in right_data:
+            # 매칭됨: 조인
+            if track_matched:
+                matched_keys.add(key)
+            for right_row in right_data[key]:
+                writer.writerow(build_row(row, None, right_row))
+                stats['joined'] += 1
+                stats['matched'] += 1
+        elif join_type in ['left', 'full']:
+            # 키가 없거나 매칭 안됨: 왼쪽만 포함 (오른쪽 컬럼은 빈 값)
+            writer.writerow(build_row(row, None, None))
+            stats['joined'] += 1
+            stats['left_only'] += 1
+    
+    # RIGHT JOIN 또는 FULL JOIN: 오른쪽에만 있는 행 추가
+    if track_matched:
+        for key, right_rows in right_data.items():
+            if key not in matched_keys:
+                # 오른쪽에만 있는 행: 왼쪽 컬럼은 빈 값으로 채움
+                empty_left_row = get_empty_left_row(spec, key)
+                for right_row in right_rows:
+                    writer.writerow(build_row(empty_left_row, None, right_row))
+                    stats['joined'] += 1
+                    stats['right_only'] += 1
+    
+    return stats
+
+def join_indirect_in_memory(spec, writer):
+    """
+    간접 조인 (인메모리 해시 조인)
+    중간 테이블과 오른쪽 파일을 해시 인덱스로 만들고 왼쪽 파일을 스트리밍하며 조인
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    left_key_index = spec['left_key_index']
+    middle_key_index = spec['middle_key_index']
+    middle_id_index = spec['middle_id_index']
+    right_key_index = spec['right_key_index']
+    join_type = spec['join_type']
+    build_row = compile_row_builder(spec)
+    stats = new_join_stats()
+    
+    # 중간 테이블 인덱스 생성 (left_to_middle -> middle_id)
+    middle_data = {}
+    for row in read_csv_rows(spec['middle_file']):
+        key = row[middle_key_index].strip()
+        mid_id = row[middle_id_index].strip()
+        if key and mid_id:
+            if key not in middle_data:
+                middle_data[key] = []
+            middle_data[key].append((mid_id, row))
+    
+    print(f"중간 테이블: {len(middle_data)}개의 고유 키, {sum(len(rows) for rows in middle_data.values())}개 행")
+    
+    # 오른쪽 파일 읽기 (middle_id를 키로)
+    right_data = {}
+    for row in read_csv_rows(spec['right_file']):
+        key = row[right_key_index].strip()
+        if key:
+            if key not in right_data:
+                right_data[key] = []
+            right_data[key].append(row)
+    
+    print(f"오른쪽 파일: {len(right_data)}개의 고유 키, {sum(len(rows) for rows in right_data.values())}개 행")
+    
+    # RIGHT/FULL 조인: 조인하면서 왼쪽과 연결된 middle_id를 기록 (왼쪽 파일을 다시 읽지 않음)
+    track_matched = join_type in ['right', 'full']
+    matched_middle_ids = set()
+    
+    # 간접 조인 수행 (결과 행은 만들어지는 즉시 출력 파일에 기록)
+    for row in read_csv_rows(spec['left_file']):
+        key = row[left_key_index].strip()
+        
+        # 중간 테이블에서 매칭
+        if key and key in middle_data:
+            for mid_id, middle_row in middle_data[key]:
+                if track_matched:
+                    matched_middle_ids.add(mid_id)
+                # 오른쪽 테이블에서 매칭
+                if mid_id in right_data:
+                    for right_row in right_data[mid_id]:
+                        writer.writerow(build_row(row, middle_row, right_row))
+                        stats['joined'] += 1
+                        stats['matched'] += 1
+                elif join_type in ['left', 'full']:
+                    # 중간은 있지만 오른쪽이 없음
+                    writer.writerow(build_row(row, middle_row, None))
+                    stats['joined'] += 1
+                    stats['left_only'] += 1
+        elif join_type in ['left', 'full']:
+            # 키가 없거나 왼쪽에만 있음
+            writer.writerow(build_row(row, None, None))
+            stats['joined'] += 1
+            stats['left_only'] += 1
+    
+    # RIGHT JOIN 또는 FULL JOIN 처리
+    if track_matched:
+        empty_left_row = get_empty_left_row(spec, '')
+        for mid_id, right_rows in right_data.items():
+            if mid_id not in matched_middle_ids:
+                for right_row in right_rows:
+                    writer.writerow(build_row(empty_left_row, None, right_row))
+                    stats['joined'] += 1
+                    stats['right_only'] += 1
+    
+    return stats
+
+def parse_memory_limit(text):
+    """
+    메모리 제한 문자열을 바이트 수로 변환
+    예: '512M' -> 536870912, '2G', '100k', '1048576'
+    
+    Args:
+        text: 메모리 제한 문자열 (K/M/G 단위 지원, 대소문자 무시)
+        
+    Returns:
+        바이트 수 (정수), 형식이 잘못되었으면 None
+    """
+    units = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+    value = text.strip().lower()
+    if value.endswith('b'):
+        value = value[:-1]
+    multiplier = 1
+    if value and value[-1] in units:
+        multiplier = units[value[-1]]
+        value = value[:-1]
+    try:
+        size = int(float(value) * multiplier)
+    except ValueError:
+        return None
+    return size if size > 0 else None
+
+def get_partition_count(build_files, memory_limit):
+    """
+    메모리 제한 안에서 한 버킷의 해시 인덱스를 만들 수 있도록 파티션 수 계산
+    
+    Args:
+        build_files: 해시 인덱스를 만들 (빌드 쪽) 파일 경로 리스트
+        memory_limit: 메모리 제한 (바이트)
+        
+    Returns:
+        파티션 수 (1 ~ MAX_PARTITIONS)
+    """
+    build_size = sum(os.path.getsize(path) for path in build_files)
+    count = math.ceil(build_size * HASH_MEMORY_FACTOR / memory_limit)
+    return max(1, min(MAX_PARTITIONS, count))
+
+def get_partition(key, num_partitions):
+    """
+    조인 키의 파티션 번호 계산 (프로세스와 무관하게 항상 같은 값)
+    """
+    return zlib.crc32(key.encode('utf-8')) % num_partitions
+
+def partition_csv_file(csv_file, key_index, num_partitions, temp_dir, prefix, skip_empty_key):
+    """
+    CSV 파일을 조인 키의 해시값으로 나누어 버킷 파일에 기록
+    각 버킷 행은 [행 번호, 키, 값...] 형태이며, 버킷 안에서는 원래 파일 순서를 유지
+    
+    Args:
+        csv_file: 입력 CSV 파일 경로
+        key_index: 조인 키 컬럼 위치
+        num_partitions: 파티션 수
+        temp_dir: 버킷 파일을 만들 임시 디렉토리
+        prefix: 버킷 파일명 접두사
+        skip_empty_key: True면 키가 비어있는 행은 버림
+    
+    Returns:
+        버킷 파일 경로 리스트
+    """
+    paths = [os.path.join(temp_dir, f"{prefix}_{i}.csv") for i in range(num_partitions)]
+    files = [open(path, 'w', encoding='utf-8', newline='') for path in paths]
+    try:
+        writers = [csv.writer(f) for f in files]
+        for seq, row in enumerate(read_csv_rows(csv_file), start=1):
+            key = row[key_index].strip()
+            if not key and skip_empty_key:
+                continue
+            writers[get_partition(key, num_partitions)].writerow([seq, key, *row])
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+def read_bucket(path):
+    """
+    버킷 파일의 행을 순서대로 읽기
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for record in csv.reader(f):
+            yield record
+
+def merge_partition_outputs(output_paths, writer, num_sort_keys):
+    """
+    버킷별 조인 결과 파일을 정렬 키 순서로 병합하여 최종 출력에 기록
+    각 버킷 결과는 이미 정렬 키 순서로 기록되어 있으므로 k-way 병합만 수행
+    
+    Args:
+        output_paths: 버킷별 결과 파일 경로 리스트
+        writer: 출력 csv.writer
+        num_sort_keys: 결과 행 앞에 붙은 정렬 키 개수
+    """
+    def sort_key(record):
+        return tuple(int(value) for value in record[:num_sort_keys])
+    
+    streams = [read_bucket(path) for path in output_paths]
+    for record in heapq.merge(*streams, key=sort_key):
+        writer.writerow(record[num_sort_keys:])
+
+def partition_inputs(pool, jobs):
+    """
+    입력 파일들을 버킷 파일로 나누기 (pool이 있으면 파일마다 별도 프로세스에서 동시에 수행)
+    
+    Args:
+        pool: concurrent.futures.ProcessPoolExecutor 또는 None
+        jobs: partition_csv_file 인자 튜플 리스트
+    """
+    if pool is None:
+        for job in jobs:
+            partition_csv_file(*job)
+    else:
+        futures = [pool.submit(partition_csv_file, *job) for job in jobs]
+        for future in futures:
+            future.result()
+
+def run_bucket_tasks(pool, task_function, spec, temp_dir, num_partitions, num_tasks):
+    """
+    버킷 처리 함수를 작업 단위로 나누어 실행 (pool이 있으면 작업마다 별도 프로세스)
+    작업 t는 t, t + num_tasks, t + 2 * num_tasks, ... 번 버킷을 처리하며,
+    버킷 파일 이름이 정해져 있으므로 작업끼리 주고받는 데이터는 없다.
+    (단계 사이의 중간 파일은 {접두사}_{작업}_{버킷}.csv로 나누어 기록하고, 다음 단계는 모든 작업의 파일을 읽음)
+    
+    Args:
+        pool: concurrent.futures.ProcessPoolExecutor 또는 None
+        task_function: task_function(spec, temp_dir, num_partitions, num_tasks, task) -> 조인 통계
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        temp_dir: 버킷 파일 임시 디렉토리
+        num_partitions: 파티션 수
+        num_tasks: 작업 수
+    
+    Returns:
+        작업별 통계를 합친 조인 통계 딕셔너리
+    """
+    args = [(spec, temp_dir, num_partitions, num_tasks, task) for task in range(num_tasks)]
+    if pool is None:
+        results = [task_function(*task_args) for task_args in args]
+    else:
+        results = list(pool.map(task_function, *zip(*args)))
+    
+    stats = new_join_stats()
+    for result in results:
+        for name in stats:
+            stats[name] += result[name]
+    return stats
+
+def join_direct_buckets(spec, temp_dir, num_partitions, num_tasks, task):
+    """
+    직접 조인의 버킷 쌍 조인 (작업 하나가 맡은 버킷들)
+    버킷마다 오른쪽 행으로 해시 인덱스를 만들고 왼쪽 행을 조인하여 out_{버킷}.csv에 기록.
+    결과 행 앞에는 (단계, 왼쪽 행 번호, 오른쪽 행 번호) 정렬 키를 붙인다.
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    join_type = spec['join_type']
+    build_row = compile_row_builder(spec)
+    stats = new_join_stats()
+    
+    for bucket in range(task, num_partitions, num_tasks):
+        # 버킷의 오른쪽 행으로 해시 인덱스 생성 (키 -> [(행 번호, 행)])
+        right_data = {}
+        for record in read_bucket(os.path.join(temp_dir, f"right_{bucket}.csv")):
+            right_data.setdefault(record[1], []).append((record[0], record[2:]))
+        
+        with open(os.path.join(temp_dir, f"out_{bucket}.csv"), 'w', encoding='utf-8', newline='') as outfile:
+            bucket_writer = csv.writer(outfile)
+            
+            left_keys = set()
+            for record in read_bucket(os.path.join(temp_dir, f"left_{bucket}.csv")):
+                seq, key, row = record[0], record[1], record[2:]
+                if key:
+                    left_keys.add(key)
                 
-                if not middle_id:
+                if key and key in right_data:
+                    for right_seq, right_row in right_data[key]:
+                        bucket_writer.writerow((0, seq, right_seq, *build_row(row, None, right_row)))
+                        stats['joined'] += 1
+                        stats['matched'] += 1
+                elif join_type in ['left', 'full']:
+                    bucket_writer.writerow((0, seq, 0, *build_row(row, None, None)))
+                    stats['joined'] += 1
+                    stats['left_only'] += 1
+            
+            # 오른쪽에만 있는 행: 키가 처음 나온 행 번호 순서로 정렬
+            if join_type in ['right', 'full']:
+                for key, right_rows in right_data.items():
+                    if key in left_keys:
+                        continue
+                    first_seq = right_rows[0][0]
+                    empty_left_row = get_empty_left_row(spec, key)
+                    for right_seq, right_row in right_rows:
+                        bucket_writer.writerow((1, first_seq, right_seq, *build_row(empty_left_row, None, right_row)))
+                        stats['joined'] += 1
+                        stats['right_only'] += 1
+    
+    return stats
+
+def join_direct_grace(spec, writer, num_partitions, temp_dir, pool=None, num_tasks=1):
+    """
+    직접 조인 (디스크 스필 그레이스 해시 조인)
+    양쪽 파일을 조인 키 해시로 파티션한 뒤 버킷 쌍마다 해시 조인을 수행.
+    버킷 결과에 (단계, 왼쪽 행 번호, 오른쪽 행 번호) 정렬 키를 붙여 병합하므로
+    인메모리 조인과 바이트 단위로 같은 출력을 만든다.
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+        num_partitions: 파티션 수
+        temp_dir: 버킷 파일을 만들 임시 디렉토리
+        pool: 버킷 조인을 나누어 실행할 ProcessPoolExecutor (None이면 현재 프로세스에서 실행)
+        num_tasks: 버킷들을 나눌 작업 수 (pool의 워커 수)
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    partition_inputs(pool, [
+        (spec['right_file'], spec['right_key_index'], num_partitions, temp_dir, 'right', True),
+        (spec['left_file'], spec['left_key_index'], num_partitions, temp_dir, 'left', False),
+    ])
+    
+    stats = run_bucket_tasks(pool, join_direct_buckets, spec, temp_dir, num_partitions, num_tasks)
+    
+    output_paths = [os.path.join(temp_dir, f"out_{bucket}.csv") for bucket in range(num_partitions)]
+    merge_partition_outputs(output_paths, writer, 3)
+    return stats
+
+def join_middle_right_buckets(spec, temp_dir, num_partitions, num_tasks, task):
+    """
+    간접 조인 1단계: 중간 테이블 + 오른쪽 파일 버킷 조인 (middle_id 기준, 작업 하나가 맡은 버킷들)
+    결과 레코드 [왼쪽 키, 중간 행 번호, 오른쪽 행 번호(없으면 0), middle_id, 중간 값..., 오른쪽 값...]를
+    왼쪽 키 값으로 다시 파티션하여 mr_{작업}_{버킷}.csv에 기록
+    
+    Returns:
+        조인 통계 딕셔너리 (이 단계에서는 모두 0)
+    """
+    join_type = spec['join_type']
+    middle_key_index = spec['middle_key_index']
+    empty_right_values = [''] * len(spec['right_fieldnames'])
+    
+    mr_paths = [os.path.join(temp_dir, f"mr_{task}_{i}.csv") for i in range(num_partitions)]
+    mr_files = [open(path, 'w', encoding='utf-8', newline='') for path in mr_paths]
+    try:
+        mr_writers = [csv.writer(f) for f in mr_files]
+        for bucket in range(task, num_partitions, num_tasks):
+            right_data = {}
+            for record in read_bucket(os.path.join(temp_dir, f"right_{bucket}.csv")):
+                right_data.setdefault(record[1], []).append((record[0], record[2:]))
+            
+            for record in read_bucket(os.path.join(temp_dir, f"middle_{bucket}.csv")):
+                middle_seq, mid_id, middle_values = record[0], record[1], record[2:]
+                key = middle_values[middle_key_index].strip()
+                if not key:
                     continue
-                
-                # 왼쪽 테이블을 참조하는 컬럼 찾기
-                # 예: aaa.csv (Id) -> 중간파일 (aaaId)
-                left_to_middle = None
-                
-                # 패턴 1: {left_table_name}Id (예: VocabularyId)
-                left_id_pattern = f"{left_table_name}Id"
-                for col in middle_columns:
-                    if col == left_id_pattern or col.lower() == left_id_pattern.lower():
-                        left_to_middle = col
-                        break
-                
-                # 패턴 2: left_key를 포함하는 컬럼 (예: Id -> VocabularyId)
-                if not left_to_middle:
-                    for col in middle_columns:
-                        if left_key.lower() in col.lower() or col.lower() in left_key.lower():
-                            if 'id' in col.lower() and col != middle_id:
-                                # left_table_name과 관련이 있는지 확인
-                                if left_table_name.lower() in col.lower():
-                                    left_to_middle = col
-                                    break
-                
-                # 오른쪽 테이블을 참조하는 컬럼 찾기
-                # 예: ccc.csv (Id) -> 중간파일 (cccId)
-                middle_to_right = None
-                
-                # 패턴 1: {right_table_name}Id (예: example_id)
-                right_id_pattern = f"{right_table_name}Id"
-                for col in middle_columns:
-                    if col == right_id_pattern or col.lower() == right_id_pattern.lower():
-                        middle_to_right = col
-                        break
-                
-                # 패턴 2: right_key를 포함하는 컬럼 (예: MeaningId)
-                if not middle_to_right:
-                    for col in middle_columns:
-                        if right_key.lower() in col.lower() or col.lower() in right_key.lower():
-                            if 'id' in col.lower() and col != middle_id:
-                                # right_table_name과 관련이 있는지 확인
-                                if right_table_name.lower() in col.lower():
-                                    middle_to_right = col
-                                    break
-                
-                # 패턴 3: right_key가 중간 테이블의 Id를 직접 참조하는 경우
-                # 예: Example.MeaningId -> Meaning.Id
-                if not middle_to_right:
-                    # right_key가 "MeaningId" 같은 형태면 middle_id를 사용
-                    if right_key.lower().endswith('id') and right_key.lower() != 'id':
-                        # right_key에서 테이블명 추출 (예: MeaningId -> Meaning)
-                        key_table = right_key[:-2] if right_key.endswith('Id') else right_key[:-2].lower()
-                        middle_table_name = os.path.splitext(os.path.basename(middle_file))[0]
-                        if key_table.lower() == middle_table_name.lower():
-                            middle_to_right = middle_id
-                
-                # 경로가 완성되었는지 확인
-                if left_to_middle and middle_id:
-                    # 오른쪽 파일에서 right_key가 있는지 확인
-                    with open(right_file, 'r', encoding='utf-8') as rf:
-                        r_reader = csv.DictReader(rf)
-                        r_columns = list(r_reader.fieldnames)
-                        if right_key in r_columns:
-                            # middle_to_right가 명시되지 않았으면 middle_id 사용
-                            if not middle_to_right:
-                                middle_to_right = middle_id
-                            return (middle_file, left_to_middle, middle_id, middle_to_right)
-        except Exception as e:
-            # 파일 읽기 오류 시 다음 파일로
+                mr_writer = mr_writers[get_partition(key, num_partitions)]
+                if mid_id in right_data:
+                    for right_seq, right_values in right_data[mid_id]:
+                        mr_writer.writerow([key, middle_seq, right_seq, mid_id] + middle_values + right_values)
+                elif join_type in ['left', 'full']:
+                    mr_writer.writerow([key, middle_seq, 0, mid_id] + middle_values + empty_right_values)
+    finally:
+        for f in mr_files:
+            f.close()
+    return new_join_stats()
+
+def join_left_buckets(spec, temp_dir, num_partitions, num_tasks, task):
+    """
+    간접 조인 2단계: 왼쪽 파일 + (중간+오른쪽) 결과 버킷 조인 (왼쪽 키 기준, 작업 하나가 맡은 버킷들)
+    결과는 (단계, 왼쪽 행 번호, 중간 행 번호, 오른쪽 행 번호) 정렬 키를 붙여 out_{버킷}.csv에 기록하고,
+    RIGHT/FULL 조인이면 왼쪽과 연결된 middle_id를 middle_id 기준으로 파티션하여 matched_{작업}_{버킷}.csv에 기록
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    join_type = spec['join_type']
+    build_row = compile_row_builder(spec)
+    stats = new_join_stats()
+    num_middle = len(spec['middle_fieldnames'])
+    
+    matched_paths = [os.path.join(temp_dir, f"matched_{task}_{i}.csv") for i in range(num_partitions)]
+    matched_files = [open(path, 'w', encoding='utf-8', newline='') for path in matched_paths]
+    try:
+        matched_writers = [csv.writer(f) for f in matched_files]
+        for bucket in range(task, num_partitions, num_tasks):
+            middle_data = {}
+            for mr_task in range(num_tasks):
+                for record in read_bucket(os.path.join(temp_dir, f"mr_{mr_task}_{bucket}.csv")):
+                    middle_data.setdefault(record[0], []).append(record[1:])
+            # 중간 행 번호, 오른쪽 행 번호 순서로 정렬 (인메모리 조인의 출력 순서)
+            for records in middle_data.values():
+                records.sort(key=lambda record: (int(record[0]), int(record[1])))
+            
+            matched_ids = set()
+            with open(os.path.join(temp_dir, f"out_{bucket}.csv"), 'w', encoding='utf-8', newline='') as outfile:
+                bucket_writer = csv.writer(outfile)
+                for record in read_bucket(os.path.join(temp_dir, f"left_{bucket}.csv")):
+                    seq, key, row = record[0], record[1], record[2:]
+                    
+                    if key and key in middle_data:
+                        for middle_seq, right_seq, mid_id, *values in middle_data[key]:
+                            if right_seq != '0':
+                                stats['matched'] += 1
+                            else:
+                                stats['left_only'] += 1
+                            # 오른쪽이 없는 레코드의 오른쪽 값은 이미 빈 값
+                            new_row = build_row(row, values[:num_middle], values[num_middle:])
+                            bucket_writer.writerow((0, seq, middle_seq, right_seq, *new_row))
+                            stats['joined'] += 1
+                            if join_type in ['right', 'full'] and mid_id not in matched_ids:
+                                matched_ids.add(mid_id)
+                                matched_writers[get_partition(mid_id, num_partitions)].writerow([mid_id])
+                    elif join_type in ['left', 'full']:
+                        bucket_writer.writerow((0, seq, 0, 0, *build_row(row, None, None)))
+                        stats['joined'] += 1
+                        stats['left_only'] += 1
+    finally:
+        for f in matched_files:
+            f.close()
+    return stats
+
+def join_right_only_buckets(spec, temp_dir, num_partitions, num_tasks, task):
+    """
+    간접 조인 3단계 (RIGHT/FULL 조인): 왼쪽과 연결되지 않은 오른쪽 행 찾기
+    (middle_id 기준, 작업 하나가 맡은 버킷들)
+    결과는 (단계, 키가 처음 나온 행 번호, 오른쪽 행 번호, 0) 정렬 키를 붙여 right_only_{버킷}.csv에 기록
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    build_row = compile_row_builder(spec)
+    stats = new_join_stats()
+    empty_left_row = get_empty_left_row(spec, '')
+    
+    for bucket in range(task, num_partitions, num_tasks):
+        matched_ids = set()
+        for left_task in range(num_tasks):
+            for record in read_bucket(os.path.join(temp_dir, f"matched_{left_task}_{bucket}.csv")):
+                matched_ids.add(record[0])
+        first_seqs = {}
+        right_only = []
+        for record in read_bucket(os.path.join(temp_dir, f"right_{bucket}.csv")):
+            right_seq, key = int(record[0]), record[1]
+            first_seqs.setdefault(key, right_seq)
+            if key not in matched_ids:
+                right_only.append((first_seqs[key], right_seq, record[2:]))
+        right_only.sort(key=lambda item: (item[0], item[1]))
+        
+        with open(os.path.join(temp_dir, f"right_only_{bucket}.csv"), 'w', encoding='utf-8', newline='') as outfile:
+            bucket_writer = csv.writer(outfile)
+            for first_seq, right_seq, right_row in right_only:
+                bucket_writer.writerow((1, first_seq, right_seq, 0, *build_row(empty_left_row, None, right_row)))
+                stats['joined'] += 1
+                stats['right_only'] += 1
+    
+    return stats
+
+def join_indirect_grace(spec, writer, num_partitions, temp_dir, pool=None, num_tasks=1):
+    """
+    간접 조인 (디스크 스필 그레이스 해시 조인)
+    1) 중간 테이블과 오른쪽 파일을 middle_id로 파티션하여 조인 (중간+오른쪽 결과)
+    2) 그 결과와 왼쪽 파일을 왼쪽 키로 파티션하여 조인
+    3) RIGHT/FULL 조인이면 매칭되지 않은 오른쪽 행을 middle_id 버킷별로 찾음
+    결과 행에 (단계, 왼쪽 행 번호, 중간 행 번호, 오른쪽 행 번호) 정렬 키를 붙여 병합하므로
+    인메모리 조인과 바이트 단위로 같은 출력을 만든다.
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+        num_partitions: 파티션 수
+        temp_dir: 버킷 파일을 만들 임시 디렉토리
+        pool: 버킷 조인을 나누어 실행할 ProcessPoolExecutor (None이면 현재 프로세스에서 실행)
+        num_tasks: 버킷들을 나눌 작업 수 (pool의 워커 수)
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    partition_inputs(pool, [
+        (spec['middle_file'], spec['middle_id_index'], num_partitions, temp_dir, 'middle', True),
+        (spec['right_file'], spec['right_key_index'], num_partitions, temp_dir, 'right', True),
+        (spec['left_file'], spec['left_key_index'], num_partitions, temp_dir, 'left', False),
+    ])
+    
+    # 1) 중간 테이블 + 오른쪽 파일 (middle_id 기준)
+    run_bucket_tasks(pool, join_middle_right_buckets, spec, temp_dir, num_partitions, num_tasks)
+    
+    # 2) 왼쪽 파일 + (중간+오른쪽) 결과 (왼쪽 키 기준)
+    stats = run_bucket_tasks(pool, join_left_buckets, spec, temp_dir, num_partitions, num_tasks)
+    output_paths = [os.path.join(temp_dir, f"out_{bucket}.csv") for bucket in range(num_partitions)]
+    
+    # 3) RIGHT JOIN 또는 FULL JOIN: 매칭되지 않은 오른쪽 행 (middle_id 기준 버킷)
+    if spec['join_type'] in ['right', 'full']:
+        right_only_stats = run_bucket_tasks(pool, join_right_only_buckets, spec, temp_dir, num_partitions, num_tasks)
+        for name in stats:
+            stats[name] += right_only_stats[name]
+        output_paths += [os.path.join(temp_dir, f"right_only_{bucket}.csv") for bucket in range(num_partitions)]
+    
+    merge_partition_outputs(output_paths, writer, 4)
+    return stats
+
+def get_merge_sort_key(key):
+    """
+    정렬 병합 조인에서 키 비교에 사용할 정렬 키
+    숫자 키는 정수 순서, 그 외의 키는 문자열 순서 (숫자 키가 항상 앞)
+    같은 정렬 키는 같은 문자열일 때만 나오므로 해시 조인과 매칭 결과가 같다
+    """
+    try:
+        return (0, int(key), key)
+    except ValueError:
+        return (1, 0, key)
+
+def is_sorted_by_keys(csv_file, key_indices):
+    """
+    CSV 파일이 주어진 키 컬럼들 각각의 순서로 정렬되어 있는지 확인
+    키가 하나라도 비어있는 행은 조인에 참여하지 않으므로 검사에서 제외
+    
+    Args:
+        csv_file: CSV 파일 경로
+        key_indices: 키 컬럼 위치 리스트
+    
+    Returns:
+        모든 키 컬럼이 오름차순(같은 값 허용)이면 True
+    """
+    previous = [None] * len(key_indices)
+    for row in read_csv_rows(csv_file):
+        keys = [row[index].strip() for index in key_indices]
+        if not all(keys):
             continue
+        for i, key in enumerate(keys):
+            sort_key = get_merge_sort_key(key)
+            if previous[i] is not None and sort_key < previous[i]:
+                return False
+            previous[i] = sort_key
+    return True
+
+def iter_key_groups(csv_file, key_index, required_index=None):
+    """
+    키로 정렬된 CSV 파일을 같은 키의 연속된 행 묶음으로 읽기
+    키가 비어있는 행(required_index가 주어지면 그 값이 비어있는 행 포함)은 건너뜀
     
-    return None
+    Yields:
+        (키, 행 리스트)
+    """
+    group_key = None
+    group_rows = []
+    for row in read_csv_rows(csv_file):
+        key = row[key_index].strip()
+        if not key or (required_index is not None and not row[required_index].strip()):
+            continue
+        if key != group_key:
+            if group_rows:
+                yield group_key, group_rows
+            group_key = key
+            group_rows = []
+        group_rows.append(row)
+    if group_rows:
+        yield group_key, group_rows
+
+def iter_distinct_keys(csv_file, key_index):
+    """
+    키로 정렬된 CSV 파일의 비어있지 않은 키를 중복 없이 순서대로 읽기
+    """
+    for key, _ in iter_key_groups(csv_file, key_index):
+        yield key
+
+def advance_to(iterator, current, key_of, target, on_skip=None):
+    """
+    정렬된 이터레이터를 target 이상의 정렬 키가 나올 때까지 앞으로 이동
+    
+    Args:
+        iterator: 정렬된 이터레이터
+        current: 현재 항목 (None이면 끝)
+        key_of: 항목에서 키 문자열을 꺼내는 함수
+        target: 목표 키의 정렬 키 (None이면 끝까지 이동)
+        on_skip: 지나가는 항목마다 호출할 함수 (None이면 호출하지 않음)
+    
+    Returns:
+        이동한 뒤의 현재 항목 (끝에 도달하면 None)
+    """
+    while current is not None and (target is None or get_merge_sort_key(key_of(current)) < target):
+        if on_skip is not None:
+            on_skip(current)
+        current = next(iterator, None)
+    return current
+
+def copy_spilled_rows(spill_file, writer):
+    """
+    임시 파일에 모아 둔 결과 행을 출력 파일에 기록
+    """
+    spill_file.seek(0)
+    for row in csv.reader(spill_file):
+        writer.writerow(row)
+
+def join_direct_merge(spec, writer):
+    """
+    직접 조인 (정렬 병합 조인)
+    양쪽 파일이 조인 키로 정렬되어 있을 때 한 번의 순방향 읽기로 조인.
+    메모리에는 현재 키의 오른쪽 행 묶음만 유지한다.
+    RIGHT/FULL 조인의 오른쪽에만 있는 행은 매칭되지 않고 지나간 키 묶음을 임시 파일에 모아 두었다가
+    마지막에 기록하므로 해시 조인과 같은 순서의 출력을 만든다.
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    left_key_index = spec['left_key_index']
+    right_key_index = spec['right_key_index']
+    join_type = spec['join_type']
+    build_row = compile_row_builder(spec)
+    stats = new_join_stats()
+    
+    right_groups = iter_key_groups(spec['right_file'], right_key_index)
+    current = next(right_groups, None)
+    # 마지막으로 매칭된 오른쪽 키 묶음
+    matched_group = None
+    
+    track_right_only = join_type in ['right', 'full']
+    right_only_file = tempfile.TemporaryFile('w+', encoding='utf-8', newline='') if track_right_only else None
+    right_only_writer = csv.writer(right_only_file) if track_right_only else None
+    
+    def spill_right_only(group):
+        """
+        매칭되지 않고 지나간 오른쪽 키 묶음을 임시 파일에 기록
+        """
+        if group is matched_group:
+            return
+        key, right_rows = group
+        empty_left_row = get_empty_left_row(spec, key)
+        for right_row in right_rows:
+            right_only_writer.writerow(build_row(empty_left_row, None, right_row))
+            stats['right_only'] += 1
+    
+    on_skip = spill_right_only if track_right_only else None
+    
+    try:
+        for row in read_csv_rows(spec['left_file']):
+            key = row[left_key_index].strip()
+            if key:
+                current = advance_to(right_groups, current, lambda group: group[0], get_merge_sort_key(key), on_skip)
+            
+            if key and current is not None and current[0] == key:
+                matched_group = current
+                for right_row in current[1]:
+                    writer.writerow(build_row(row, None, right_row))
+                    stats['joined'] += 1
+                    stats['matched'] += 1
+            elif join_type in ['left', 'full']:
+                writer.writerow(build_row(row, None, None))
+                stats['joined'] += 1
+                stats['left_only'] += 1
+        
+        # RIGHT JOIN 또는 FULL JOIN: 남은 오른쪽 키 묶음까지 지나간 뒤 오른쪽에만 있는 행 기록
+        if track_right_only:
+            advance_to(right_groups, current, lambda group: group[0], None, on_skip)
+            copy_spilled_rows(right_only_file, writer)
+            stats['joined'] += stats['right_only']
+    finally:
+        if right_only_file is not None:
+            right_only_file.close()
+    
+    return stats
+
+def join_indirect_merge(spec, writer):
+    """
+    간접 조인 (정렬 병합 조인)
+    왼쪽 파일은 왼쪽 키로, 중간 테이블은 left_to_middle과 middle_id 모두로,
+    오른쪽 파일은 조인 키로 정렬되어 있을 때 세 파일을 한 번의 순방향 읽기로 조인.
+    메모리에는 현재 키의 중간 행 묶음과 그 오른쪽 매칭 행만 유지한다.
+    RIGHT/FULL 조인의 오른쪽에만 있는 행은 왼쪽과 연결된 middle_id에 매칭되지 않고 지나간
+    오른쪽 키 묶음을 임시 파일에 모아 두었다가 마지막에 기록한다.
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    left_key_index = spec['left_key_index']
+    middle_key_index = spec['middle_key_index']
+    middle_id_index = spec['middle_id_index']
+    right_key_index = spec['right_key_index']
+    join_type = spec['join_type']
+    build_row = compile_row_builder(spec)
+    stats = new_join_stats()
+    
+    middle_groups = iter_key_groups(spec['middle_file'], middle_key_index, middle_id_index)
+    current_middle = next(middle_groups, None)
+    right_groups = iter_key_groups(spec['right_file'], right_key_index)
+    current_right = next(right_groups, None)
+    # 현재 중간 행 묶음의 (중간 행, 오른쪽 매칭 행 리스트) - 같은 키의 왼쪽 행이 여러 개면 재사용
+    matched_group_key = None
+    matched_group = []
+    # 마지막으로 왼쪽과 연결된 middle_id에 매칭된 오른쪽 키 묶음
+    # (중간 테이블이 middle_id로도 정렬되어 있으므로 지나간 묶음은 다시 매칭되지 않음)
+    matched_right_group = None
+    
+    track_right_only = join_type in ['right', 'full']
+    right_only_file = tempfile.TemporaryFile('w+', encoding='utf-8', newline='') if track_right_only else None
+    right_only_writer = csv.writer(right_only_file) if track_right_only else None
+    empty_left_row = get_empty_left_row(spec, '')
+    
+    def spill_right_only(group):
+        """
+        왼쪽과 연결되지 않고 지나간 오른쪽 키 묶음을 임시 파일에 기록
+        """
+        if group is matched_right_group:
+            return
+        for right_row in group[1]:
+            right_only_writer.writerow(build_row(empty_left_row, None, right_row))
+            stats['right_only'] += 1
+    
+    on_skip = spill_right_only if track_right_only else None
+    
+    try:
+        for row in read_csv_rows(spec['left_file']):
+            key = row[left_key_index].strip()
+            if key and key != matched_group_key:
+                current_middle = advance_to(middle_groups, current_middle, lambda group: group[0], get_merge_sort_key(key))
+                if current_middle is not None and current_middle[0] == key:
+                    matched_group = []
+                    for middle_row in current_middle[1]:
+                        mid_id = middle_row[middle_id_index].strip()
+                        current_right = advance_to(right_groups, current_right, lambda group: group[0],
+                                                   get_merge_sort_key(mid_id), on_skip)
+                        if current_right is not None and current_right[0] == mid_id:
+                            matched_right_group = current_right
+                            right_rows = current_right[1]
+                        else:
+                            right_rows = []
+                        matched_group.append((middle_row, right_rows))
+                    matched_group_key = key
+            
+            if key and key == matched_group_key:
+                for middle_row, right_rows in matched_group:
+                    if right_rows:
+                        for right_row in right_rows:
+                            writer.writerow(build_row(row, middle_row, right_row))
+                            stats['joined'] += 1
+                            stats['matched'] += 1
+                    elif join_type in ['left', 'full']:
+                        writer.writerow(build_row(row, middle_row, None))
+                        stats['joined'] += 1
+                        stats['left_only'] += 1
+            elif join_type in ['left', 'full']:
+                writer.writerow(build_row(row, None, None))
+                stats['joined'] += 1
+                stats['left_only'] += 1
+        
+        # RIGHT JOIN 또는 FULL JOIN: 남은 오른쪽 키 묶음까지 지나간 뒤 오른쪽에만 있는 행 기록
+        if track_right_only:
+            advance_to(right_groups, current_right, lambda group: group[0], None, on_skip)
+            copy_spilled_rows(right_only_file, writer)
+            stats['joined'] += stats['right_only']
+    finally:
+        if right_only_file is not None:
+            right_only_file.close()
+    
+    return stats
+
+def write_semi_join_rows(spec, writer, has_match):
+    """
+    세미 조인 / 안티 조인 결과 기록
+    왼쪽 파일을 한 번 읽으며 매칭되는 행(semi) 또는 매칭되지 않는 행(anti)을 왼쪽 컬럼 그대로 기록
+    (키가 비어있는 행은 매칭되지 않는 것으로 봄)
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+        has_match: 왼쪽 키가 매칭되는지 확인하는 함수 (정렬 병합 조인에서는 키 순서대로 호출됨)
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    left_key_index = spec['left_key_index']
+    keep_matched = spec['join_type'] == 'semi'
+    stats = new_join_stats()
+    
+    for row in read_csv_rows(spec['left_file']):
+        key = row[left_key_index].strip()
+        matched = bool(key) and has_match(key)
+        if matched == keep_matched:
+            writer.writerow(row)
+            stats['joined'] += 1
+            stats['matched' if matched else 'left_only'] += 1
+    return stats
+
+def join_semi_in_memory(spec, writer):
+    """
+    세미 조인 / 안티 조인 (인메모리 해시 조인, 직접 조인과 간접 조인 공통)
+    행 대신 매칭되는 키 집합만 메모리에 올린다.
+    간접 조인이면 오른쪽 파일에 있는 middle_id를 가진 중간 행의 왼쪽 키가 매칭되는 키이다.
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    right_key_index = spec['right_key_index']
+    right_keys = set()
+    for row in read_csv_rows(spec['right_file']):
+        key = row[right_key_index].strip()
+        if key:
+            right_keys.add(key)
+    print(f"오른쪽 파일: {len(right_keys)}개의 고유 키")
+    
+    if 'middle_file' in spec:
+        middle_key_index = spec['middle_key_index']
+        middle_id_index = spec['middle_id_index']
+        match_keys = set()
+        for row in read_csv_rows(spec['middle_file']):
+            key = row[middle_key_index].strip()
+            if key and row[middle_id_index].strip() in right_keys:
+                match_keys.add(key)
+        print(f"중간 테이블: 오른쪽과 연결된 왼쪽 키 {len(match_keys)}개")
+    else:
+        match_keys = right_keys
+    
+    return write_semi_join_rows(spec, writer, lambda key: key in match_keys)
+
+def iter_matching_keys(spec):
+    """
+    정렬 병합 세미/안티 조인: 오른쪽(간접 조인이면 중간 테이블을 거쳐 오른쪽)에 매칭되는 왼쪽 키를
+    순서대로 중복 없이 생성
+    """
+    right_keys = iter_distinct_keys(spec['right_file'], spec['right_key_index'])
+    if 'middle_file' not in spec:
+        yield from right_keys
+        return
+    
+    middle_id_index = spec['middle_id_index']
+    current_right = next(right_keys, None)
+    for key, middle_rows in iter_key_groups(spec['middle_file'], spec['middle_key_index'], middle_id_index):
+        for middle_row in middle_rows:
+            mid_id = middle_row[middle_id_index].strip()
+            current_right = advance_to(right_keys, current_right, lambda k: k, get_merge_sort_key(mid_id))
+            if current_right == mid_id:
+                yield key
+                break
+
+def join_semi_merge(spec, writer):
+    """
+    세미 조인 / 안티 조인 (정렬 병합 조인, 직접 조인과 간접 조인 공통)
+    입력이 조인 키로 정렬되어 있을 때 모든 파일을 한 번의 순방향 읽기로 처리
+    
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+    
+    Returns:
+        조인 통계 딕셔너리
+    """
+    matching_keys = iter_matching_keys(spec)
+    current = next(matching_keys, None)
+    
+    def has_match(key):
+        nonlocal current
+        current = advance_to(matching_keys, current, lambda k: k, get_merge_sort_key(key))
+        return current == key
+    
+    return write_semi_join_rows(spec, writer, has_match)
+
+def join_csv_path(join_path, join_type, output_file):
+    """
+    중간 테이블을 둘 이상 거치는 조인 경로를 연쇄 조인(join_chain.py)으로 수행
+    컬럼명은 연쇄 조인 규칙(직접 조인 규칙을 단계마다 적용)을 따름
+    
+    Args:
+        join_path: find_join_path가 반환한 단계 리스트
+        join_type: 조인 타입 ('inner', 'left'만 지원)
+        output_file: 출력 CSV 파일 경로 (None이면 자동 생성)
+    """
+    # 순환 import를 피하기 위해 여기서 import
+    from join_chain import join_csv_chain
+    
+    if join_type not in ['inner', 'left']:
+        print(f"오류: 중간 테이블이 둘 이상인 경로는 inner, left 조인만 지원합니다.")
+        sys.exit(1)
+    
+    print(f"      중간 테이블 {len(join_path) - 1}개를 거치는 경로를 찾았습니다:")
+    for file_a, col_a, file_b, col_b in join_path:
+        print(f"        {os.path.basename(file_a)}.{col_a} = {os.path.basename(file_b)}.{col_b}")
+    
+    # 체인 항목: (파일, 이전 파일과의 키, 다음 파일과의 키)
+    chain = [(join_path[0][0], join_path[0][1], join_path[0][1])]
+    for (_, _, file_b, col_b), (_, next_col, _, _) in zip(join_path, join_path[1:]):
+        chain.append((file_b, col_b, next_col))
+    chain.append((join_path[-1][2], join_path[-1][3], join_path[-1][3]))
+    
+    if output_file is None:
+        left_file, right_file = chain[0][0], chain[-1][0]
+        output_dir = os.path.join(os.path.dirname(os.path.abspath(left_file)), 'output')
+        os.makedirs(output_dir, exist_ok=True)
+        left_base = os.path.basename(os.path.splitext(left_file)[0])
+        right_base = os.path.basename(os.path.splitext(right_file)[0])
+        output_file = os.path.join(output_dir, f"{left_base}_{join_type}_join_{right_base}.csv")
+    
+    join_csv_chain(chain, join_type, output_file)
 
-def join_csv_files(left_file, right_file, left_key, right_key, middle_file=None, join_type='inner', output_file=None):
+def join_csv_files(left_file, right_file, left_key, right_key, middle_file=None, join_type='inner', output_file=None, memory_limit=None, engine='hash', workers=1,
+                   cache=True, cache_dir=None, cache_size=None):
     """
     두 CSV 파일을 조인
     
@@ -151,33 +1242,55 @@ def join_csv_files(left_file, right_file, left_key, right_key, middle_file=None,
         right_file: 오른쪽 CSV 파일 경로
         left_key: 왼쪽 파일의 키 컬럼명
         right_key: 오른쪽 파일의 키 컬럼명
-        join_type: 조인 타입 ('inner', 'left', 'right', 'full')
+        join_type: 조인 타입 ('inner', 'left', 'right', 'full', 'semi', 'anti')
+                   semi/anti는 오른쪽에 매칭되는 행이 있는/없는 왼쪽 행만 왼쪽 컬럼 그대로 출력
         output_file: 출력 CSV 파일 경로 (None이면 자동 생성)
+        memory_limit: 해시 인덱스에 사용할 메모리 제한 (바이트, None이면 전체를 메모리에 올림)
+                      지정하면 입력을 버킷 파일로 나누어 버킷 쌍마다 조인 (그레이스 해시 조인)
+        engine: 조인 방식 ('hash': 해시 조인, 'merge': 정렬 병합 조인)
+                'merge'는 입력이 조인 키로 정렬되어 있지 않으면 해시 조인으로 대체
+        workers: 해시 조인에 사용할 프로세스 수 (2 이상이면 입력을 조인 키로 나누어
+                 버킷들을 여러 프로세스에서 동시에 조인한 뒤 원래 순서로 병합)
+        cache: 결과 캐시 사용 여부 (입력 파일 내용, 조인 키, 조인 타입, 도구 버전이 같으면 이전 결과를 재사용)
+        cache_dir: 결과 캐시 디렉토리 (None이면 JOIN_CSV_CACHE_DIR 환경 변수, 없으면 출력 디렉토리의 .join_cache)
+        cache_size: 결과 캐시 크기 제한 (바이트, None이면 1G, 넘으면 오래 사용하지 않은 결과부터 삭제)
     """
-    if not os.path.exists(left_file):
-        print(f"오류: 파일 '{left_file}'을 찾을 수 없습니다.")
+    for input_file in [left_file, right_file] + ([middle_file] if middle_file else []):
+        if not input_exists(input_file):
+            print(f"오류: 파일 '{input_file}'을 찾을 수 없습니다.")
+            sys.exit(1)
+    
+    if join_type not in JOIN_TYPES:
+        print(f"오류: 잘못된 조인 타입 '{join_type}'입니다.")
+        print(f"      사용 가능한 타입: {', '.join(JOIN_TYPES)}")
         sys.exit(1)
     
-    if not os.path.exists(right_file):
-        print(f"오류: 파일 '{right_file}'을 찾을 수 없습니다.")
+    if engine not in ['hash', 'merge', 'sqlite']:
+        print(f"오류: 잘못된 조인 방식 '{engine}'입니다.")
+        print("      사용 가능한 방식: hash, merge, sqlite")
         sys.exit(1)
     
-    if join_type not in ['inner', 'left', 'right', 'full']:
-        print(f"오류: 잘못된 조인 타입 '{join_type}'입니다.")
-        print("      사용 가능한 타입: inner, left, right, full")
+    # DB 테이블 입력은 SQLite 조인에서만 읽을 수 있음
+    has_db_input = any(parse_db_input(path) for path in [left_file, right_file, middle_file or ''])
+    if has_db_input and engine != 'sqlite':
+        print("오류: '<db 파일>:<테이블>' 입력은 --engine sqlite에서만 사용할 수 있습니다.")
         sys.exit(1)
     
-    # 직접 조인 가능한지 확인
-    with open(left_file, 'r', encoding='utf-8') as f:
-        left_reader = csv.DictReader(f)
-        left_columns = list(left_reader.fieldnames)
+    if workers < 1:
+        print(f"오류: 워커 수는 1 이상이어야 합니다. (입력값: {workers})")
+        sys.exit(1)
     
-    with open(right_file, 'r', encoding='utf-8') as f:
-        right_reader = csv.DictReader(f)
-        right_columns = list(right_reader.fieldnames)
+    # 직접 조인 가능한지 확인
+    left_columns = read_input_columns(left_file)
+    right_columns = read_input_columns(right_file)
+    for input_file, columns in [(left_file, left_columns), (right_file, right_columns)]:
+        if not columns:
+            print(f"오류: '{input_file}'의 컬럼을 읽을 수 없습니다.")
+            sys.exit(1)
     
     # 직접 조인 가능한지 확인
     use_indirect = False
+    path_keys = None
     can_direct_join = (right_key in right_columns and left_key in left_columns)
     
     # 직접 조인 가능하더라도, left_key와 right_key가 서로 다른 테이블을 참조하는 경우 간접 조인 시도
@@ -215,12 +1328,20 @@ def join_csv_files(left_file, right_file, left_key, right_key, middle_file=None,
         if middle_file is None:
             if not needs_indirect:
                 print("      중간 테이블을 통한 간접 조인을 시도합니다...")
-            indirect_path = find_indirect_path(left_file, right_file, left_key, right_key)
-            if indirect_path:
-                middle_file, left_to_middle, middle_id, middle_to_right = indirect_path
+            if has_db_input:
+                print("오류: DB 테이블 입력은 중간 테이블을 자동으로 찾지 않습니다. 중간 테이블을 지정하세요.")
+                sys.exit(1)
+            join_path = find_join_path(left_file, right_file, left_key, right_key)
+            if join_path and len(join_path) == 2:
+                (_, _, middle_file, left_to_middle), (_, middle_id, _, middle_to_right) = join_path
+                # 외래 키 그래프에서 찾은 중간 테이블 조인 키
+                path_keys = (left_to_middle, middle_id, middle_id)
                 use_indirect = True
                 print(f"      중간 테이블 발견: {os.path.basename(middle_file)}")
                 print(f"      조인 경로: {left_key} -> {left_to_middle} -> {middle_id} -> {middle_to_right}")
+            elif join_path:
+                # 중간 테이블이 둘 이상이면 연쇄 조인으로 처리
+                return join_csv_path(join_path, join_type, output_file)
             else:
                 print(f"오류: 간접 조인 경로를 찾을 수 없습니다.")
                 sys.exit(1)
@@ -231,462 +1352,258 @@ def join_csv_files(left_file, right_file, left_key, right_key, middle_file=None,
     
     if output_file is None:
         # 입력 파일의 디렉토리에 output 폴더 생성
-        input_dir = os.path.dirname(os.path.abspath(left_file))
+        # DB 테이블 입력이면 db 파일의 디렉토리 사용
+        left_db = parse_db_input(left_file)
+        input_dir = os.path.dirname(os.path.abspath(left_db[0] if left_db else left_file))
         output_dir = os.path.join(input_dir, 'output')
         os.makedirs(output_dir, exist_ok=True)
         
-        left_base = os.path.basename(os.path.splitext(left_file)[0])
-        right_base = os.path.basename(os.path.splitext(right_file)[0])
-        ext = os.path.splitext(left_file)[1]
+        left_base = get_input_table_name(left_file)
+        right_base = get_input_table_name(right_file)
+        ext = '.csv' if left_db else os.path.splitext(left_file)[1]
         output_file = os.path.join(output_dir, f"{left_base}_{join_type}_join_{right_base}{ext}")
     
-    # 간접 조인인 경우 중간 테이블 처리
+    left_table_name = get_input_table_name(left_file)
+    right_table_name = get_input_table_name(right_file)
+    spec = {
+        'left_file': left_file,
+        'right_file': right_file,
+        'left_key': left_key,
+        'right_key': right_key,
+        'join_type': join_type,
+        'left_fieldnames': left_columns,
+        'right_fieldnames': right_columns,
+        'left_table_name': left_table_name,
+        'right_table_name': right_table_name,
+    }
+    
+    # 간접 조인인 경우 중간 테이블의 조인 키 찾기
     if use_indirect:
-        # 중간 테이블 읽기
-        middle_data = {}
-        middle_fieldnames = None
+        middle_fieldnames = read_input_columns(middle_file)
         
-        with open(middle_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            middle_fieldnames = list(reader.fieldnames)
-            
-            # 중간 테이블의 키 찾기
-            left_to_middle = None
-            middle_id = None
-            middle_to_right = None
-            
-            # left_key를 참조하는 컬럼 찾기 (예: VocabularyId)
-            # Vocabulary.Id -> Meaning.VocabularyId
-            for col in middle_fieldnames:
-                # Id를 VocabularyId로 변환하거나, VocabularyId 컬럼 찾기
-                if left_key.lower() == 'id':
-                    # Vocabulary의 Id를 찾는 경우 -> VocabularyId 컬럼 찾기
-                    if 'vocabulary' in col.lower() and 'id' in col.lower():
-                        left_to_middle = col
-                        break
-                elif left_key.lower() in col.lower() or col.lower() in left_key.lower():
-                    if 'id' in col.lower():
-                        left_to_middle = col
-                        break
-            
-            # middle_id 찾기 (Meaning의 Id)
-            if 'Id' in middle_fieldnames:
-                middle_id = 'Id'
-            
-            # right_key를 참조하는 컬럼 찾기 (예: MeaningId)
-            # Example.MeaningId -> Meaning.Id
-            # right_key가 MeaningId인 경우, 중간 테이블의 Id를 사용
-            if right_key.lower() == 'meaningid' or ('meaning' in right_key.lower() and 'id' in right_key.lower()):
-                # MeaningId는 중간 테이블의 Id를 참조
-                middle_to_right = middle_id  # Meaning.Id
-            else:
-                # 다른 경우 컬럼에서 찾기
-                for col in middle_fieldnames:
-                    if right_key.lower() in col.lower() or col.lower() in right_key.lower():
-                        if 'id' in col.lower():
-                            middle_to_right = col
-                            break
-            
+        if path_keys is None:
+            left_to_middle, middle_id, middle_to_right = find_middle_keys(middle_fieldnames, left_key, right_key)
             if not left_to_middle or not middle_id:
-                print(f"오류: 중간 테이블에서 조인 키를 찾을 수 없습니다.")
-                sys.exit(1)
-            
-            # 중간 테이블 인덱스 생성 (left_to_middle -> middle_id)
-            for row in reader:
-                key = row.get(left_to_middle, '').strip()
-                mid_id = row.get(middle_id, '').strip()
-                if key and mid_id:
-                    if key not in middle_data:
-                        middle_data[key] = []
-                    middle_data[key].append((mid_id, row))
-        
-        print(f"중간 테이블: {len(middle_data)}개의 고유 키, {sum(len(rows) for rows in middle_data.values())}개 행")
-        
-        # 오른쪽 파일 읽기 (middle_id를 키로)
-        right_data = {}
-        right_fieldnames = None
-        
-        with open(right_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            right_fieldnames = list(reader.fieldnames)
-            
-            # right_key가 실제로는 middle_to_right를 참조
-            actual_right_key = middle_to_right if middle_to_right in right_fieldnames else right_key
-            
-            if actual_right_key not in right_fieldnames:
-                print(f"오류: '{right_file}'에 '{actual_right_key}' 컬럼이 없습니다.")
-                print(f"사용 가능한 컬럼: {', '.join(right_fieldnames)}")
-                sys.exit(1)
-            
-            for row in reader:
-                key = row.get(actual_right_key, '').strip()
-                if key:
-                    if key not in right_data:
-                        right_data[key] = []
-                    right_data[key].append(row)
-        
-        print(f"오른쪽 파일: {len(right_data)}개의 고유 키, {sum(len(rows) for rows in right_data.values())}개 행")
-        
-        # 간접 조인 수행
-        left_fieldnames = None
-        joined_rows = []
-        left_only_count = 0
-        right_only_count = 0
-        matched_count = 0
-        
-        with open(left_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            left_fieldnames = list(reader.fieldnames)
-            
-            if left_key not in left_fieldnames:
-                print(f"오류: '{left_file}'에 '{left_key}' 컬럼이 없습니다.")
-                print(f"사용 가능한 컬럼: {', '.join(left_fieldnames)}")
-                sys.exit(1)
-            
-            # 출력 컬럼명 생성
-            output_fieldnames = list(left_fieldnames)
-            for col in middle_fieldnames:
-                if col != left_to_middle and col != middle_id:
-                    if col not in output_fieldnames:
-                        output_fieldnames.append(col)
-                    else:
-                        output_fieldnames.append(f"{col}_middle")
-            for col in right_fieldnames:
-                if col != actual_right_key:
-                    if col not in output_fieldnames:
-                        output_fieldnames.append(col)
-                    else:
-                        output_fieldnames.append(f"{col}_right")
-            
-            for row in reader:
-                key = row.get(left_key, '').strip()
-                
-                if not key:
-                    if join_type in ['left', 'full']:
-                        new_row = dict(row)
-                        for col in middle_fieldnames:
-                            if col != left_to_middle and col != middle_id:
-                                new_col = col if col not in new_row else f"{col}_middle"
-                                new_row[new_col] = ''
-                        for col in right_fieldnames:
-                            if col != actual_right_key:
-                                new_col = col if col not in new_row else f"{col}_right"
-                                new_row[new_col] = ''
-                        joined_rows.append(new_row)
-                        left_only_count += 1
-                    continue
-                
-                # 중간 테이블에서 매칭
-                if key in middle_data:
-                    for mid_id, middle_row in middle_data[key]:
-                        # 오른쪽 테이블에서 매칭
-                        if mid_id in right_data:
-                            for right_row in right_data[mid_id]:
-                                new_row = dict(row)
-                                # 중간 테이블 데이터 추가
-                                for col in middle_fieldnames:
-                                    if col != left_to_middle and col != middle_id:
-                                        new_col = col if col not in new_row else f"{col}_middle"
-                                        new_row[new_col] = middle_row.get(col, '')
-                                # 오른쪽 테이블 데이터 추가
-                                for col in right_fieldnames:
-                                    if col != actual_right_key:
-                                        new_col = col if col not in new_row else f"{col}_right"
-                                        new_row[new_col] = right_row.get(col, '')
-                                joined_rows.append(new_row)
-                                matched_count += 1
-                        else:
-                            # 중간은 있지만 오른쪽이 없음
-                            if join_type in ['left', 'full']:
-                                new_row = dict(row)
-                                for col in middle_fieldnames:
-                                    if col != left_to_middle and col != middle_id:
-                                        new_col = col if col not in new_row else f"{col}_middle"
-                                        new_row[new_col] = middle_row.get(col, '')
-                                for col in right_fieldnames:
-                                    if col != actual_right_key:
-                                        new_col = col if col not in new_row else f"{col}_right"
-                                        new_row[new_col] = ''
-                                joined_rows.append(new_row)
-                                left_only_count += 1
-                else:
-                    # 왼쪽에만 있음
-                    if join_type in ['left', 'full']:
-                        new_row = dict(row)
-                        for col in middle_fieldnames:
-                            if col != left_to_middle and col != middle_id:
-                                new_col = col if col not in new_row else f"{col}_middle"
-                                new_row[new_col] = ''
-                        for col in right_fieldnames:
-                            if col != actual_right_key:
-                                new_col = col if col not in new_row else f"{col}_right"
-                                new_row[new_col] = ''
-                        joined_rows.append(new_row)
-                        left_only_count += 1
-        
-        # RIGHT JOIN 또는 FULL JOIN 처리
-        if join_type in ['right', 'full']:
-            matched_left_keys = set()
-            matched_middle_ids = set()
-            
-            with open(left_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    key = row.get(left_key, '').strip()
-                    if key and key in middle_data:
-                        for mid_id, _ in middle_data[key]:
-                            matched_left_keys.add(key)
-                            matched_middle_ids.add(mid_id)
-            
-            for mid_id, right_rows in right_data.items():
-                if mid_id not in matched_middle_ids:
-                    for right_row in right_rows:
-                        new_row = {}
-                        for col in left_fieldnames:
-                            new_row[col] = ''
-                        for col in middle_fieldnames:
-                            if col != left_to_middle and col != middle_id:
-                                new_col = col if col not in new_row else f"{col}_middle"
-                                new_row[new_col] = ''
-                        for col in right_fieldnames:
-                            if col != actual_right_key:
-                                new_col = col if col not in new_row else f"{col}_right"
-                                new_row[new_col] = right_row.get(col, '')
-                        joined_rows.append(new_row)
-                        right_only_count += 1
-        
-        # 결과 저장
-        with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-            writer = csv.DictWriter(outfile, fieldnames=output_fieldnames)
-            writer.writeheader()
-            writer.writerows(joined_rows)
+                # Id 컬럼이 없는 중간 테이블은 외래 키 그래프와 같은 규칙으로 추론 (예: definitions.definition_id)
+                inferred = infer_middle_keys(left_table_name, left_columns, left_key,
+                                             get_input_table_name(middle_file), middle_fieldnames,
+                                             right_table_name, right_columns, right_key)
+                if inferred:
+                    path_keys = (inferred[0], inferred[1], inferred[1])
+        if path_keys:
+            left_to_middle, middle_id, middle_to_right = path_keys
+        if not left_to_middle or not middle_id:
+            print(f"오류: 중간 테이블에서 조인 키를 찾을 수 없습니다.")
+            sys.exit(1)
         
-        print(f"\n조인 완료! (간접 조인)")
-        print(f"  왼쪽 파일: {left_file}")
-        print(f"  중간 파일: {middle_file}")
-        print(f"  오른쪽 파일: {right_file}")
-        print(f"  조인 경로: {left_key} -> {left_to_middle} -> {middle_id} -> {middle_to_right}")
-        print(f"  조인 타입: {join_type}")
-        print(f"  출력 파일: {output_file}")
-        print(f"\n통계:")
-        print(f"  총 조인된 행: {len(joined_rows)}개")
-        print(f"  매칭된 행: {matched_count}개")
-        if join_type in ['left', 'full']:
-            print(f"  왼쪽에만 있는 행: {left_only_count}개")
-        if join_type in ['right', 'full']:
-            print(f"  오른쪽에만 있는 행: {right_only_count}개")
+        # right_key가 실제로는 middle_to_right를 참조 (외래 키 그래프에서 찾은 경로는 right_key 그대로)
+        if path_keys:
+            actual_right_key = right_key
+        else:
+            actual_right_key = middle_to_right if middle_to_right in right_columns else right_key
+        if actual_right_key not in right_columns:
+            print(f"오류: '{right_file}'에 '{actual_right_key}' 컬럼이 없습니다.")
+            print(f"사용 가능한 컬럼: {', '.join(right_columns)}")
+            sys.exit(1)
         
-        return
+        spec.update({
+            'middle_file': middle_file,
+            'middle_fieldnames': middle_fieldnames,
+            'left_to_middle': left_to_middle,
+            'middle_id': middle_id,
+            'middle_to_right': middle_to_right,
+            'actual_right_key': actual_right_key,
+        })
+    elif right_key not in right_columns:
+        print(f"오류: '{right_file}'에 '{right_key}' 컬럼이 없습니다.")
+        print(f"사용 가능한 컬럼: {', '.join(right_columns)}")
+        sys.exit(1)
     
-    # 직접 조인 (기존 로직)
-    # 오른쪽 파일 읽기 (인덱스 생성)
-    right_data = {}
-    right_fieldnames = None
+    if left_key not in left_columns:
+        print(f"오류: '{left_file}'에 '{left_key}' 컬럼이 없습니다.")
+        print(f"사용 가능한 컬럼: {', '.join(left_columns)}")
+        sys.exit(1)
     
-    with open(right_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        right_fieldnames = list(reader.fieldnames)
-        
-        if right_key not in right_fieldnames:
-            print(f"오류: '{right_file}'에 '{right_key}' 컬럼이 없습니다.")
-            print(f"사용 가능한 컬럼: {', '.join(right_fieldnames)}")
-            sys.exit(1)
-        
-        for row in reader:
-            key = row.get(right_key, '').strip()
-            if key:
-                if key not in right_data:
-                    right_data[key] = []
-                right_data[key].append(row)
+    # 출력 계획 생성 (출력 컬럼명과 각 입력에서 값을 꺼낼 위치)
+    spec['left_key_index'] = left_columns.index(left_key)
+    if use_indirect:
+        spec['output_fieldnames'], spec['middle_indices'], spec['right_indices'] = get_indirect_output_plan(
+            left_columns, spec['middle_fieldnames'], right_columns,
+            spec['left_to_middle'], spec['middle_id'], spec['actual_right_key'])
+        spec['middle_key_index'] = spec['middle_fieldnames'].index(spec['left_to_middle'])
+        spec['middle_id_index'] = spec['middle_fieldnames'].index(spec['middle_id'])
+        spec['right_key_index'] = right_columns.index(spec['actual_right_key'])
+        build_files = [middle_file, right_file]
+    else:
+        spec['output_fieldnames'], spec['right_indices'] = get_direct_output_plan(
+            left_columns, right_columns, left_key, right_key, left_table_name, right_table_name)
+        spec['right_key_index'] = right_columns.index(right_key)
+        build_files = [right_file]
     
-    print(f"오른쪽 파일: {len(right_data)}개의 고유 키, {sum(len(rows) for rows in right_data.values())}개 행")
+    # 세미/안티 조인은 왼쪽 행을 그대로 출력
+    semi_join = join_type in ['semi', 'anti']
+    if semi_join:
+        spec['output_fieldnames'] = list(left_columns)
     
-    # 왼쪽 파일 읽기 및 조인
-    left_fieldnames = None
-    joined_rows = []
-    left_only_count = 0
-    right_only_count = 0
-    matched_count = 0
+    # 결과 캐시: 입력 내용과 출력을 결정하는 설정이 같으면 이전 결과를 출력 파일에 복사하고 조인 생략
+    # (조인 방식, 메모리 제한, 워커 수는 결과에 영향을 주지 않으므로 키에 넣지 않음)
+    stats = None
+    if cache:
+        if cache_dir is None:
+            cache_dir = get_default_cache_dir(output_file)
+        input_files = [left_file, middle_file, right_file] if use_indirect else [left_file, right_file]
+        cache_key = get_cache_key(cache_dir, [parse_db_input(path) or (path, '') for path in input_files], {
+            'join_type': join_type,
+            'left_key': left_key,
+            'right_key': right_key,
+            'output_fieldnames': spec['output_fieldnames'],
+            'left_key_index': spec['left_key_index'],
+            'middle_key_index': spec.get('middle_key_index'),
+            'middle_id_index': spec.get('middle_id_index'),
+            'right_key_index': spec['right_key_index'],
+            'middle_indices': spec.get('middle_indices'),
+            'right_indices': spec['right_indices'],
+        })
+        stats = use_cached_result(cache_dir, cache_key, output_file)
+        if stats is not None:
+            print(f"결과 캐시: 입력과 조인 설정이 같은 이전 결과를 사용합니다. ({cache_dir})")
     
-    with open(left_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        left_fieldnames = list(reader.fieldnames)
-        
-        if left_key not in left_fieldnames:
-            print(f"오류: '{left_file}'에 '{left_key}' 컬럼이 없습니다.")
-            print(f"사용 가능한 컬럼: {', '.join(left_fieldnames)}")
-            sys.exit(1)
-        
-        # 출력 컬럼명 생성 (중복 제거)
-        # 왼쪽 파일명에서 테이블명 추출
-        left_table_name = os.path.splitext(os.path.basename(left_file))[0]
-        right_table_name = os.path.splitext(os.path.basename(right_file))[0]
-        
-        # 왼쪽 컬럼: Id는 {파일명}Id로 변경
-        output_fieldnames = []
-        for col in left_fieldnames:
-            if col == left_key and col.lower() == 'id':
-                # Id 컬럼은 파일명Id로 변경
-                output_fieldnames.append(f"{left_table_name}Id")
+    if stats is None:
+        # 정렬 병합 조인: 입력이 조인 키로 정렬되어 있는지 먼저 확인
+        if engine == 'merge':
+            if use_indirect:
+                sorted_inputs = (
+                    is_sorted_by_keys(left_file, [spec['left_key_index']]) and
+                    is_sorted_by_keys(middle_file, [spec['middle_key_index'], spec['middle_id_index']]) and
+                    is_sorted_by_keys(right_file, [spec['right_key_index']])
+                )
             else:
-                output_fieldnames.append(col)
-        
-        # 오른쪽 컬럼 추가 (중복 제거)
-        for col in right_fieldnames:
-            if col == right_key:
-                # 키 컬럼은 제외 (이미 왼쪽에 있거나 조인 키로 사용됨)
-                continue
-            elif col.lower() == 'id':
-                # Id 컬럼은 파일명Id로 변경
-                new_col = f"{right_table_name}Id"
-                if new_col not in output_fieldnames:
-                    output_fieldnames.append(new_col)
-                # 이미 있으면 제외 (중복 제거)
+                sorted_inputs = (
+                    is_sorted_by_keys(left_file, [spec['left_key_index']]) and
+                    is_sorted_by_keys(right_file, [spec['right_key_index']])
+                )
+            if sorted_inputs:
+                print("정렬 병합 조인: 입력이 조인 키로 정렬되어 있습니다.")
             else:
-                # 중복 컬럼은 제외 (왼쪽 것만 유지)
-                if col not in output_fieldnames:
-                    output_fieldnames.append(col)
-                # 이미 있으면 제외 (중복 제거)
+                print("정보: 입력이 조인 키로 정렬되어 있지 않아 해시 조인으로 대체합니다.")
+                engine = 'hash'
+            if engine == 'merge' and workers > 1:
+                print("정보: 정렬 병합 조인은 한 번의 순방향 읽기로 수행하므로 --workers를 사용하지 않습니다.")
+        elif engine == 'sqlite' and workers > 1:
+            print("정보: SQLite 조인은 SQLite 안에서 수행하므로 --workers를 사용하지 않습니다.")
+        if engine == 'hash' and semi_join and (memory_limit is not None or workers > 1):
+            print("정보: 세미/안티 조인은 키 집합만 메모리에 올리므로 --memory-limit, --workers를 사용하지 않습니다.")
         
-        for row in reader:
-            key = row.get(left_key, '').strip()
-            
-            if not key:
-                # 키가 없으면 조인 타입에 따라 처리
-                if join_type in ['left', 'full']:
-                    # 오른쪽 컬럼은 None으로 채움
-                    new_row = dict(row)
-                    # 왼쪽의 Id를 파일명Id로 변경
-                    if left_key.lower() == 'id' and left_key in new_row:
-                        new_row[f"{left_table_name}Id"] = new_row.pop(left_key)
-                    
-                    for col in right_fieldnames:
-                        if col != right_key:
-                            if col.lower() == 'id':
-                                new_col = f"{right_table_name}Id"
-                                # 중복이면 제외 (이미 왼쪽에 있음)
-                                if new_col not in new_row:
-                                    new_row[new_col] = ''
-                            else:
-                                # 중복이면 제외 (이미 왼쪽에 있음)
-                                if col not in new_row:
-                                    new_row[col] = ''
-                    joined_rows.append(new_row)
-                    left_only_count += 1
-                continue
+        # 조인 수행 (결과 행은 만들어지는 즉시 출력 파일에 기록)
+        with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
+            writer = csv.writer(outfile)
+            writer.writerow(spec['output_fieldnames'])
             
-            # 오른쪽에서 매칭되는 행 찾기
-            if key in right_data:
-                # 매칭됨: 조인
-                for right_row in right_data[key]:
-                    new_row = dict(row)
-                    # 왼쪽의 Id를 파일명Id로 변경
-                    if left_key.lower() == 'id' and left_key in new_row:
-                        new_row[f"{left_table_name}Id"] = new_row.pop(left_key)
-                    
-                    for col in right_fieldnames:
-                        if col != right_key:
-                            if col.lower() == 'id':
-                                # Id는 파일명Id로 변경
-                                new_col = f"{right_table_name}Id"
-                                # 중복이면 제외 (이미 왼쪽에 있음)
-                                if new_col not in new_row:
-                                    new_row[new_col] = right_row.get(col, '')
-                            else:
-                                # 중복이면 제외 (이미 왼쪽에 있음)
-                                if col not in new_row:
-                                    new_row[col] = right_row.get(col, '')
-                    joined_rows.append(new_row)
-                    matched_count += 1
+            if engine == 'sqlite':
+                # 순환 import를 피하기 위해 여기서 import
+                from join_sqlite import join_sqlite
+                
+                if memory_limit is None:
+                    stats = join_sqlite(spec, writer)
+                else:
+                    # 메모리 제한이 있으면 입력을 출력 파일 옆의 임시 데이터베이스 파일에 불러옴
+                    print(f"메모리 제한: {memory_limit}바이트 -> 임시 데이터베이스 파일에서 조인합니다.")
+                    temp_parent = os.path.dirname(os.path.abspath(output_file))
+                    with tempfile.TemporaryDirectory(prefix='join_csv_', dir=temp_parent) as temp_dir:
+                        stats = join_sqlite(spec, writer, os.path.join(temp_dir, 'join.db'), memory_limit)
+            elif engine == 'merge':
+                if semi_join:
+                    stats = join_semi_merge(spec, writer)
+                elif use_indirect:
+                    stats = join_indirect_merge(spec, writer)
+                else:
+                    stats = join_direct_merge(spec, writer)
+            elif semi_join:
+                stats = join_semi_in_memory(spec, writer)
+            elif memory_limit is None and workers == 1:
+                if use_indirect:
+                    stats = join_indirect_in_memory(spec, writer)
+                else:
+                    stats = join_direct_in_memory(spec, writer)
             else:
-                # 매칭 안됨
-                if join_type in ['left', 'full']:
-                    # 왼쪽만 포함
-                    new_row = dict(row)
-                    # 왼쪽의 Id를 파일명Id로 변경
-                    if left_key.lower() == 'id' and left_key in new_row:
-                        new_row[f"{left_table_name}Id"] = new_row.pop(left_key)
-                    
-                    for col in right_fieldnames:
-                        if col != right_key:
-                            if col.lower() == 'id':
-                                new_col = f"{right_table_name}Id"
-                                if new_col in new_row:
-                                    new_col = f"{new_col}_right"
-                            else:
-                                new_col = col if col not in new_row else f"{col}_right"
-                            new_row[new_col] = ''
-                    joined_rows.append(new_row)
-                    left_only_count += 1
-    
-    # RIGHT JOIN 또는 FULL JOIN: 오른쪽에만 있는 행 추가
-    if join_type in ['right', 'full']:
-        matched_keys = set()
-        with open(left_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                key = row.get(left_key, '').strip()
-                if key:
-                    matched_keys.add(key)
-        
-        for key, right_rows in right_data.items():
-            if key not in matched_keys:
-                # 오른쪽에만 있는 행
-                for right_row in right_rows:
-                    new_row = {}
-                    # 왼쪽 컬럼은 빈 값으로 채움
-                    for col in left_fieldnames:
-                        if col == left_key and col.lower() == 'id':
-                            new_row[f"{left_table_name}Id"] = key
+                # 메모리 제한이나 워커 수가 있으면 버킷 파일로 나누어 조인 (임시 파일은 출력 파일 옆에 생성)
+                # 버킷은 적어도 워커 수만큼 만들어 각 워커가 하나 이상의 버킷을 맡도록 함
+                num_partitions = workers
+                if memory_limit is not None:
+                    num_partitions = max(num_partitions, get_partition_count(build_files, memory_limit))
+                    print(f"메모리 제한: {memory_limit}바이트 -> {num_partitions}개 파티션으로 나누어 조인합니다.")
+                if workers > 1:
+                    print(f"병렬 조인: {num_partitions}개 파티션을 {workers}개 프로세스에서 나누어 조인합니다.")
+                temp_parent = os.path.dirname(os.path.abspath(output_file))
+                with tempfile.TemporaryDirectory(prefix='join_csv_', dir=temp_parent) as temp_dir:
+                    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+                    try:
+                        if use_indirect:
+                            stats = join_indirect_grace(spec, writer, num_partitions, temp_dir, pool, workers)
                         else:
-                            new_row[col] = ''
-                    # 오른쪽 컬럼 추가 (중복 제거)
-                    for col in right_fieldnames:
-                        if col != right_key:
-                            if col.lower() == 'id':
-                                new_col = f"{right_table_name}Id"
-                                # 중복이면 제외 (이미 왼쪽에 있음)
-                                if new_col not in new_row:
-                                    new_row[new_col] = right_row.get(col, '')
-                            else:
-                                # 중복이면 제외 (이미 왼쪽에 있음)
-                                if col not in new_row:
-                                    new_row[col] = right_row.get(col, '')
-                    joined_rows.append(new_row)
-                    right_only_count += 1
-    
-    # 결과 저장
-    with open(output_file, 'w', encoding='utf-8', newline='') as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=output_fieldnames)
-        writer.writeheader()
-        writer.writerows(joined_rows)
-    
-    print(f"\n조인 완료!")
-    print(f"  왼쪽 파일: {left_file}")
-    print(f"  오른쪽 파일: {right_file}")
-    print(f"  조인 키: {left_key} = {right_key}")
+                            stats = join_direct_grace(spec, writer, num_partitions, temp_dir, pool, workers)
+                    finally:
+                        if pool is not None:
+                            pool.shutdown()
+        
+        if cache:
+            store_result(cache_dir, cache_key, output_file, stats, cache_size or DEFAULT_CACHE_SIZE)
+    
+    if use_indirect:
+        print(f"\n조인 완료! (간접 조인)")
+        print(f"  왼쪽 파일: {left_file}")
+        print(f"  중간 파일: {middle_file}")
+        print(f"  오른쪽 파일: {right_file}")
+        print(f"  조인 경로: {left_key} -> {spec['left_to_middle']} -> {spec['middle_id']} -> {spec['middle_to_right']}")
+    else:
+        print(f"\n조인 완료!")
+        print(f"  왼쪽 파일: {left_file}")
+        print(f"  오른쪽 파일: {right_file}")
+        print(f"  조인 키: {left_key} = {right_key}")
     print(f"  조인 타입: {join_type}")
+    print(f"  조인 방식: {engine}")
+    if workers > 1 and engine == 'hash':
+        print(f"  워커 수: {workers}")
     print(f"  출력 파일: {output_file}")
     print(f"\n통계:")
-    print(f"  총 조인된 행: {len(joined_rows)}개")
-    print(f"  매칭된 행: {matched_count}개")
-    if join_type in ['left', 'full']:
-        print(f"  왼쪽에만 있는 행: {left_only_count}개")
+    print(f"  총 조인된 행: {stats['joined']}개")
+    print(f"  매칭된 행: {stats['matched']}개")
+    if join_type in ['left', 'full', 'anti']:
+        print(f"  왼쪽에만 있는 행: {stats['left_only']}개")
     if join_type in ['right', 'full']:
-        print(f"  오른쪽에만 있는 행: {right_only_count}개")
+        print(f"  오른쪽에만 있는 행: {stats['right_only']}개")
 
 if __name__ == "__main__":
     if len(sys.argv) < 5:
-        print("사용법: python script/join_csv.py <left_file.csv> <right_file.csv> <left_key> <right_key> [middle_file.csv] [join_type] [output_file]")
+        print("사용법: python script/join_csv.py <left_file.csv> <right_file.csv> <left_key> <right_key> [middle_file.csv] [join_type] [output_file] [--memory-limit SIZE] [--engine hash|merge|sqlite] [--workers N] [--no-cache] [--cache-dir DIR] [--cache-size SIZE]")
         print("예시: python script/join_csv.py Vocabulary.csv Meaning.csv Id VocabularyId")
         print("      python script/join_csv.py Vocabulary.csv Example.csv Id MeaningId")
         print("      python script/join_csv.py Vocabulary.csv Example.csv Id MeaningId Meaning.csv")
         print("      python script/join_csv.py Vocabulary.csv Example.csv Id MeaningId Meaning.csv left output.csv")
+        print("      python script/join_csv.py words.csv examples.csv word_id definition_id definitions.csv --memory-limit 512M")
+        print("      python script/join_csv.py words.csv definitions.csv word_id word_id left --engine merge")
+        print("      python script/join_csv.py words.csv examples.csv word_id definition_id definitions.csv --workers 8")
+        print("      python script/join_csv.py data/ielts_voca_20_30.db:words data/ielts_voca_20_30.db:definitions word_id word_id --engine sqlite")
         print("\n조인 타입:")
         print("  inner: 양쪽 모두에 있는 행만 (기본값)")
         print("  left: 왼쪽 파일의 모든 행 + 오른쪽 매칭")
         print("  right: 오른쪽 파일의 모든 행 + 왼쪽 매칭")
         print("  full: 양쪽 파일의 모든 행")
+        print("  semi: 오른쪽에 매칭되는 행이 있는 왼쪽 행만 (왼쪽 컬럼만 출력)")
+        print("  anti: 오른쪽에 매칭되는 행이 없는 왼쪽 행만 (왼쪽 컬럼만 출력)")
+        print("\n옵션:")
+        print("  --memory-limit SIZE: 해시 인덱스 메모리 제한 (예: 512M, 2G)")
+        print("                       입력을 임시 버킷 파일로 나누어 조인합니다 (결과는 동일)")
+        print("  --engine hash|merge|sqlite: 조인 방식 (기본값: hash)")
+        print("                       merge: 입력이 조인 키로 정렬되어 있으면 한 번의 순방향 읽기로 조인")
+        print("                              (정렬되어 있지 않으면 해시 조인으로 대체)")
+        print("                       sqlite: 입력을 SQLite 데이터베이스에 불러와 SQL로 조인")
+        print("                               '<db 파일>:<테이블>'로 기존 데이터베이스의 테이블을 입력으로 사용 가능")
+        print("  --workers N: 해시 조인을 N개 프로세스에서 나누어 수행 (결과는 동일)")
+        print("  --no-cache: 결과 캐시를 사용하지 않고 항상 조인")
+        print("  --cache-dir DIR: 결과 캐시 디렉토리 (기본값: JOIN_CSV_CACHE_DIR 환경 변수, 없으면 출력 디렉토리의 .join_cache)")
+        print("                   입력 파일 내용, 조인 키, 조인 타입, 도구 버전이 같으면 이전 결과를 바로 사용합니다")
+        print("  --cache-size SIZE: 결과 캐시 크기 제한 (기본값: 1G, 넘으면 오래 사용하지 않은 결과부터 삭제)")
         print("\n참고: 오른쪽 파일에 직접 키가 없으면 자동으로 중간 테이블을 찾아 간접 조인합니다.")
         sys.exit(1)
     
@@ -695,22 +1612,64 @@ if __name__ == "__main__":
     left_key = sys.argv[3]
     right_key = sys.argv[4]
     
-    # 중간 파일, 조인 타입, 출력 파일 파싱
+    # 중간 파일, 조인 타입, 출력 파일, 옵션 파싱
     middle_file = None
     join_type = 'inner'
     output_file = None
+    memory_limit = None
+    engine = 'hash'
+    workers = 1
+    cache = True
+    cache_dir = None
+    cache_size = None
     
     args = sys.argv[5:]
-    for arg in args:
-        if arg in ['inner', 'left', 'right', 'full']:
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        option = arg.split('=', 1)[0]
+        if arg == '--no-cache':
+            cache = False
+        elif option in ['--memory-limit', '--engine', '--workers', '--cache-dir', '--cache-size']:
+            if '=' in arg:
+                value = arg.split('=', 1)[1]
+            else:
+                i += 1
+                value = args[i] if i < len(args) else ''
+            if option == '--memory-limit':
+                memory_limit = parse_memory_limit(value)
+                if memory_limit is None:
+                    print(f"오류: 잘못된 메모리 제한 '{value}'입니다. (예: 512M, 2G)")
+                    sys.exit(1)
+            elif option == '--workers':
+                try:
+                    workers = int(value)
+                except ValueError:
+                    workers = 0
+                if workers < 1:
+                    print(f"오류: 잘못된 워커 수 '{value}'입니다. (1 이상의 정수)")
+                    sys.exit(1)
+            elif option == '--cache-dir':
+                cache_dir = value
+            elif option == '--cache-size':
+                cache_size = parse_memory_limit(value)
+                if cache_size is None:
+                    print(f"오류: 잘못된 캐시 크기 '{value}'입니다. (예: 512M, 2G)")
+                    sys.exit(1)
+            else:
+                engine = value
+        elif arg in JOIN_TYPES:
             join_type = arg
         elif arg.endswith('.csv'):
             if middle_file is None and os.path.exists(arg):
                 middle_file = arg
             else:
                 output_file = arg
+        elif parse_db_input(arg) and middle_file is None:
+            middle_file = arg
         else:
             print(f"경고: '{arg}'는 무시됩니다.")
+        i += 1
     
-    join_csv_files(left_file, right_file, left_key, right_key, middle_file, join_type, output_file)
-
+    join_csv_files(left_file, right_file, left_key, right_key, middle_file, join_type, output_file, memory_limit, engine, workers,
+                   cache, cache_dir, cache_size)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+join_csv.py의 SQLite 조인 방식 (--engine sqlite)
+입력을 메모리(또는 임시 파일) SQLite 데이터베이스에 한 번에 불러오고 조인 키에 인덱스를 만든 뒤
+조인을 SQL로 수행한다. 출력 컬럼명(_middle, _right, {테이블명}Id)과 행 순서는 해시 조인과 같다.
+입력으로 '<db 파일>:<테이블>'을 주면 기존 데이터베이스의 테이블을 CSV로 내보내지 않고 바로 조인한다.
+
+사용법: python script/join_csv.py <left> <right> <left_key> <right_key> [middle] [join_type] [output_file] --engine sqlite
+"""
+
+import sqlite3
+from pathlib import Path
+
+from join_csv import new_join_stats, parse_db_input, read_csv_rows
+
+# CSV 파일을 불러오거나 조인 결과를 읽을 때 한 번에 처리하는 행 수
+BATCH_SIZE = 10000
+
+def load_input(conn, input_path, work_table, fieldnames, key_columns, source_alias):
+    """
+    입력(CSV 파일 또는 DB 테이블)을 작업 테이블로 불러오기
+    작업 테이블 컬럼: _seq(행 번호, 1부터), 키 컬럼들(앞뒤 공백 제거), c0, c1, ... (원래 컬럼 순서)
+    컬럼명 대신 위치로 된 컬럼명을 사용하므로 CSV 컬럼명에 어떤 문자가 있어도 된다.
+
+    Args:
+        conn: SQLite 연결
+        input_path: CSV 파일 경로 또는 '<db 파일>:<테이블>'
+        work_table: 만들 작업 테이블명
+        fieldnames: 입력의 컬럼명 리스트
+        key_columns: [(작업 테이블 키 컬럼명, 원래 컬럼 위치), ...]
+        source_alias: DB 테이블 입력일 때 db 파일을 ATTACH할 이름
+
+    Returns:
+        불러온 행 수
+    """
+    value_columns = [f"c{i}" for i in range(len(fieldnames))]
+    key_names = [name for name, _ in key_columns]
+    conn.execute(
+        f"CREATE TABLE {work_table} (_seq INTEGER PRIMARY KEY, "
+        f"{', '.join(f'{name} TEXT' for name in key_names + value_columns)})")
+    insert_columns = ', '.join(key_names + value_columns)
+
+    db_input = parse_db_input(input_path)
+    if db_input:
+        # 기존 데이터베이스의 테이블: 읽기 전용으로 ATTACH하여 SQLite 안에서 바로 복사
+        db_file, table = db_input
+        conn.execute(f"ATTACH DATABASE ? AS {source_alias}", (Path(db_file).resolve().as_uri() + '?mode=ro',))
+        key_exprs = [f"COALESCE(TRIM(CAST(\"{fieldnames[index]}\" AS TEXT)), '')" for _, index in key_columns]
+        value_exprs = [f'"{col}"' for col in fieldnames]
+        conn.execute(
+            f"INSERT INTO {work_table} ({insert_columns}) "
+            f"SELECT {', '.join(key_exprs + value_exprs)} FROM {source_alias}.\"{table}\"")
+    else:
+        # CSV 파일: 행 묶음 단위로 executemany
+        insert_sql = (f"INSERT INTO {work_table} ({insert_columns}) "
+                      f"VALUES ({', '.join('?' * (len(key_names) + len(value_columns)))})")
+        batch = []
+        for row in read_csv_rows(input_path):
+            batch.append([row[index].strip() for _, index in key_columns] + row)
+            if len(batch) >= BATCH_SIZE:
+                conn.executemany(insert_sql, batch)
+                batch = []
+        if batch:
+            conn.executemany(insert_sql, batch)
+
+    # 조인 키 인덱스는 불러온 뒤에 생성
+    for name in key_names:
+        conn.execute(f"CREATE INDEX idx_{work_table}{name} ON {work_table} ({name})")
+    return conn.execute(f"SELECT COUNT(*) FROM {work_table}").fetchone()[0]
+
+def write_query_rows(cursor, writer, stats, matched_name, unmatched_name=None):
+    """
+    조인 쿼리 결과를 출력 파일에 기록하고 통계 갱신
+    쿼리의 첫 번째 컬럼은 오른쪽 매칭 여부(1/0), 나머지는 출력 행
+
+    Args:
+        cursor: 조인 쿼리를 실행한 커서
+        writer: 출력 csv.writer
+        stats: 조인 통계 딕셔너리
+        matched_name: 매칭된 행을 셀 통계 항목
+        unmatched_name: 매칭되지 않은 행을 셀 통계 항목 (None이면 matched_name)
+    """
+    unmatched_name = unmatched_name or matched_name
+    while True:
+        rows = cursor.fetchmany(BATCH_SIZE)
+        if not rows:
+            break
+        for row in rows:
+            writer.writerow(row[1:])
+            stats[matched_name if row[0] else unmatched_name] += 1
+        stats['joined'] += len(rows)
+
+def join_sqlite(spec, writer, db_path=':memory:', memory_limit=None):
+    """
+    SQLite 조인 (직접 조인, 간접 조인 공통)
+    작업 테이블 l(왼쪽), m(중간), r(오른쪽)을 만들고 해시 조인과 같은 순서로 결과를 읽는다:
+    왼쪽 행 순서(같은 왼쪽 행 안에서는 중간, 오른쪽 행 순서) 다음에
+    RIGHT/FULL 조인의 오른쪽에만 있는 행을 키가 처음 나온 순서로 기록
+
+    Args:
+        spec: join_csv_files에서 만든 조인 설정 딕셔너리
+        writer: 출력 csv.writer
+        db_path: 작업 데이터베이스 경로 (기본값: 메모리)
+        memory_limit: 작업 데이터베이스 페이지 캐시 크기 제한 (바이트, None이면 SQLite 기본값)
+
+    Returns:
+        조인 통계 딕셔너리
+    """
+    join_type = spec['join_type']
+    use_indirect = 'middle_file' in spec
+    stats = new_join_stats()
+
+    # DB 테이블 입력을 읽기 전용 URI로 ATTACH하기 위해 uri=True
+    conn = sqlite3.connect(db_path, uri=True)
+    try:
+        # 작업 데이터베이스는 조인이 끝나면 버리므로 저널과 동기화를 끔
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        if memory_limit is not None:
+            conn.execute(f"PRAGMA cache_size = {-max(1, memory_limit // 1024)}")
+
+        left_count = load_input(conn, spec['left_file'], 'l', spec['left_fieldnames'],
+                                [('_key', spec['left_key_index'])], 'src_l')
+        if use_indirect:
+            middle_count = load_input(conn, spec['middle_file'], 'm', spec['middle_fieldnames'],
+                                      [('_key', spec['middle_key_index']), ('_id', spec['middle_id_index'])], 'src_m')
+        right_count = load_input(conn, spec['right_file'], 'r', spec['right_fieldnames'],
+                                 [('_key', spec['right_key_index'])], 'src_r')
+        conn.commit()
+        print(f"SQLite 작업 데이터베이스: 왼쪽 {left_count}개 행"
+              + (f", 중간 {middle_count}개 행" if use_indirect else "")
+              + f", 오른쪽 {right_count}개 행")
+
+        # 출력 컬럼: 왼쪽 행 전체 + 중간/오른쪽의 출력 계획 위치
+        left_columns = [f"l.c{i}" for i in range(len(spec['left_fieldnames']))]
+        middle_columns = [f"m.c{i}" for i in spec.get('middle_indices', [])]
+        right_columns = [f"r.c{i}" for i in spec['right_indices']]
+        select_columns = ', '.join(left_columns + middle_columns + right_columns)
+
+        # 세미/안티 조인: 매칭되는 행이 있는/없는 왼쪽 행만 왼쪽 컬럼 그대로 (키가 비어있으면 매칭되지 않음)
+        if join_type in ['semi', 'anti']:
+            if use_indirect:
+                exists_query = ("SELECT 1 FROM m JOIN r ON r._key = m._id "
+                                "WHERE m._key = l._key AND m._id <> ''")
+            else:
+                exists_query = "SELECT 1 FROM r WHERE r._key = l._key"
+            condition = f"l._key <> '' AND EXISTS ({exists_query})"
+            if join_type == 'anti':
+                condition = f"NOT ({condition})"
+            query = f"SELECT 1, {', '.join(left_columns)} FROM l WHERE {condition} ORDER BY l._seq"
+            write_query_rows(conn.execute(query), writer, stats,
+                             'matched' if join_type == 'semi' else 'left_only')
+            return stats
+
+        # 왼쪽 행 기준 조인 (INNER/RIGHT는 매칭된 행만, LEFT/FULL은 왼쪽 모든 행)
+        outer = join_type in ['left', 'full']
+        join_keyword = 'LEFT JOIN' if outer else 'JOIN'
+        if use_indirect:
+            query = (f"SELECT r._seq IS NOT NULL, {select_columns} FROM l "
+                     f"{join_keyword} m ON m._key = l._key AND l._key <> '' AND m._id <> '' "
+                     f"{join_keyword} r ON r._key = m._id "
+                     f"ORDER BY l._seq, m._seq, r._seq")
+        else:
+            query = (f"SELECT r._seq IS NOT NULL, {select_columns} FROM l "
+                     f"{join_keyword} r ON r._key = l._key AND l._key <> '' "
+                     f"ORDER BY l._seq, r._seq")
+        write_query_rows(conn.execute(query), writer, stats, 'matched', 'left_only')
+
+        # RIGHT JOIN 또는 FULL JOIN: 왼쪽과 연결되지 않은 오른쪽 행 (키가 처음 나온 행 순서)
+        if join_type in ['right', 'full']:
+            empty_left_columns = ["''"] * len(spec['left_fieldnames'])
+            if use_indirect:
+                matched_condition = ("SELECT 1 FROM m JOIN l ON l._key = m._key "
+                                     "WHERE m._id = r._key AND l._key <> '' AND m._id <> ''")
+            else:
+                matched_condition = "SELECT 1 FROM l WHERE l._key = r._key"
+                if spec['left_key'].lower() == 'id':
+                    # 왼쪽 키가 Id이면 ({테이블명}Id 컬럼) 조인 키 값을 채움
+                    empty_left_columns[spec['left_key_index']] = "r._key"
+            empty_middle_columns = ["''"] * len(middle_columns)
+            query = (f"SELECT 1, {', '.join(empty_left_columns + empty_middle_columns + right_columns)} FROM r "
+                     f"JOIN (SELECT _key, MIN(_seq) AS first_seq FROM r WHERE _key <> '' GROUP BY _key) AS f "
+                     f"ON f._key = r._key "
+                     f"WHERE NOT EXISTS ({matched_condition}) "
+                     f"ORDER BY f.first_seq, r._seq")
+            write_query_rows(conn.execute(query), writer, stats, 'right_only')
+    finally:
+        conn.close()
+
+    return stats
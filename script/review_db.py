@@ -31,8 +31,9 @@ def review_database(db_file):
     file_size = os.path.getsize(db_file)
     print(f"\n파일 크기: {file_size:,} bytes ({file_size / 1024:.2f} KB)")
     
-    # 모든 테이블 목록
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+    # 모든 테이블 목록 (SQLite 내부 테이블과 도구가 만든 '_' 테이블(_import_row_hashes 등) 제외)
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' "
+                   "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE '\\_%' ESCAPE '\\' ORDER BY name")
     tables = cursor.fetchall()
     
     if not tables:
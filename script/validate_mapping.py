@@ -9,6 +9,8 @@ import csv
 import sys
 import os
 
+from id_codec import encode_definition_id, encode_example_id
+
 def validate_mapping(vocabulary_file, meaning_file, example_file, output_file=None):
     """
     세 CSV 파일 간의 매핑을 검증
@@ -72,7 +74,7 @@ def validate_mapping(vocabulary_file, meaning_file, example_file, output_file=No
             # sense_no 계산 검증: sense_no = word_id * 10 + DefId
             if mean_id and word_id and def_id:
                 try:
-                    expected_mean_id = int(word_id) * 10 + int(def_id)
+                    expected_mean_id = encode_definition_id(int(word_id), int(def_id))
                     actual_mean_id = int(mean_id)
                     if actual_mean_id != expected_mean_id:
                         invalid_mean_id_calc.append({
@@ -122,7 +124,7 @@ def validate_mapping(vocabulary_file, meaning_file, example_file, output_file=No
             # ExamId 계산 검증: ExamId = sense_no * 10 + example_no
             if exam_id and mean_id and use_id:
                 try:
-                    expected_exam_id = int(mean_id) * 10 + int(use_id)
+                    expected_exam_id = encode_example_id(int(mean_id), int(use_id))
                     actual_exam_id = int(exam_id)
                     if actual_exam_id != expected_exam_id:
                         invalid_exam_id_calc.append({